@@ -0,0 +1,400 @@
+import argparse
+import json
+import os
+import queue
+import re
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from InstagramScraper import InstagramReelsScraper, DEFAULT_COOKIE_JAR
+from InstagramReelCache import ReelDetailCache
+from InstagramPageArchive import PageArchive
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+NUMERIC_SETTINGS = ('posts', 'scrolls', 'priority', 'delay')
+
+def normalize_account(entry, source="accounts"):
+    """
+    Turn a username or account dictionary into a validated account dictionary
+    
+    Args:
+        entry: Username or {"username": ..., "posts": ..., ...} dictionary
+        source (str): Where the entry came from, for error messages
+    
+    Returns:
+        dict: Account with a username and integer numeric settings
+    
+    Raises:
+        ValueError: If the username is missing or a numeric setting is not a whole number
+    """
+    account = {'username': entry} if isinstance(entry, str) else dict(entry)
+    username = str(account.get('username') or "").lstrip('@')
+    if not username:
+        raise ValueError(f"{source}: account without a username: {entry!r}")
+    account['username'] = username
+    
+    for key in NUMERIC_SETTINGS:
+        if key not in account:
+            continue
+        value = account[key]
+        if isinstance(value, bool) or not str(value).lstrip('-').isdigit():
+            raise ValueError(f"{source}: @{username} {key} must be a whole number, got {value!r}")
+        account[key] = int(value)
+    return account
+
+def load_accounts(path):
+    """
+    Read the accounts of a batch from a file
+    
+    Text files hold one account per line with optional per-account settings,
+    e.g. "bankmandiri posts=50 priority=2" ('#' starts a comment).
+    JSON files hold a list of usernames or of {"username": ..., "posts": ..., ...} objects.
+    
+    Args:
+        path (str): Path of the .txt or .json file
+    
+    Returns:
+        list: Account dictionaries with at least a username
+    
+    Raises:
+        ValueError: If an account has no username or a non-numeric posts, scrolls, priority or delay
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.lower().endswith('.json'):
+            entries = json.load(f)
+            return [normalize_account(entry, f"{path} entry {number}") for number, entry in enumerate(entries, 1)]
+        
+        accounts = []
+        for number, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            username, *settings = line.split()
+            account = {'username': username}
+            for setting in settings:
+                key, _, value = setting.partition('=')
+                account[key] = int(value) if value.isdigit() else value
+            accounts.append(normalize_account(account, f"{path} line {number}"))
+        return accounts
+
+class BatchRunner:
+    """Scrapes many accounts in priority order, reusing a small pool of logged-in browser sessions"""
+    
+    def __init__(self, accounts, output_dir="batch_output", sessions=1, headless=False, target_posts=20,
+                 max_scrolls=None, delay=3, extract_captions=True, extract_likes_dates=True, enrich_workers=1,
+                 account_delay=10, checkpoint_dir=None, detail_cache_path=None, archive_dir=None,
+                 cookie_jar=None, allow_manual_login=True, data_only=False):
+        """
+        Initialize the batch
+        
+        Args:
+            accounts (list): Usernames or account dictionaries (username, posts, scrolls, priority)
+            output_dir (str): Directory receiving one sub-directory per account and batch_index.json
+            sessions (int): Number of browser sessions scraping accounts in parallel
+            headless (bool): Run the browsers in headless mode
+            target_posts (int): Default number of reels per account
+            max_scrolls (int): Default number of scrolls per account (used instead of target_posts if set)
+            delay (int): Delay between actions in seconds
+            extract_captions (bool): Whether to extract captions
+            extract_likes_dates (bool): Whether to extract likes and dates
+            enrich_workers (int): Browser workers visiting reel pages per account
+            account_delay (float): Seconds a session pauses between two accounts
+            checkpoint_dir (str): Save progress here and resume interrupted accounts (optional)
+            detail_cache_path (str): SQLite reel detail cache shared by all sessions (optional)
+            archive_dir (str): Page archive shared by all sessions (optional)
+            cookie_jar (str): Saved login cookies restored instead of logging in (optional)
+            allow_manual_login (bool): Fall back to manual login when the saved session is invalid
+                                       (False for unattended scheduled runs)
+            data_only (bool): Block images, video, fonts and trackers in every browser
+        """
+        self.accounts = [normalize_account(account) for account in accounts]
+        self.output_dir = output_dir
+        self.sessions = max(1, sessions)
+        self.headless = headless
+        self.target_posts = target_posts
+        self.max_scrolls = max_scrolls
+        self.delay = delay
+        self.extract_captions = extract_captions
+        self.extract_likes_dates = extract_likes_dates
+        self.enrich_workers = enrich_workers
+        self.account_delay = account_delay
+        self.checkpoint_dir = checkpoint_dir
+        self.detail_cache_path = detail_cache_path
+        self.archive_dir = archive_dir
+        self.cookie_jar = cookie_jar
+        self.allow_manual_login = allow_manual_login
+        self.data_only = data_only
+        
+        self.index_path = os.path.join(output_dir, "batch_index.json")
+        self.index = {}  # username -> result of its latest run
+        self.detail_cache = None
+        self.page_archive = None
+        self._cookies = None  # Cookies of the first logged-in session, reused by the others
+        self._login_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        self._stop = threading.Event()
+    
+    def run(self, skip_done=True):
+        """
+        Scrape every account of the batch
+        
+        Args:
+            skip_done (bool): Skip accounts already marked done in an existing batch_index.json
+        
+        Returns:
+            dict: Username -> result (status, reels, output, started_at, finished_at, seconds)
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._load_index()
+        
+        # Highest priority first, then in the order given
+        jobs = queue.PriorityQueue()
+        for order, account in enumerate(self.accounts):
+            username = account['username']
+            if skip_done and self.index.get(username, {}).get('status') == 'done':
+                logger.info(f"⏭️ @{username} already done, skipping")
+                continue
+            jobs.put((-account.get('priority', 0), order, account))
+        
+        if jobs.empty():
+            logger.info("✅ Nothing to scrape")
+            return self.index
+        
+        if self.detail_cache_path:
+            self.detail_cache = ReelDetailCache(self.detail_cache_path)
+        if self.archive_dir:
+            self.page_archive = PageArchive(self.archive_dir)
+        
+        sessions = min(self.sessions, jobs.qsize())
+        logger.info(f"🚀 Batch of {jobs.qsize()} accounts on {sessions} browser session(s)")
+        pool = ThreadPoolExecutor(max_workers=sessions)
+        try:
+            for session_id in range(1, sessions + 1):
+                pool.submit(self._run_session, session_id, jobs)
+            pool.shutdown(wait=True)
+        except KeyboardInterrupt:
+            # Let the accounts in progress finish so the shared cache is not closed under them
+            logger.info("⏹️ Stopping after the accounts in progress...")
+            self.stop()
+            pool.shutdown(wait=True)
+            raise
+        finally:
+            if self.detail_cache:
+                self.detail_cache.close()
+            if self.page_archive:
+                self.page_archive.close()
+        
+        done = sum(1 for result in self.index.values() if result.get('status') == 'done')
+        logger.info(f"🏁 Batch finished: {done}/{len(self.index)} accounts done, index: {self.index_path}")
+        return self.index
+    
+    def stop(self):
+        """Stop after the accounts currently being scraped"""
+        self._stop.set()
+    
+    def _run_session(self, session_id, jobs):
+        """Scrape accounts from the queue with one browser session until the queue is empty"""
+        scraper = None
+        try:
+            while not self._stop.is_set():
+                try:
+                    _, _, account = jobs.get_nowait()
+                except queue.Empty:
+                    break
+                
+                if scraper is None or not self._session_alive(scraper):
+                    if scraper is not None:
+                        self._close_session(scraper)
+                    scraper = self._start_session(session_id)
+                    if scraper is None:
+                        self._record(account['username'], {'status': 'failed', 'error': "browser session could not start"})
+                        continue
+                
+                self._scrape_account(scraper, session_id, account)
+                
+                if self.account_delay and not jobs.empty():
+                    time.sleep(self.account_delay)
+        except Exception as e:
+            logger.error(f"❌ Session {session_id} stopped: {e}")
+        finally:
+            if scraper is not None:
+                self._close_session(scraper)
+    
+    def _start_session(self, session_id):
+        """
+        Open a browser and log it in
+        
+        The first session restores the saved session or logs in manually; later sessions reuse its cookies.
+        
+        Returns:
+            InstagramReelsScraper: The logged-in scraper, or None on failure
+        """
+        scraper = InstagramReelsScraper(headless=self.headless, cookie_jar=self.cookie_jar, data_only=self.data_only)
+        if not scraper.setup_driver():
+            logger.error(f"❌ Session {session_id}: failed to setup driver")
+            return None
+        
+        # One login at a time; once it succeeded every session reuses its cookies
+        with self._login_lock:
+            if self._cookies:
+                scraper._restore_session_cookies(self._cookies, f"{scraper.base_url}/")
+                logger.info(f"🍪 Session {session_id} reuses the existing login")
+            elif scraper.ensure_login(allow_manual=self.allow_manual_login):
+                self._cookies = scraper._get_session_cookies()
+            else:
+                logger.error(f"❌ Session {session_id}: login failed")
+                scraper.close()
+                return None
+        
+        scraper.detail_cache = self.detail_cache
+        scraper.page_archive = self.page_archive
+        logger.info(f"✅ Session {session_id} ready")
+        return scraper
+    
+    def _close_session(self, scraper):
+        """Close a session's browser, leaving the shared cache and archive open"""
+        scraper.detail_cache = None  # Owned by the batch
+        scraper.page_archive = None
+        scraper.close()
+    
+    def _session_alive(self, scraper):
+        """Check whether the session's browser still responds"""
+        try:
+            scraper.driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    def _scrape_account(self, scraper, session_id, account):
+        """Scrape one account and save its results to its own sub-directory"""
+        username = account['username']
+        started = time.monotonic()
+        result = {'status': 'running', 'session': session_id, 'started_at': datetime.now().isoformat()}
+        self._record(username, result)
+        logger.info(f"👤 Session {session_id}: scraping @{username}")
+        
+        try:
+            scrolls = account.get('scrolls', self.max_scrolls)
+            common = {
+                'delay': account.get('delay', self.delay),
+                'extract_captions': self.extract_captions,
+                'extract_likes_dates': self.extract_likes_dates,
+                'enrich_workers': self.enrich_workers,
+                'checkpoint_dir': self.checkpoint_dir,
+            }
+            if scrolls is not None:
+                reels = scraper.scrape_reels_views(username, max_scrolls=int(scrolls), **common)
+            else:
+                reels = scraper.scrape_reels_by_count(username, target_posts=int(account.get('posts', self.target_posts)), **common)
+            
+            # Tag every reel so the outputs of different accounts can be combined
+            for reel in reels:
+                reel['username'] = username
+            
+            safe_name = re.sub(r'[^A-Za-z0-9._-]', '_', username)
+            account_dir = os.path.join(self.output_dir, safe_name)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output = None
+            if reels:
+                output = scraper.save_results(reels, f"instagram_reels_data_{safe_name}_{timestamp}.json", account_dir)
+            result['timing_report'] = scraper.profiler.save_report(
+                os.path.join(account_dir, f"instagram_reels_timing_{safe_name}_{timestamp}.json"))
+            
+            result.update({
+                'status': 'done' if output else 'empty',
+                'reels': len(reels),
+                'output': output,
+            })
+        except Exception as e:
+            logger.error(f"❌ @{username} failed: {e}")
+            result.update({'status': 'failed', 'error': str(e)})
+        
+        result['finished_at'] = datetime.now().isoformat()
+        result['seconds'] = round(time.monotonic() - started, 1)
+        self._record(username, result)
+        
+        # The session's startup and login stay in its first account's report; later accounts get their own
+        scraper.profiler.reset()
+        logger.info(f"📊 @{username}: {result['status']} ({result.get('reels', 0)} reels in {result['seconds']}s)")
+    
+    def _load_index(self):
+        """Load batch_index.json from an earlier run of the same batch"""
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f).get('accounts', {})
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable batch index {self.index_path}: {e}")
+    
+    def _record(self, username, result):
+        """Store an account's result and rewrite batch_index.json atomically"""
+        with self._index_lock:
+            self.index[username] = dict(result)
+            state = {'updated_at': datetime.now().isoformat(), 'accounts': self.index}
+            tmp_path = f"{self.index_path}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, self.index_path)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to save batch index {self.index_path}: {e}")
+
+def main():
+    """Scrape a list of accounts in one batch"""
+    parser = argparse.ArgumentParser(description="Scrape Instagram reels of many accounts in one batch")
+    parser.add_argument('accounts', help="Text file (one username per line) or JSON file of accounts")
+    parser.add_argument('-o', '--output-dir', default="batch_output", help="Output directory (default: batch_output)")
+    parser.add_argument('-s', '--sessions', type=int, default=1, help="Parallel browser sessions (default: 1)")
+    parser.add_argument('--posts', type=int, default=20, help="Reels per account unless set in the file (default: 20)")
+    parser.add_argument('--scrolls', type=int, default=None, help="Scroll a fixed number of times instead of counting reels")
+    parser.add_argument('--delay', type=int, default=3, help="Delay between actions in seconds (default: 3)")
+    parser.add_argument('--account-delay', type=float, default=10, help="Pause between two accounts of a session (default: 10)")
+    parser.add_argument('--workers', type=int, default=1, help="Browsers visiting reel pages per account (default: 1)")
+    parser.add_argument('--no-captions', action='store_true', help="Skip caption extraction")
+    parser.add_argument('--no-likes-dates', action='store_true', help="Skip likes and date extraction")
+    parser.add_argument('--headless', action='store_true', help="Run the browsers without a window")
+    parser.add_argument('--rerun', action='store_true', help="Scrape accounts already marked done again")
+    parser.add_argument('--unattended', action='store_true', help="Fail instead of waiting for a manual login")
+    parser.add_argument('--cookie-jar', default=DEFAULT_COOKIE_JAR, help=f"Saved login cookies (default: {DEFAULT_COOKIE_JAR})")
+    parser.add_argument('--data-only', action='store_true', help="Block images, video, fonts and trackers")
+    args = parser.parse_args()
+    
+    try:
+        accounts = load_accounts(args.accounts)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read the accounts: {e}")
+        return
+    
+    runner = BatchRunner(
+        accounts,
+        output_dir=args.output_dir,
+        sessions=args.sessions,
+        headless=args.headless,
+        target_posts=args.posts,
+        max_scrolls=args.scrolls,
+        delay=args.delay,
+        extract_captions=not args.no_captions,
+        extract_likes_dates=not args.no_likes_dates,
+        enrich_workers=args.workers,
+        account_delay=args.account_delay,
+        checkpoint_dir=os.path.join(args.output_dir, ".checkpoints"),
+        detail_cache_path=os.path.join(args.output_dir, ".cache", "reel_details.sqlite3"),
+        cookie_jar=args.cookie_jar,
+        allow_manual_login=not args.unattended,
+        data_only=args.data_only
+    )
+    
+    try:
+        runner.run(skip_done=not args.rerun)
+    except KeyboardInterrupt:
+        print("\n⏹️ Batch interrupted, run the same command again to continue")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import json
+import os
+import re
+import threading
+import time
+import logging
+from datetime import datetime
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class ScrapeCheckpoint:
+    """On-disk job state that lets an interrupted scrape resume where it stopped"""
+    
+    def __init__(self, checkpoint_dir, username, save_interval=5.0):
+        """
+        Initialize the checkpoint for one username
+        
+        Args:
+            checkpoint_dir (str): Directory holding checkpoint files
+            username (str): Instagram username being scraped
+            save_interval (float): Minimum seconds between two throttled saves
+        """
+        self.checkpoint_dir = checkpoint_dir
+        self.username = username
+        self.save_interval = save_interval
+        
+        safe_name = re.sub(r'[^A-Za-z0-9._-]', '_', username) or "unknown"
+        self.path = os.path.join(checkpoint_dir, f"checkpoint_{safe_name}.json")
+        
+        self.reels = []             # Discovered reels in discovery order
+        self.finished_urls = set()  # Reels whose detail page has been extracted
+        self.scroll_depth = 0       # Number of scrolls reached on the reels grid
+        
+        self._lock = threading.RLock()
+        self._last_save = 0.0
+        self._dirty = False
+    
+    def load(self):
+        """
+        Load the checkpoint file if it exists
+        
+        Returns:
+            bool: True if a previous state was restored
+        """
+        if not os.path.exists(self.path):
+            return False
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable checkpoint {self.path}: {e}")
+            return False
+        
+        with self._lock:
+            self.reels = state.get('reels', [])
+            self.finished_urls = set(state.get('finished_urls', []))
+            self.scroll_depth = int(state.get('scroll_depth', 0))
+        
+        logger.info(f"♻️ Resuming @{self.username}: {len(self.reels)} reels discovered, "
+                    f"{len(self.finished_urls)} enriched, scroll depth {self.scroll_depth}")
+        return True
+    
+    def update_discovery(self, reels, scroll_depth):
+        """
+        Record the discovered reels and the scroll depth reached, then save
+        
+        Args:
+            reels (iterable): All reels discovered so far, in order
+            scroll_depth (int): Number of scrolls performed on the grid
+        """
+        with self._lock:
+            self.reels = list(reels)
+            self.scroll_depth = max(self.scroll_depth, scroll_depth)
+            self._dirty = True
+        self.save(force=True)
+    
+    def mark_finished(self, reel):
+        """Record that a reel's details were extracted (saved at most every save_interval seconds)"""
+        url = reel.get('url', '')
+        if not url:
+            return
+        
+        with self._lock:
+            self.finished_urls.add(url)
+            self._dirty = True
+        self.save()
+    
+    def is_finished(self, url):
+        """Check whether a reel's details were already extracted in a previous run"""
+        with self._lock:
+            return url in self.finished_urls
+    
+    def save(self, force=False):
+        """
+        Write the checkpoint atomically
+        
+        Args:
+            force (bool): Save even if the last save was less than save_interval seconds ago
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            if not force and time.monotonic() - self._last_save < self.save_interval:
+                return
+            
+            # Copy each reel first: enrichment workers may be updating them right now
+            state = {
+                'username': self.username,
+                'scroll_depth': self.scroll_depth,
+                'finished_urls': sorted(self.finished_urls),
+                'reels': [dict(reel) for reel in self.reels],
+                'updated_at': datetime.now().isoformat(),
+            }
+            
+            try:
+                os.makedirs(self.checkpoint_dir, exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+                
+                self._last_save = time.monotonic()
+                self._dirty = False
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to save checkpoint {self.path}: {e}")
+    
+    def clear(self):
+        """Delete the checkpoint after a completed run"""
+        with self._lock:
+            self.reels = []
+            self.finished_urls = set()
+            self.scroll_depth = 0
+            self._dirty = False
+            try:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                    logger.info(f"🧹 Checkpoint cleared: {self.path}")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to remove checkpoint {self.path}: {e}")
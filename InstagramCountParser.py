@@ -0,0 +1,63 @@
+import re
+from functools import lru_cache
+
+# Number with optional thousands commas, optional K/M/B suffix and optional trailing "like(s)"
+COUNT_PATTERN = re.compile(
+    r'^\s*(\d[\d,]*(?:\.\d*)?|\.\d+)\s*([KMB])?\s*(?:likes?)?\s*$',
+    re.IGNORECASE
+)
+
+COUNT_MULTIPLIERS = {
+    None: 1,
+    'K': 1000,
+    'M': 1000000,
+    'B': 1000000000,
+}
+
+@lru_cache(maxsize=4096)
+def _parse_count_text(text):
+    """Parse one count string (memoized, the same display strings recur constantly)"""
+    match = COUNT_PATTERN.match(text)
+    if not match:
+        return 0
+    
+    number, suffix = match.groups()
+    try:
+        value = float(number.replace(',', ''))
+    except ValueError:
+        return 0
+    return value * COUNT_MULTIPLIERS[suffix.upper() if suffix else None]
+
+def parse_count(value):
+    """
+    Convert a displayed count such as "1.2K", "3,400", "2M" or "45.6K likes" to a number
+    
+    Args:
+        value: Count string (numbers are returned as they are)
+    
+    Returns:
+        float: The count, or 0 if the value is missing or not a count
+    """
+    if isinstance(value, bool) or value is None:
+        return 0
+    if isinstance(value, (int, float)):
+        return float(value) if value == value else 0  # NaN counts as missing
+    if not isinstance(value, str) or not value or value == 'N/A':
+        return 0
+    return _parse_count_text(value)
+
+def parse_counts(values):
+    """
+    Convert many displayed counts at once
+    
+    Args:
+        values (iterable): Count strings
+    
+    Returns:
+        list: Parsed counts in the same order
+    """
+    return [parse_count(value) for value in values]
+
+def parse_cache_info():
+    """Return the hit/miss statistics of the parse memo"""
+    return _parse_count_text.cache_info()
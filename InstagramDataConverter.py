@@ -1,30 +1,130 @@
 import json
+import numpy as np
 import pandas as pd
 import os
 import glob
-import re  # Add this line
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+from InstagramCountParser import parse_count, parse_counts
 from datetime import datetime
+from itertools import islice
 import logging
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None  # Parquet/Feather export is optional
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Output column -> (source record key, value used when the key is missing)
+RECORD_COLUMNS = [
+    ('Reel_Index', 'reel_index', ''),
+    ('Views_Raw', 'views', 'N/A'),
+    ('Likes_Raw', 'likes', 'N/A'),
+    ('Post_Date', 'post_date', 'N/A'),
+    ('Post_Date_Raw', 'post_date_raw', 'N/A'),
+    ('URL', 'url', 'N/A'),
+    ('Caption', 'caption', ''),
+    ('Timestamp_Scraped', 'timestamp', ''),
+    ('Selector_Used', 'selector_used', ''),
+]
+
+# Excel sheet limits and streaming chunk size
+EXCEL_MAX_ROWS = 1048576
+EXCEL_CHUNK_ROWS = 10000
+
+# Columnar export format -> file extension
+COLUMNAR_FORMATS = {'parquet': '.parquet', 'feather': '.feather'}
+COLUMNAR_CHUNK_ROWS = 50000  # Rows per Parquet row group / Feather record batch
+COLUMNAR_DICTIONARY_COLUMNS = ('Username', 'Selector_Used')
+
+# Profile name in reel URLs such as https://www.instagram.com/<user>/reel/<shortcode>/
+URL_USERNAME_PATTERN = r'^[a-z]+://[^/]+/([^/?#]+)/reels?/'
+
+def columnar_schema():
+    """Arrow schema of Parquet/Feather exports: the Excel columns with real types"""
+    text_dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ('Reel_Index', pa.int64()),
+        ('Username', text_dictionary),
+        ('Views_Raw', pa.string()),
+        ('Views_Numeric', pa.int64()),
+        ('Likes_Raw', pa.string()),
+        ('Likes_Numeric', pa.int64()),
+        ('Post_Date', pa.date32()),
+        ('Posted_At', pa.timestamp('us', tz='UTC')),
+        ('Post_Date_Raw', pa.string()),
+        ('URL', pa.string()),
+        ('Caption', pa.string()),
+        ('Timestamp_Scraped', pa.timestamp('us')),
+        ('Selector_Used', text_dictionary),
+        ('Position_Row', pa.int64()),
+        ('Position_Col', pa.int64()),
+    ])
+
+class RunningDictionary:
+    """
+    Dictionary encoding shared by all chunks of one export
+    
+    The dictionary only ever grows, so each record batch's dictionary extends the
+    previous one; Feather files can then store just the new values (deltas).
+    """
+    
+    def __init__(self):
+        """Start with an empty dictionary"""
+        self.values = []
+        self.codes = {}
+    
+    def encode(self, series):
+        """
+        Dictionary-encode a column chunk
+        
+        Args:
+            series (pandas.Series): Strings, None for missing values
+            
+        Returns:
+            pyarrow.DictionaryArray: Codes into every value seen so far
+        """
+        for value in pd.unique(series.dropna()):
+            if value not in self.codes:
+                self.codes[value] = len(self.values)
+                self.values.append(value)
+        
+        codes = pa.array(series.map(self.codes), type=pa.int32(), from_pandas=True)
+        return pa.DictionaryArray.from_arrays(codes, pa.array(self.values, type=pa.string()))
+
 class InstagramDataConverter:
     def __init__(self):
         """Initialize the Instagram data converter"""
         pass
     
-    def load_json_data(self, json_file_path):
+    def load_json_data(self, json_file_path, lazy=False):
         """
         Load JSON data from file
         
+        Both the regular JSON array format and the streaming JSONL format
+        (one reel per line, written while scraping) are supported.
+        
         Args:
-            json_file_path (str): Path to the JSON file
+            json_file_path (str): Path to the JSON or JSONL file
+            lazy (bool): For JSONL files, return an iterator that reads records on demand
             
         Returns:
-            list: List of dictionaries containing Instagram data
+            list: List of dictionaries containing Instagram data (an iterator when lazy)
         """
+        if self.is_jsonl_file(json_file_path):
+            records = self.iter_jsonl_records(json_file_path)
+            if lazy:
+                logger.info(f"📖 Streaming records from {json_file_path}")
+                return records
+            data = list(records)
+            logger.info(f"✅ Successfully loaded {len(data)} records from {json_file_path}")
+            return data
+        
         try:
             with open(json_file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -34,105 +134,121 @@ class InstagramDataConverter:
             logger.error(f"❌ Failed to load JSON file: {e}")
             return []
     
-    def convert_views_to_numeric(self, view_str):
-        """Convert view count string to numeric value"""
-        if not view_str or view_str == 'N/A':
-            return 0
+    def is_jsonl_file(self, file_path):
+        """Check whether a file uses the streaming JSONL format"""
+        return file_path.lower().endswith(('.jsonl', '.ndjson'))
+    
+    def iter_jsonl_records(self, jsonl_file_path):
+        """
+        Lazily read records from a JSONL file
+        
+        Blank lines are skipped. A line that is not valid JSON (for example a
+        half-written last line after a crash) is logged and skipped.
         
+        Args:
+            jsonl_file_path (str): Path to the JSONL file
+            
+        Yields:
+            dict: One Instagram reel record per line
+        """
         try:
-            # Remove any whitespace
-            view_str = str(view_str).strip()
-            
-            # Handle K, M, B notation
-            if 'K' in view_str:
-                return float(view_str.replace('K', '').replace(',', '')) * 1000
-            elif 'M' in view_str:
-                return float(view_str.replace('M', '').replace(',', '')) * 1000000
-            elif 'B' in view_str:
-                return float(view_str.replace('B', '').replace(',', '')) * 1000000000
-            else:
-                # Handle comma-separated numbers
-                return float(view_str.replace(',', ''))
-        except:
-            return 0
+            with open(jsonl_file_path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"⚠️ Skipping invalid line {line_number} in {jsonl_file_path}: {e}")
+        except Exception as e:
+            logger.error(f"❌ Failed to read JSONL file: {e}")
+    
+    def convert_views_to_numeric(self, view_str):
+        """Convert view count string to numeric value"""
+        return parse_count(view_str)
     
     def convert_likes_to_numeric(self, likes_str):
         """Convert likes count string to numeric value"""
-        if not likes_str or likes_str == 'N/A':
-            return 0
+        return parse_count(likes_str)
+    
+    def parse_count_column(self, values):
+        """
+        Convert a whole column of count strings to numbers
         
-        try:
-            # Remove any whitespace and "likes" text
-            likes_str = str(likes_str).strip()
-            
-            # Remove "likes" word if present (case insensitive)
-            likes_str = re.sub(r'\s*likes?\s*$', '', likes_str, flags=re.IGNORECASE).strip()
-            
-            # Handle K, M, B notation
-            if 'K' in likes_str.upper():
-                return float(likes_str.upper().replace('K', '').replace(',', '')) * 1000
-            elif 'M' in likes_str.upper():
-                return float(likes_str.upper().replace('M', '').replace(',', '')) * 1000000
-            elif 'B' in likes_str.upper():
-                return float(likes_str.upper().replace('B', '').replace(',', '')) * 1000000000
-            else:
-                # Handle comma-separated numbers
-                return float(likes_str.replace(',', ''))
-        except:
-            return 0
+        Archives repeat the same few thousand count strings, so each distinct string
+        is parsed once and the results are spread back over the rows with NumPy.
+        
+        Args:
+            values (pandas.Series): Raw counts such as "1.2K", "12,345" or "3M likes"
+            
+        Returns:
+            pandas.Series: Float counts, 0 where a value is missing or unparsable
+        """
+        codes, uniques = pd.factorize(values.astype(object), use_na_sentinel=True)
+        
+        # Code -1 marks missing values
+        parsed = np.array(parse_counts(uniques) + [0.0], dtype=float)
+        return pd.Series(parsed[codes], index=values.index)
     
     def process_data(self, data):
         """
         Process and clean the Instagram data
         
         Args:
-            data (list): Raw Instagram data
+            data (iterable): Raw Instagram data (a list or a lazy record iterator)
             
         Returns:
             pandas.DataFrame: Processed data as DataFrame
         """
-        processed_data = []
-        
+        df = self._build_frame(data)
+        logger.info(f"✅ Processed {len(df)} records successfully")
+        return df
+    
+    def _build_frame(self, data):
+        """Build the output DataFrame of process_data from raw records"""
+        records = []
         for item in data:
-            try:
-                # Extract basic information
-                processed_item = {
-                    'Reel_Index': item.get('reel_index', ''),
-                    'Views_Raw': item.get('views', 'N/A'),
-                    'Views_Numeric': self.convert_views_to_numeric(item.get('views', 'N/A')),
-                    'Likes_Raw': item.get('likes', 'N/A'),
-                    'Likes_Numeric': self.convert_likes_to_numeric(item.get('likes', 'N/A')),
-                    'Post_Date': item.get('post_date', 'N/A'),
-                    'Post_Date_Raw': item.get('post_date_raw', 'N/A'),
-                    'URL': item.get('url', 'N/A'),
-                    'Caption': item.get('caption', ''),
-                    'Timestamp_Scraped': item.get('timestamp', ''),
-                    'Selector_Used': item.get('selector_used', ''),
-                }
-                
-                # Extract position data if available
-                position = item.get('position', {})
-                if position:
-                    processed_item['Position_Row'] = position.get('row', 0)
-                    processed_item['Position_Col'] = position.get('col', 0)
-                else:
-                    processed_item['Position_Row'] = 0
-                    processed_item['Position_Col'] = 0
-                
-                processed_data.append(processed_item)
-                
-            except Exception as e:
-                logger.warning(f"⚠️ Error processing item: {e}")
-                continue
-        
-        # Create DataFrame
-        df = pd.DataFrame(processed_data)
+            if isinstance(item, dict):
+                records.append(item)
+            else:
+                logger.warning(f"⚠️ Error processing item: not a record ({type(item).__name__})")
+        
+        # Build the frame straight from the records and parse whole columns at once
+        raw = pd.DataFrame.from_records(records) if records else pd.DataFrame()
+        
+        def column(key, default):
+            if key not in raw.columns:
+                return pd.Series(default, index=raw.index, dtype=object)
+            return raw[key].astype(object).where(raw[key].notna(), default)
+        
+        df = pd.DataFrame(index=raw.index)
+        for name, key, default in RECORD_COLUMNS:
+            df[name] = column(key, default)
+        
+        # Batch runs tag every reel with its account
+        if 'username' in raw.columns:
+            df.insert(1, 'Username', column('username', 'N/A'))
+        
+        df.insert(df.columns.get_loc('Views_Raw') + 1, 'Views_Numeric',
+                  self.parse_count_column(df['Views_Raw']))
+        df.insert(df.columns.get_loc('Likes_Raw') + 1, 'Likes_Numeric',
+                  self.parse_count_column(df['Likes_Raw']))
+        
+        # Extract position data if available
+        position = column('position', None)
+        for name, key in (('Position_Row', 'row'), ('Position_Col', 'col')):
+            values = position.str.get(key).fillna(0).infer_objects() if len(position) else pd.Series(dtype=object)
+            if values.dtype.kind == 'f' and (values % 1 == 0).all():
+                values = values.astype('int64')  # Grid positions are whole numbers
+            df[name] = values
+        
+        df = df.infer_objects()
         
         # Sort by reel index
         if 'Reel_Index' in df.columns:
             df = df.sort_values('Reel_Index').reset_index(drop=True)
         
-        logger.info(f"✅ Processed {len(df)} records successfully")
         return df
     
     def save_to_excel(self, df, filename=None, output_dir=None):
@@ -161,74 +277,41 @@ class InstagramDataConverter:
             filepath = filename
         
         try:
-            # Create Excel writer with formatting
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-                # Write main data
-                df.to_excel(writer, sheet_name='Instagram_Reels_Data', index=False)
-                
-                # Get workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Instagram_Reels_Data']
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    # Set column width (max 50 characters)
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-                # Create summary sheet
-                summary_data = {
-                    'Metric': [
-                        'Total Reels',
-                        'Total Views',
-                        'Total Likes',
-                        'Average Views per Reel',
-                        'Average Likes per Reel',
-                        'Max Views',
-                        'Max Likes',
-                        'Scraped At'
-                    ],
-                    'Value': [
-                        len(df),
-                        df['Views_Numeric'].sum(),
-                        df['Likes_Numeric'].sum(),
-                        df['Views_Numeric'].mean(),
-                        df['Likes_Numeric'].mean(),
-                        df['Views_Numeric'].max(),
-                        df['Likes_Numeric'].max(),
-                        datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    ]
-                }
-                
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Auto-adjust summary sheet columns
-                summary_worksheet = writer.sheets['Summary']
-                for column in summary_worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 30)
-                    summary_worksheet.column_dimensions[column_letter].width = adjusted_width
-            
+            if len(df) + 1 > EXCEL_MAX_ROWS:
+                raise ValueError(f"{len(df)} rows do not fit in an Excel sheet ({EXCEL_MAX_ROWS - 1} max)")
+            
+            # Write-only workbooks stream rows to disk instead of keeping every cell in memory
+            workbook = Workbook(write_only=True)
+            self._write_excel_sheet(workbook, 'Instagram_Reels_Data', df, max_width=50)
+            
+            # Create summary sheet
+            summary_data = {
+                'Metric': [
+                    'Total Reels',
+                    'Total Views',
+                    'Total Likes',
+                    'Average Views per Reel',
+                    'Average Likes per Reel',
+                    'Max Views',
+                    'Max Likes',
+                    'Scraped At'
+                ],
+                'Value': [
+                    len(df),
+                    df['Views_Numeric'].sum(),
+                    df['Likes_Numeric'].sum(),
+                    df['Views_Numeric'].mean(),
+                    df['Likes_Numeric'].mean(),
+                    df['Views_Numeric'].max(),
+                    df['Likes_Numeric'].max(),
+                    datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                ]
+            }
+            
+            summary_df = pd.DataFrame(summary_data)
+            self._write_excel_sheet(workbook, 'Summary', summary_df, max_width=30)
+            
+            workbook.save(filepath)
             logger.info(f"📊 Excel file saved: {filepath}")
             return filepath
             
@@ -236,6 +319,58 @@ class InstagramDataConverter:
             logger.error(f"❌ Failed to save Excel file: {e}")
             return None
     
+    def excel_column_widths(self, df, max_width=50):
+        """
+        Compute auto-fit Excel column widths from a DataFrame
+        
+        Each column is measured as a whole with str.len() instead of cell by cell,
+        so widths are known before any row is written.
+        
+        Args:
+            df (pandas.DataFrame): Data to measure
+            max_width (int): Widest allowed column
+            
+        Returns:
+            list: One width per column (longest value or header + 2, capped at max_width)
+        """
+        widths = []
+        for name in df.columns:
+            values = df[name].dropna()
+            longest = len(str(name))
+            if len(values):
+                if values.dtype == object:
+                    longest = max(longest, int(values.astype(str).str.len().max()))
+                else:
+                    # Numbers repeat a lot; measuring the distinct ones is enough
+                    longest = max(longest, int(pd.Series(values.unique()).astype(str).str.len().max()))
+            widths.append(min(longest + 2, max_width))
+        return widths
+    
+    def _write_excel_sheet(self, workbook, title, df, max_width):
+        """
+        Stream a DataFrame into a new sheet of a write-only workbook
+        
+        Args:
+            workbook (openpyxl.Workbook): Workbook opened with write_only=True
+            title (str): Sheet name
+            df (pandas.DataFrame): Data to write
+            max_width (int): Widest allowed column
+        """
+        worksheet = workbook.create_sheet(title)
+        
+        # Column widths must be set before the first row is streamed out
+        for idx, width in enumerate(self.excel_column_widths(df, max_width), 1):
+            worksheet.column_dimensions[get_column_letter(idx)].width = width
+        
+        worksheet.append([str(name) for name in df.columns])
+        
+        # Convert one chunk at a time so only a chunk of Python row objects exists at once
+        for start in range(0, len(df), EXCEL_CHUNK_ROWS):
+            chunk = df.iloc[start:start + EXCEL_CHUNK_ROWS].astype(object)
+            chunk = chunk.where(chunk.notna(), None)
+            for row in chunk.itertuples(index=False, name=None):
+                worksheet.append(row)
+    
     def save_to_csv(self, df, filename=None, output_dir=None):
         """
         Save DataFrame to CSV file
@@ -269,6 +404,146 @@ class InstagramDataConverter:
             logger.error(f"❌ Failed to save CSV file: {e}")
             return None
     
+    def save_to_columnar(self, data, filename=None, output_dir=None, file_format='parquet'):
+        """
+        Save data to a typed, columnar Parquet or Feather file
+        
+        The file is written in chunks of COLUMNAR_CHUNK_ROWS rows (one Parquet row group
+        or Feather record batch each), so raw records are converted as they stream in
+        and never all held as one DataFrame. Records keep their input order.
+        
+        Args:
+            data: Processed DataFrame, or an iterable of raw records (e.g. a lazy JSONL reader)
+            filename (str): Output filename (optional)
+            output_dir (str): Output directory (optional)
+            file_format (str): 'parquet' or 'feather'
+            
+        Returns:
+            str: Path to the created file, or None on failure
+        """
+        if pa is None:
+            logger.error("❌ Parquet/Feather export needs pyarrow (pip install pyarrow)")
+            return None
+        if file_format not in COLUMNAR_FORMATS:
+            logger.error(f"❌ Unknown columnar format: {file_format}")
+            return None
+        
+        extension = COLUMNAR_FORMATS[file_format]
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"instagram_reels_data_{timestamp}{extension}"
+        
+        # Ensure extension
+        if not filename.endswith(extension):
+            filename = f"{filename}{extension}"
+        
+        # Use provided output directory or current directory
+        if output_dir:
+            # Ensure directory exists
+            os.makedirs(output_dir, exist_ok=True)
+            filepath = os.path.join(output_dir, filename)
+        else:
+            filepath = filename
+        
+        # Readers re-loading the file never see a half-written one
+        temp_path = f"{filepath}.tmp"
+        try:
+            schema = columnar_schema()
+            dictionaries = {name: RunningDictionary() for name in COLUMNAR_DICTIONARY_COLUMNS}
+            if file_format == 'parquet':
+                writer = pq.ParquetWriter(temp_path, schema, compression='zstd')
+            else:
+                options = pa.ipc.IpcWriteOptions(compression='lz4', emit_dictionary_deltas=True)
+                writer = pa.ipc.new_file(temp_path, schema, options=options)
+            
+            rows = chunks = 0
+            with writer:
+                for chunk in self._columnar_chunks(data):
+                    writer.write_table(self.columnar_table(chunk, dictionaries))
+                    rows += len(chunk)
+                    chunks += 1
+            
+            if not rows:
+                raise ValueError("no records to write")
+            
+            os.replace(temp_path, filepath)
+            logger.info(f"🧱 {file_format.title()} file saved: {filepath} ({rows} rows in {chunks} chunks)")
+            return filepath
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to save {file_format.title()} file: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+    
+    def _columnar_chunks(self, data):
+        """Yield processed DataFrames of at most COLUMNAR_CHUNK_ROWS rows"""
+        if isinstance(data, pd.DataFrame):
+            for start in range(0, len(data), COLUMNAR_CHUNK_ROWS):
+                yield data.iloc[start:start + COLUMNAR_CHUNK_ROWS]
+            return
+        
+        records = iter(data)
+        while True:
+            chunk = list(islice(records, COLUMNAR_CHUNK_ROWS))
+            if not chunk:
+                return
+            yield self._build_frame(chunk)
+    
+    def columnar_table(self, df, dictionaries):
+        """
+        Convert processed rows to an Arrow table with the columnar schema
+        
+        Counts become integers (null where Instagram showed none), post dates real
+        dates, ISO post times and scrape times timestamps, and usernames and selectors
+        dictionary-encoded.
+        
+        Args:
+            df (pandas.DataFrame): Rows as returned by process_data
+            dictionaries (dict): Column name -> RunningDictionary shared by the export
+            
+        Returns:
+            pyarrow.Table: The rows in the columnar schema
+        """
+        def text(name):
+            return pa.array(df[name].astype(object), type=pa.string(), from_pandas=True)
+        
+        def count(raw, numeric):
+            missing = (raw.isna() | raw.isin(['N/A', ''])).to_numpy()
+            return pa.array(numeric.round().to_numpy(dtype='int64'), type=pa.int64(), mask=missing)
+        
+        def integer(values):
+            return pa.array(pd.to_numeric(values, errors='coerce'), type=pa.float64(), from_pandas=True).cast(pa.int64())
+        
+        def timestamps(values, arrow_type, **kwargs):
+            parsed = pd.to_datetime(values.where(values != 'N/A'), errors='coerce', **kwargs)
+            return pa.array(parsed, from_pandas=True).cast(arrow_type, safe=False)
+        
+        # Usernames come from batch records or else from the profile part of the URL
+        usernames = df['URL'].astype(str).str.extract(URL_USERNAME_PATTERN, expand=False)
+        if 'Username' in df.columns:
+            usernames = df['Username'].where(~df['Username'].isin(['N/A', ''])).fillna(usernames)
+        
+        columns = {
+            'Reel_Index': integer(df['Reel_Index']),
+            'Username': dictionaries['Username'].encode(usernames.astype(object)),
+            'Views_Raw': text('Views_Raw'),
+            'Views_Numeric': count(df['Views_Raw'], df['Views_Numeric']),
+            'Likes_Raw': text('Likes_Raw'),
+            'Likes_Numeric': count(df['Likes_Raw'], df['Likes_Numeric']),
+            'Post_Date': timestamps(df['Post_Date'], pa.date32(), format='%d %B %Y'),
+            'Posted_At': timestamps(df['Post_Date_Raw'], pa.timestamp('us', tz='UTC'), format='ISO8601', utc=True),
+            'Post_Date_Raw': text('Post_Date_Raw'),
+            'URL': text('URL'),
+            'Caption': text('Caption'),
+            # Merged outputs may mix naive and offset scrape times; offsets are converted to naive UTC
+            'Timestamp_Scraped': timestamps(df['Timestamp_Scraped'], pa.timestamp('us'), format='ISO8601', utc=True),
+            'Selector_Used': dictionaries['Selector_Used'].encode(df['Selector_Used'].where(df['Selector_Used'] != '').astype(object)),
+            'Position_Row': integer(df['Position_Row']),
+            'Position_Col': integer(df['Position_Col']),
+        }
+        return pa.Table.from_pydict(columns, schema=columnar_schema())
+    
     def find_latest_json_file(self, directory="."):
         """
         Find the latest JSON file in the specified directory
@@ -280,9 +555,10 @@ class InstagramDataConverter:
             str: Path to the latest JSON file
         """
         try:
-            # Look for Instagram JSON files
-            pattern = os.path.join(directory, "instagram_reels_data_*.json")
-            json_files = glob.glob(pattern)
+            # Look for Instagram JSON and streamed JSONL files
+            json_files = []
+            for pattern in ("instagram_reels_data_*.json", "instagram_reels_data_*.jsonl"):
+                json_files.extend(glob.glob(os.path.join(directory, pattern)))
             
             if not json_files:
                 logger.warning("⚠️ No Instagram JSON files found")
@@ -297,16 +573,18 @@ class InstagramDataConverter:
             logger.error(f"❌ Error finding JSON files: {e}")
             return None
     
-    def convert_json_to_excel_csv(self, json_file_path=None, output_excel=True, output_csv=True, output_dir=None, custom_filename=None):
+    def convert_json_to_excel_csv(self, json_file_path=None, output_excel=True, output_csv=True, output_dir=None, custom_filename=None,
+                                  columnar_format=None):
         """
         Main conversion function
         
         Args:
-            json_file_path (str): Path to JSON file (if None, finds latest)
+            json_file_path (str): Path to JSON or JSONL file (if None, finds latest)
             output_excel (bool): Whether to create Excel file
             output_csv (bool): Whether to create CSV file
             output_dir (str): Output directory (optional)
             custom_filename (str): Custom filename without extension (optional)
+            columnar_format (str): Also create a 'parquet' or 'feather' file (None = no)
             
         Returns:
             dict: Dictionary with paths to created files
@@ -319,17 +597,19 @@ class InstagramDataConverter:
                     logger.error("❌ No JSON file found")
                     return None
             
-            # Load and process data
-            raw_data = self.load_json_data(json_file_path)
-            if not raw_data:
+            # Load and process data (JSONL files are read lazily)
+            raw_data = self.load_json_data(json_file_path, lazy=True)
+            if isinstance(raw_data, list) and not raw_data:
                 logger.error("❌ No data loaded from JSON file")
                 return None
             
-            # Process data
-            df = self.process_data(raw_data)
-            if df.empty:
-                logger.error("❌ No data to convert")
-                return None
+            # A columnar file alone can be written while the records stream in
+            df = None
+            if output_excel or output_csv or not columnar_format:
+                df = self.process_data(raw_data)
+                if df.empty:
+                    logger.error("❌ No data to convert")
+                    return None
             
             # Generate base filename
             if custom_filename:
@@ -353,13 +633,20 @@ class InstagramDataConverter:
                 if csv_path:
                     results['csv'] = csv_path
             
+            # Save to Parquet/Feather
+            if columnar_format:
+                columnar_path = self.save_to_columnar(raw_data if df is None else df, base_name, output_dir, columnar_format)
+                if columnar_path:
+                    results[columnar_format] = columnar_path
+            
             # Print summary
             output_location = output_dir if output_dir else "current directory"
             logger.info(f"\n📊 Conversion Summary:")
             logger.info(f"   📁 Source JSON: {json_file_path}")
-            logger.info(f"   📊 Total Reels: {len(df)}")
-            logger.info(f"   👁️ Total Views: {df['Views_Numeric'].sum():,.0f}")
-            logger.info(f"   👍 Total Likes: {df['Likes_Numeric'].sum():,.0f}")
+            if df is not None:
+                logger.info(f"   📊 Total Reels: {len(df)}")
+                logger.info(f"   👁️ Total Views: {df['Views_Numeric'].sum():,.0f}")
+                logger.info(f"   👍 Total Likes: {df['Likes_Numeric'].sum():,.0f}")
             logger.info(f"   📁 Output Location: {output_location}")
             
             if results:
@@ -445,7 +732,39 @@ class InstagramDataConverter:
             
         except Exception as e:
             logger.error(f"❌ Error converting to CSV: {e}")
-            return None       
+            return None
+    
+    def convert_to_columnar(self, json_data, output_dir=None, custom_filename=None, file_format='parquet'):
+        """
+        Convert JSON data directly to Parquet or Feather (for use with scraper)
+        
+        Args:
+            json_data (list): List of dictionaries containing scraped data
+            output_dir (str): Output directory (optional)
+            custom_filename (str): Custom filename without extension (optional)
+            file_format (str): 'parquet' or 'feather'
+            
+        Returns:
+            str: Path to created file
+        """
+        try:
+            if not json_data:
+                logger.error("No data to convert")
+                return None
+            
+            # Generate filename
+            if custom_filename:
+                filename = custom_filename
+            else:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"instagram_reels_data_{timestamp}"
+            
+            # Records are converted chunk by chunk while writing
+            return self.save_to_columnar(json_data, filename, output_dir, file_format)
+            
+        except Exception as e:
+            logger.error(f"❌ Error converting to {file_format.title()}: {e}")
+            return None
 
 def main():
     """Main function to run the converter"""
@@ -459,12 +778,14 @@ def main():
     JSON_FILE_PATH = None  # Set to specific file path or None to auto-find latest
     OUTPUT_EXCEL = True    # Set to False to skip Excel output
     OUTPUT_CSV = True      # Set to False to skip CSV output
+    OUTPUT_COLUMNAR = None # 'parquet' or 'feather' to also write a columnar file (needs pyarrow)
     
     # Convert data
     results = converter.convert_json_to_excel_csv(
         json_file_path=JSON_FILE_PATH,
         output_excel=OUTPUT_EXCEL,
-        output_csv=OUTPUT_CSV
+        output_csv=OUTPUT_CSV,
+        columnar_format=OUTPUT_COLUMNAR
     )
     
     if results:
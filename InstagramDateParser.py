@@ -0,0 +1,183 @@
+import re
+import threading
+import logging
+from datetime import datetime, timedelta, timezone
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Relative unit alias -> length of one unit (months and years are approximate)
+RELATIVE_UNITS = {
+    'minute': timedelta(minutes=1), 'minutes': timedelta(minutes=1), 'min': timedelta(minutes=1), 'mins': timedelta(minutes=1),
+    'hour': timedelta(hours=1), 'hours': timedelta(hours=1), 'hr': timedelta(hours=1), 'hrs': timedelta(hours=1),
+    'day': timedelta(days=1), 'days': timedelta(days=1), 'd': timedelta(days=1),
+    'week': timedelta(weeks=1), 'weeks': timedelta(weeks=1), 'w': timedelta(weeks=1),
+    'month': timedelta(days=30), 'months': timedelta(days=30), 'mo': timedelta(days=30),
+    'year': timedelta(days=365), 'years': timedelta(days=365), 'y': timedelta(days=365),
+}
+
+# Month name or abbreviation -> month number
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# "<n> <unit> ago", longest aliases first so "mins" is not read as "min"
+RELATIVE_DATE_PATTERN = re.compile(
+    r'(\d+)\s*(' + '|'.join(sorted(map(re.escape, RELATIVE_UNITS), key=len, reverse=True)) + r')\s*ago'
+)
+
+MONTH_NAME_PATTERN = re.compile('|'.join(sorted(MONTHS, key=len, reverse=True)))
+
+# Machine-readable timestamp of <time datetime="2024-07-26T10:15:00.000Z">
+ISO_DATETIME_PATTERN = re.compile(r'^\s*\d{4}-\d{2}-\d{2}[Tt ]\d{2}:\d{2}')
+
+# "july 26", "july 26, 2024", "26 july" and "26 july 2024"
+ABSOLUTE_DATE_PATTERN = re.compile(
+    r'^(?:(?P<month>[a-z]+)\s+(?P<day>\d{1,2})(?:,\s*(?P<year>\d{4}))?'
+    r'|(?P<day2>\d{1,2})\s+(?P<month2>[a-z]+)(?:\s+(?P<year2>\d{4}))?)$'
+)
+
+class RelativeDateParser:
+    """Turns Instagram date texts into '12 July 2025' dates against one reference time per run"""
+    
+    def __init__(self, reference_time=None):
+        """
+        Initialize the parser
+        
+        Args:
+            reference_time (datetime): "Now" used for relative dates (defaults to the current time)
+        """
+        self.reference_time = reference_time or datetime.now()
+        self._memo = {}  # raw text -> formatted date
+        self._lock = threading.Lock()
+    
+    def parse(self, date_text):
+        """
+        Convert relative date (like '2 hours ago') to formatted date (like '12 July 2025')
+        Keep existing date formats as-is
+        
+        Args:
+            date_text (str): Original date text from Instagram
+        
+        Returns:
+            str: Formatted date string
+        """
+        if not date_text or date_text == "N/A":
+            return "N/A"
+        
+        cached = self._memo.get(date_text)
+        if cached is not None:
+            return cached
+        
+        try:
+            formatted_date = self._parse_text(date_text.strip().lower())
+        except Exception as e:
+            logger.warning(f"Error converting date '{date_text}': {e}")
+            formatted_date = date_text  # Return original if conversion fails
+        
+        with self._lock:
+            self._memo[date_text] = formatted_date
+        return formatted_date
+    
+    def parse_many(self, date_texts):
+        """
+        Convert a whole column of date texts
+        
+        Args:
+            date_texts (iterable): Original date texts
+        
+        Returns:
+            list: Formatted dates in the same order
+        """
+        return [self.parse(date_text) for date_text in date_texts]
+    
+    @staticmethod
+    def parse_iso(value):
+        """
+        Parse an ISO 8601 timestamp such as '2024-07-26T10:15:00.000Z'
+        
+        Args:
+            value (str): Value of a time element's datetime attribute
+            
+        Returns:
+            datetime: Timezone-aware datetime (UTC when no offset is given), or None if not ISO
+        """
+        if not value or not ISO_DATETIME_PATTERN.match(value):
+            return None
+        
+        text = value.strip().upper()
+        if text.endswith('Z'):
+            text = text[:-1] + '+00:00'
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+        
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+    
+    @staticmethod
+    def format_datetime(posted_at):
+        """
+        Format an exact, timezone-aware post time as a local '12 July 2025' date
+        
+        Args:
+            posted_at (datetime): Timezone-aware datetime, e.g. from parse_iso
+            
+        Returns:
+            str: Formatted date string
+        """
+        return posted_at.astimezone().strftime('%d %B %Y')
+    
+    def _parse_text(self, date_text):
+        """Parse a cleaned (stripped, lower-case) date text"""
+        now = self.reference_time
+        
+        # Timestamps from time[datetime] are exact, show them in local time
+        posted_at = self.parse_iso(date_text)
+        if posted_at:
+            return self.format_datetime(posted_at)
+        
+        # If it already contains a month name, keep it as-is but format it properly
+        if MONTH_NAME_PATTERN.search(date_text):
+            match = ABSOLUTE_DATE_PATTERN.match(date_text)
+            if match:
+                month = MONTHS.get(match.group('month') or match.group('month2'))
+                day = match.group('day') or match.group('day2')
+                year = match.group('year') or match.group('year2')
+                if month:
+                    try:
+                        # If no year specified, assume the reference year
+                        parsed_date = datetime(int(year) if year else now.year, month, int(day))
+                        return parsed_date.strftime('%d %B %Y')
+                    except ValueError:
+                        pass
+            
+            # If parsing fails, return the original text cleaned up
+            return date_text.title()
+        
+        # Handle relative dates
+        match = RELATIVE_DATE_PATTERN.search(date_text)
+        if match:
+            target_date = now - int(match.group(1)) * RELATIVE_UNITS[match.group(2)]
+        
+        # Special cases
+        elif 'yesterday' in date_text:
+            target_date = now - timedelta(days=1)
+        elif 'today' in date_text or 'now' in date_text:
+            target_date = now
+        else:
+            # If we can't parse it, return the original text
+            logger.warning(f"Could not parse date: {date_text}")
+            return date_text
+        
+        # Format the target date as "12 July 2025"
+        formatted_date = target_date.strftime('%d %B %Y')
+        
+        logger.debug(f"Converted '{date_text}' to '{formatted_date}'")
+        return formatted_date
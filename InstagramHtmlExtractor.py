@@ -0,0 +1,962 @@
+import re
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from InstagramDateParser import RelativeDateParser
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Universal emoji detection (any emoji suggests it's content, not UI)
+EMOJI_PATTERN = re.compile("["
+    u"\U0001F600-\U0001F64F"  # emoticons
+    u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+    u"\U0001F680-\U0001F6FF"  # transport & map symbols
+    u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    u"\U00002702-\U000027B0"
+    u"\U000024C2-\U0001F251"
+    "]+", flags=re.UNICODE)
+
+# Selectors read by the reel page extractors, in the order each extractor tries them
+CAPTION_SELECTORS = [
+    "h1",  # Main caption
+    "div._a9zs span",  # Alternative caption
+    "span[dir='auto']",  # Generic caption
+    "article span[dir='auto']",  # Article caption
+    "div[data-testid='post-comment-root'] span",  # Comment root
+    "div._ac7v span[dir='auto']",  # Another variant
+    "div._aacl._aaco._aacu._aacx._aada span",  # Specific Instagram classes
+    "div[role='button'] + div span",  # Caption next to buttons
+    "div[data-testid] span[dir='auto']",  # Data testid variants
+    "meta[property='og:description']",  # Meta description fallback
+]
+
+LIKES_SELECTORS = [
+    # Likes button/text patterns
+    "button[type='button'] span:contains('likes')",
+    "a[href*='/liked_by/'] span",
+    "section button span",
+    "div[role='button'] span",
+    
+    # Alternative patterns
+    "span[dir='auto']:contains('likes')",
+    "span:contains(' likes')",
+    "button span:contains('like')",
+    
+    # Specific Instagram classes (these change frequently)
+    "span._aacl._aaco._aacu._aacx._aada",
+    "span._ac2a",
+    "div._ae5c span",
+]
+
+DATE_SELECTORS = [
+    # Time elements
+    "time",
+    "time[datetime]",
+    "span[title]",
+    
+    # Common date patterns
+    "a[href*='/p/'] time",
+    "article time",
+    "div time",
+    
+    # Alternative selectors
+    "span._a9ze",
+    "div._a9ze",
+    "span[dir='auto'][title]",
+]
+
+# Elements of a grid tile that may carry its view count
+GRID_OVERLAY_SELECTORS = [
+    "[aria-label*='views']",
+    "[title*='views']",
+    "div[style*='position: absolute'] span",
+    "div[class*='overlay'] span",
+]
+
+def snapshot_query(selector, parent=False):
+    """Describe one selector for the page snapshot script (':contains(' selectors become XPath)"""
+    query = {'key': selector, 'parent': parent}
+    if ':contains(' in selector:
+        query['xpath'] = "//*" + selector.replace(':contains(', '[contains(text(), ').replace(')', ')]')
+    else:
+        query['css'] = selector
+    return query
+
+# Every selector any reel page extractor reads, plus the full-page fallback scans
+PAGE_SNAPSHOT_QUERIES = list({
+    selector: snapshot_query(selector, parent=selector in LIKES_SELECTORS)
+    for selector in CAPTION_SELECTORS + LIKES_SELECTORS + DATE_SELECTORS + ["*[title]", "span"]
+}.values())
+
+VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+}
+
+# Elements whose text the browser does not render
+HIDDEN_TAGS = {'script', 'style', 'template', 'noscript', 'head', 'title'}
+
+DISPLAY_NONE_PATTERN = re.compile(r'display\s*:\s*none', re.IGNORECASE)
+
+# Elements that start a new line in rendered text
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'figcaption', 'figure',
+    'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav',
+    'ol', 'p', 'pre', 'section', 'table', 'tr', 'ul',
+}
+
+class HtmlNode:
+    """Element of a parsed page"""
+    
+    __slots__ = ('tag', 'attrs', 'parent', 'children', 'classes', '_text')
+    
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.parent = parent
+        self.children = []  # HtmlNode or str
+        self.classes = set(self.attrs.get('class', '').split())
+        self._text = None
+    
+    def get_attribute(self, name):
+        """Return an attribute value, or None if the element does not have it"""
+        return self.attrs.get(name)
+    
+    @property
+    def element_parent(self):
+        """Parent element, or None at the top of the document"""
+        parent = self.parent
+        return parent if parent is not None and parent.tag != '#document' else None
+    
+    def previous_element_sibling(self):
+        """Element directly before this one under the same parent"""
+        if self.parent is None:
+            return None
+        previous = None
+        for child in self.parent.children:
+            if child is self:
+                return previous
+            if isinstance(child, HtmlNode):
+                previous = child
+        return None
+    
+    def iter_descendants(self):
+        """Yield all descendant elements in document order"""
+        stack = [child for child in reversed(self.children) if isinstance(child, HtmlNode)]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(child for child in reversed(node.children) if isinstance(child, HtmlNode))
+    
+    def _hidden(self):
+        """Whether the element itself is not rendered (its subtree gets no layout boxes)"""
+        return (self.tag in HIDDEN_TAGS or 'hidden' in self.attrs
+                or bool(DISPLAY_NONE_PATTERN.search(self.attrs.get('style', ''))))
+    
+    @property
+    def rendered(self):
+        """
+        Whether the element has a layout box, like a non-empty getClientRects() in the browser
+        
+        Only markup is known offline, so elements hidden by stylesheets still count as rendered.
+        """
+        node = self
+        while node is not None and node.tag != '#document':
+            if node._hidden():
+                return False
+            node = node.parent
+        return True
+    
+    @property
+    def text(self):
+        """Rendered text, close to what WebElement.text returns (empty for elements that are not rendered)"""
+        if self._text is None:
+            if not self.rendered:
+                self._text = ""
+                return self._text
+            pieces = []
+            self._collect_text(pieces)
+            lines = (" ".join(line.split()) for line in "".join(pieces).split("\n"))
+            self._text = "\n".join(line for line in lines if line)
+        return self._text
+    
+    def _collect_text(self, pieces):
+        if self._hidden():
+            return
+        if self.tag == 'br':
+            pieces.append("\n")
+            return
+        
+        block = self.tag in BLOCK_TAGS
+        if block:
+            pieces.append("\n")
+        for child in self.children:
+            if isinstance(child, HtmlNode):
+                child._collect_text(pieces)
+            else:
+                pieces.append(child)
+        if block:
+            pieces.append("\n")
+
+class _TreeBuilder(HTMLParser):
+    """Builds an HtmlNode tree with the standard library parser"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = HtmlNode('#document')
+        self._stack = [self.root]
+    
+    def handle_starttag(self, tag, attrs):
+        node = HtmlNode(tag, {name: value if value is not None else "" for name, value in attrs}, self._stack[-1])
+        self._stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self._stack.append(node)
+    
+    def handle_startendtag(self, tag, attrs):
+        node = HtmlNode(tag, {name: value if value is not None else "" for name, value in attrs}, self._stack[-1])
+        self._stack[-1].children.append(node)
+    
+    def handle_endtag(self, tag):
+        # Close up to the matching open element, ignore stray end tags
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth].tag == tag:
+                del self._stack[depth:]
+                return
+    
+    def handle_data(self, data):
+        self._stack[-1].children.append(data)
+
+# One step of a CSS selector: tag or '*', class names, attribute conditions and a combinator
+SELECTOR_TOKEN_PATTERN = re.compile(r"""
+    (?P<tag>[a-zA-Z][a-zA-Z0-9-]*|\*)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[*^$~]?=)\s*(?:'(?P<squote>[^']*)'|"(?P<dquote>[^"]*)"|(?P<bare>[^\]\s]+))\s*)?\]
+  | (?P<combinator>\s*[>+~]\s*|\s+)
+""", re.VERBOSE)
+
+_compiled_selectors = {}
+
+def _compile_selector(selector):
+    """
+    Compile a CSS selector into steps matched right to left
+    
+    Supports tag, *, .class, [attr], [attr=v], [attr*=v], [attr^=v], [attr$=v], [attr~=v]
+    and the descendant, child (>), adjacent (+) and sibling (~) combinators. Anything else
+    (ids, pseudo-classes, selector lists, escapes, ...) raises instead of matching the wrong elements.
+    
+    Returns:
+        list: (combinator to the previous step, tag, classes, attribute conditions) tuples
+    
+    Raises:
+        ValueError: If the selector uses syntax this matcher does not support
+    """
+    compiled = _compiled_selectors.get(selector)
+    if compiled is not None:
+        return compiled
+    
+    steps = []
+    combinator = None
+    tag, classes, conditions = None, [], []
+    empty = True  # No token yet in the current compound selector
+    position = 0
+    text = selector.strip()
+    
+    while position < len(text):
+        match = SELECTOR_TOKEN_PATTERN.match(text, position)
+        if not match:
+            raise ValueError(f"Unsupported selector syntax at {text[position:]!r} in: {selector}")
+        position = match.end()
+        
+        if match.group('combinator') is not None:
+            if empty or position == len(text):
+                raise ValueError(f"Combinator without a selector on both sides in: {selector}")
+            steps.append((combinator, tag, classes, conditions))
+            combinator = match.group('combinator').strip() or ' '
+            tag, classes, conditions = None, [], []
+            empty = True
+            continue
+        
+        if match.group('tag'):
+            # A type selector must come first in its compound selector ("span[title]", not "[title]span")
+            if not empty:
+                raise ValueError(f"Unsupported selector syntax at {match.group('tag')!r} in: {selector}")
+            tag = None if match.group('tag') == '*' else match.group('tag').lower()
+        elif match.group('cls'):
+            classes.append(match.group('cls'))
+        else:
+            value = next((v for v in match.group('squote', 'dquote', 'bare') if v is not None), None)
+            conditions.append((match.group('attr').lower(), match.group('op'), value))
+        empty = False
+    
+    if empty:
+        raise ValueError(f"Empty selector: {selector!r}")
+    steps.append((combinator, tag, classes, conditions))
+    _compiled_selectors[selector] = steps
+    return steps
+
+def _matches_step(node, tag, classes, conditions):
+    if tag and node.tag != tag:
+        return False
+    if classes and not node.classes.issuperset(classes):
+        return False
+    for name, op, value in conditions:
+        actual = node.attrs.get(name)
+        if actual is None:
+            return False
+        if op == '=' and actual != value:
+            return False
+        if op == '*=' and value not in actual:
+            return False
+        if op == '^=' and not actual.startswith(value):
+            return False
+        if op == '$=' and not actual.endswith(value):
+            return False
+        if op == '~=' and value not in actual.split():
+            return False
+    return True
+
+def _matches(node, steps, index):
+    combinator, tag, classes, conditions = steps[index]
+    if not _matches_step(node, tag, classes, conditions):
+        return False
+    if index == 0:
+        return True
+    
+    if combinator == ' ':
+        ancestor = node.element_parent
+        while ancestor is not None:
+            if _matches(ancestor, steps, index - 1):
+                return True
+            ancestor = ancestor.element_parent
+        return False
+    if combinator == '>':
+        parent = node.element_parent
+        return parent is not None and _matches(parent, steps, index - 1)
+    if combinator == '+':
+        sibling = node.previous_element_sibling()
+        return sibling is not None and _matches(sibling, steps, index - 1)
+    
+    # General sibling (~)
+    sibling = node.previous_element_sibling()
+    while sibling is not None:
+        if _matches(sibling, steps, index - 1):
+            return True
+        sibling = sibling.previous_element_sibling()
+    return False
+
+class HtmlDocument:
+    """Parsed page that answers CSS selector queries like document.querySelectorAll"""
+    
+    def __init__(self, html):
+        builder = _TreeBuilder()
+        builder.feed(html or "")
+        builder.close()
+        self.root = builder.root
+        self.elements = list(self.root.iter_descendants())
+    
+    def select(self, selector, scope=None):
+        """
+        Find elements matching a CSS selector, in document order
+        
+        Args:
+            selector (str): CSS selector
+            scope (HtmlNode): Only return descendants of this element (optional)
+        
+        Returns:
+            list: Matching HtmlNode elements
+        """
+        steps = _compile_selector(selector)
+        last = len(steps) - 1
+        candidates = self.elements if scope is None else scope.iter_descendants()
+        return [node for node in candidates if _matches(node, steps, last)]
+    
+    def select_one(self, selector):
+        """Return the first element matching a CSS selector, or None"""
+        steps = _compile_selector(selector)
+        last = len(steps) - 1
+        return next((node for node in self.elements if _matches(node, steps, last)), None)
+
+def parse_html(html):
+    """Parse a captured page source into an HtmlDocument"""
+    return HtmlDocument(html)
+
+def snapshot_from_html(html, queries=None):
+    """
+    Build the same page snapshot the browser-side snapshot script returns, from saved HTML
+    
+    Args:
+        html (str or HtmlDocument): Page source
+        queries (list): Snapshot queries (defaults to PAGE_SNAPSHOT_QUERIES)
+    
+    Returns:
+        dict: Selector -> list of records with text, title, datetime, content (and parent_text)
+    """
+    document = html if isinstance(html, HtmlDocument) else parse_html(html)
+    snapshot = {}
+    
+    for query in queries or PAGE_SNAPSHOT_QUERIES:
+        # The ':contains(' XPath queries are rejected by browsers as well
+        if 'css' not in query:
+            snapshot[query['key']] = []
+            continue
+        
+        # Unsupported selectors raise here instead of silently matching nothing
+        nodes = document.select(query['css'])
+        
+        records = []
+        for node in nodes:
+            record = {
+                'text': node.text,
+                'title': node.get_attribute('title'),
+                'datetime': node.get_attribute('datetime'),
+                'content': node.get_attribute('content'),
+            }
+            if query.get('parent'):
+                parent = node.element_parent
+                record['parent_text'] = parent.text if parent is not None else ""
+            records.append(record)
+        snapshot[query['key']] = records
+    
+    return snapshot
+
+def grid_entries_from_html(html, base_url="https://www.instagram.com/"):
+    """
+    Build the same entries the grid snapshot script returns, from a saved profile page
+    
+    Saved HTML has no layout, so tiles are positioned by document order.
+    
+    Args:
+        html (str or HtmlDocument): Page source of a profile's reels grid
+        base_url (str): URL the page was loaded from, used to make reel links absolute
+    
+    Returns:
+        list: Entries with href, x, y, width, height and containers
+    """
+    document = html if isinstance(html, HtmlDocument) else parse_html(html)
+    root = document.select_one("main")
+    
+    def short_texts(container, selector):
+        texts = (node.text for node in document.select(selector, scope=container))
+        return [text for text in texts if text and len(text) <= 20]
+    
+    def overlays(container):
+        return [
+            {
+                'label': node.get_attribute('aria-label') or node.get_attribute('title') or node.text,
+                'text': node.text,
+            }
+            for selector in GRID_OVERLAY_SELECTORS
+            for node in document.select(selector, scope=container)
+        ]
+    
+    entries = []
+    for index, link in enumerate(document.select("a[href*='/reel/']", scope=root)):
+        parent = link.element_parent
+        grandparent = parent.element_parent if parent is not None else None
+        containers = [node for node in (link, parent, grandparent) if node is not None]
+        entries.append({
+            'href': urljoin(base_url, link.get_attribute('href')),
+            'x': 0,
+            'y': index,
+            'width': 0,
+            'height': 0,
+            'containers': [
+                {'spans': short_texts(c, 'span'), 'divs': short_texts(c, 'div'), 'overlays': overlays(c)}
+                for c in containers
+            ],
+        })
+    
+    return entries
+
+class ReelExtractor:
+    """Caption, likes, date and view count extraction over page records, shared by live pages and saved HTML"""
+    
+    def __init__(self, records=None):
+        """
+        Initialize the extractor
+        
+        Args:
+            records (callable): Selector -> list of element records supporting .get(field)
+        """
+        self.records = records or (lambda selector: [])
+    
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Create an extractor reading a page snapshot dictionary"""
+        return cls(lambda selector: snapshot.get(selector, []))
+    
+    def find_caption(self, reel_url):
+        """Find the best scoring caption on the currently open reel page"""
+        try:
+            # Get username from URL for filtering
+            username = reel_url.split('/')[-3] if len(reel_url.split('/')) > 3 else ""
+            
+            candidate_captions = []
+            
+            # Collect all potential captions
+            for selector in CAPTION_SELECTORS:
+                try:
+                    if selector.startswith("meta"):
+                        # Handle meta tags differently
+                        for record in self.records(selector):
+                            content = record.get("content")
+                            if content and len(content) > 20:
+                                candidate_captions.append(content.strip())
+                    else:
+                        for record in self.records(selector):
+                            text = record.get("text") or ""
+                            if text and len(text) > 15:  # Increased minimum length
+                                candidate_captions.append(text)
+                except:
+                    continue
+            
+            # Score and select the best caption
+            best_caption = ""
+            best_score = 0
+            
+            # Debug: Log all candidate captions for troubleshooting
+            logger.debug(f"Found {len(candidate_captions)} potential captions")
+            for i, caption in enumerate(candidate_captions):
+                logger.debug(f"Caption {i+1}: {caption[:100]}...")
+            
+            for caption in candidate_captions:
+                if not caption:
+                    continue
+                
+                score = 0
+                caption_lower = caption.lower()
+                
+                # Skip if it's just the username
+                if caption.strip().lower() == username.lower():
+                    continue
+                
+                # Skip if it's a short generic text
+                if len(caption) < 20:
+                    continue
+                
+                # UNIVERSAL Positive scoring criteria
+                if len(caption) > 100:
+                    score += 5  # Very long text is highly likely to be caption
+                elif len(caption) > 50:
+                    score += 3  # Longer text is more likely to be caption
+                
+                if '#' in caption:
+                    score += 3  # Contains hashtags (universal sign of captions)
+                
+                # Universal emoji detection (any emoji suggests it's content, not UI)
+                if EMOJI_PATTERN.search(caption):
+                    score += 2  # Contains emojis
+                
+                # Multiple sentences or line breaks indicate real content
+                if '\n' in caption or '. ' in caption or '! ' in caption or '? ' in caption:
+                    score += 3  # Multiple sentences or line breaks
+                
+                # Check if it contains multiple words (real content vs UI elements)
+                word_count = len(caption.split())
+                if word_count >= 10:
+                    score += 3  # Many words = likely caption
+                elif word_count >= 5:
+                    score += 2  # Some words = possible caption
+                elif word_count >= 3:
+                    score += 1  # Few words = maybe caption
+                
+                # URLs or mentions suggest real content
+                if 'http' in caption_lower or '@' in caption or '.' in caption:
+                    score += 1  # Contains links or mentions
+                
+                # Punctuation patterns of real content
+                punctuation_count = sum(1 for char in caption if char in '.,!?;:')
+                if punctuation_count >= 3:
+                    score += 2  # Good punctuation suggests real content
+                elif punctuation_count >= 1:
+                    score += 1
+                
+                # UNIVERSAL Negative scoring criteria
+                
+                # Common UI elements and generic text
+                ui_elements = [
+                    'follow', 'following', 'followers', 'likes', 'like', 'share', 'comment',
+                    'view', 'views', 'watch', 'play', 'pause', 'volume', 'mute',
+                    'close', 'back', 'next', 'previous', 'settings', 'options'
+                ]
+                if any(ui_word == caption_lower.strip() for ui_word in ui_elements):
+                    score -= 10  # Definitely UI element, not caption
+                
+                # Single word is very unlikely to be caption (unless it's long)
+                if len(caption.split()) == 1 and len(caption) < 15:
+                    score -= 5  # Single short word is unlikely to be caption
+                
+                # Username repetition check (more thorough)
+                if caption.lower().strip() == username.lower():
+                    score -= 10  # Exact username match
+                
+                # If it's mostly numbers or very short, probably not caption
+                if re.match(r'^[\d\s,\.]+$', caption.strip()):
+                    score -= 8  # Just numbers (like view counts)
+                
+                # Common social media UI text
+                common_ui_phrases = [
+                    'suggested for you', 'recommended', 'sponsored', 'advertisement',
+                    'see more', 'see less', 'show more', 'show less', 'read more'
+                ]
+                if any(phrase in caption_lower for phrase in common_ui_phrases):
+                    score -= 8  # UI phrases
+                
+                # Log scoring for debugging
+                logger.debug(f"Caption: '{caption[:50]}...' -> Score: {score}")
+                
+                # Select best scoring caption
+                if score > best_score:
+                    best_score = score
+                    best_caption = caption
+            
+            logger.info(f"Best caption selected with score: {best_score}")
+            
+            # If no good caption found, try a broader search
+            if not best_caption:
+                try:
+                    logger.info("No good caption found, trying broader search...")
+                    # Look for any longer text that might be the caption
+                    for record in self.records("span"):
+                        text = record.get("text") or ""
+                        if (len(text) > 50 and  # Reduced threshold
+                            text.lower() != username.lower() and
+                            len(text.split()) > 3 and  # Must have multiple words
+                            not re.match(r'^[\d\s,\.]+$', text)):  # Not just numbers
+                            # Additional check: prefer text with hashtags or emojis
+                            if '#' in text or EMOJI_PATTERN.search(text):
+                                best_caption = text
+                                logger.info(f"Found caption via broader search: {text[:50]}...")
+                                break
+                            # If no emoji/hashtag, still consider if it's long enough
+                            elif len(text) > 100:
+                                best_caption = text
+                                logger.info(f"Found long caption via broader search: {text[:50]}...")
+                                break
+                except Exception as e:
+                    logger.warning(f"Error in broader search: {e}")
+            
+            return best_caption[:2500] if best_caption else ""  # Limit caption length
+        
+        except Exception as e:
+            logger.warning(f"❌ Failed to extract caption from {reel_url}: {e}")
+            return ""
+    
+    def find_likes_count(self):
+        """Find likes count on individual reel page"""
+        try:
+            for selector in LIKES_SELECTORS:
+                try:
+                    for record in self.records(selector):
+                        text = record.get("text") or ""
+                        
+                        # Check if this looks like a likes count
+                        if self.is_likes_count(text):
+                            logger.info(f"👍 Found likes: {text}")
+                            return text
+                        
+                        # Check parent/sibling elements
+                        parent_text = record.get("parent_text") or ""
+                        if self.is_likes_count(parent_text):
+                            logger.info(f"👍 Found likes in parent: {parent_text}")
+                            return parent_text
+                
+                except Exception as e:
+                    logger.debug(f"Error with likes selector {selector}: {e}")
+                    continue
+            
+            # Alternative method: look for patterns in all text
+            try:
+                for record in self.records("span"):
+                    text = record.get("text") or ""
+                    # Look for patterns like "1,234 likes" or "1.2K likes"
+                    likes_match = re.search(r'([\d,]+(?:\.\d+)?[KMB]?)\s*likes?', text, re.IGNORECASE)
+                    if likes_match:
+                        likes_text = likes_match.group(1)
+                        logger.info(f"👍 Found likes via pattern: {likes_text}")
+                        return likes_text
+            except:
+                pass
+        
+        except Exception as e:
+            logger.debug(f"Error finding likes count: {e}")
+        
+        return "N/A"
+    
+    def find_post_datetime(self):
+        """
+        Read the machine-readable post timestamp from the first time[datetime] of the page
+        
+        Returns:
+            tuple: (raw attribute value, timezone-aware datetime), or (None, None) if missing
+        """
+        try:
+            records = self.records("time[datetime]")
+            raw = records[0].get("datetime") if records else None
+        except Exception as e:
+            logger.debug(f"Error reading time[datetime]: {e}")
+            return None, None
+        
+        posted_at = RelativeDateParser.parse_iso(raw)
+        if not posted_at:
+            return None, None
+        return raw, posted_at
+    
+    def find_post_date(self):
+        """Find post date on individual reel page"""
+        # Fast path: the ISO timestamp, without walking selectors or scanning the page
+        raw, posted_at = self.find_post_datetime()
+        if posted_at:
+            logger.info(f"📅 Found datetime attribute: {raw}")
+            return raw
+        
+        try:
+            for selector in DATE_SELECTORS:
+                try:
+                    for record in self.records(selector):
+                        # Check datetime attribute first
+                        datetime_attr = record.get("datetime")
+                        if datetime_attr:
+                            logger.info(f"📅 Found datetime attribute: {datetime_attr}")
+                            return datetime_attr
+                        
+                        # Check title attribute
+                        title_attr = record.get("title")
+                        if title_attr and self.is_date_text(title_attr):
+                            logger.info(f"📅 Found date in title: {title_attr}")
+                            return title_attr
+                        
+                        # Check text content
+                        text = record.get("text") or ""
+                        if text and self.is_date_text(text):
+                            logger.info(f"📅 Found date text: {text}")
+                            return text
+                
+                except Exception as e:
+                    logger.debug(f"Error with date selector {selector}: {e}")
+                    continue
+            
+            # Alternative method: look for date patterns in all text
+            # (only reached without time[datetime])
+            try:
+                for record in self.records("*[title]"):
+                    title = record.get("title")
+                    if title and self.is_date_text(title):
+                        logger.info(f"📅 Found date in title attribute: {title}")
+                        return title
+                
+                # Look for text patterns
+                for record in self.records("span"):
+                    text = record.get("text") or ""
+                    if self.is_date_text(text):
+                        logger.info(f"📅 Found date text: {text}")
+                        return text
+            
+            except:
+                pass
+        
+        except Exception as e:
+            logger.debug(f"Error finding post date: {e}")
+        
+        return "N/A"
+    
+    def is_likes_count(self, text):
+        """Check if text looks like a likes count"""
+        if not text:
+            return False
+        
+        # Patterns for likes count
+        patterns = [
+            r'^\d+[.,]?\d*[KMB]?\s*$',  # Just numbers with K/M/B
+            r'^\d{1,3}(,\d{3})*\s*$',   # Numbers with commas
+            r'^\d+\s*$'                 # Plain numbers
+        ]
+        
+        # Remove common words and check
+        clean_text = re.sub(r'\s*(likes?|like)\s*', '', text, flags=re.IGNORECASE).strip()
+        
+        return any(re.match(pattern, clean_text) for pattern in patterns)
+    
+    def is_date_text(self, text):
+        """Check if text looks like a date/time"""
+        if not text or len(text) < 3:
+            return False
+        
+        # Patterns for date/time text
+        date_patterns = [
+            r'\d+\s*(minute|minutes|min|mins?)\s*ago',
+            r'\d+\s*(hour|hours|hr|hrs?)\s*ago',
+            r'\d+\s*(day|days|d)\s*ago',
+            r'\d+\s*(week|weeks|w)\s*ago',
+            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+',
+            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+',
+            r'\d{4}-\d{2}-\d{2}',  # ISO date format
+            r'\d{1,2}/\d{1,2}/\d{4}',  # MM/DD/YYYY format
+        ]
+        
+        return any(re.search(pattern, text, re.IGNORECASE) for pattern in date_patterns)
+    
+    def is_view_count(self, text):
+        """Check if text looks like a view count"""
+        if not text:
+            return False
+        
+        # Patterns for view counts
+        patterns = [
+            r'^\d+[.,]?\d*[KMB]?$',  # 1.2K, 500M, 1B
+            r'^\d{1,3}(,\d{3})*$',   # 1,000,000
+            r'^\d+(\.\d+)?[KMB]$',   # 1.5K, 2.3M
+            r'^\d+$'                 # Plain numbers
+        ]
+        
+        return any(re.match(pattern, text) for pattern in patterns)
+    
+    def view_count_from_grid_entry(self, entry):
+        """Find the view count of one grid snapshot entry (same search order as the scraper's live element walk)"""
+        for container in entry.get('containers', []):
+            for text in container.get('spans', []) + container.get('divs', []):
+                if self.is_view_count(text):
+                    return text
+            
+            for overlay in container.get('overlays', []):
+                label = overlay.get('label') or ""
+                if label and "view" in label.lower():
+                    view_match = re.search(r'([\d,]+(?:\.\d+)?[KMB]?)\s*views?', label, re.IGNORECASE)
+                    if view_match:
+                        return view_match.group(1)
+                
+                text = overlay.get('text') or ""
+                if self.is_view_count(text):
+                    return text
+        
+        return None
+    
+    def parse_grid_entries(self, entries, selector_used='grid_snapshot'):
+        """
+        Turn grid snapshot entries into reel dictionaries
+        
+        Args:
+            entries (list): Entries with href, x, y, width, height and containers
+            selector_used (str): Value stored in each reel's selector_used field
+        
+        Returns:
+            list: Reel dictionaries sorted by grid position
+        """
+        reels_data = []
+        timestamp = datetime.now().isoformat()
+        
+        # Make sure the element is visible, then sort by Y position (row) and X position (column)
+        entries = [
+            entry for entry in entries
+            if entry.get('href') and '/reel/' in entry['href']
+            and entry.get('y', 0) >= 0 and entry.get('x', 0) >= 0
+        ]
+        entries.sort(key=lambda entry: (entry.get('y', 0), entry.get('x', 0)))
+        
+        for idx, entry in enumerate(entries):
+            y = entry.get('y', 0)
+            x = entry.get('x', 0)
+            view_count = self.view_count_from_grid_entry(entry)
+            
+            reels_data.append({
+                'views': view_count if view_count else 'N/A',
+                'url': entry['href'],
+                'reel_index': idx + 1,
+                'position': {'row': int(y), 'col': int(x)},
+                'selector_used': selector_used,
+                'timestamp': timestamp,
+                'caption': ""
+            })
+            
+            if view_count:
+                logger.info(f"🎥 Reel {idx + 1}: {view_count} views - Position(Y:{y:.0f}, X:{x:.0f})")
+            else:
+                logger.info(f"🎥 Reel {idx + 1}: No views found - Position(Y:{y:.0f}, X:{x:.0f})")
+        
+        return reels_data
+
+def extract_reel_details_from_html(html, reel_url, extract_caption=True, extract_likes_dates=True, reference_time=None):
+    """
+    Extract caption, likes and post date from the saved source of a reel page
+    
+    Args:
+        html (str): Page source of the reel page
+        reel_url (str): URL of the reel
+        extract_caption (bool): Whether to extract the caption
+        extract_likes_dates (bool): Whether to extract likes and post date
+        reference_time (datetime): "Now" for relative dates (defaults to the current time)
+    
+    Returns:
+        dict: Reel details with caption, likes, post_date_raw and post_date
+    """
+    details = {
+        'caption': "",
+        'likes': "N/A",
+        'post_date_raw': "N/A",
+        'post_date': "N/A",
+    }
+    
+    extractor = ReelExtractor.from_snapshot(snapshot_from_html(html))
+    
+    if extract_caption:
+        details['caption'] = extractor.find_caption(reel_url)
+    
+    if extract_likes_dates:
+        details['likes'] = extractor.find_likes_count()
+        raw_date, posted_at = extractor.find_post_datetime()
+        if posted_at:
+            details['post_date_raw'] = raw_date
+            details['post_date'] = RelativeDateParser.format_datetime(posted_at)
+        else:
+            raw_date = extractor.find_post_date()
+            if raw_date and raw_date != "N/A":
+                details['post_date_raw'] = raw_date
+                details['post_date'] = RelativeDateParser(reference_time).parse(raw_date)
+    
+    return details
+
+def extract_reels_from_grid_html(html, base_url="https://www.instagram.com/"):
+    """
+    Extract reel URLs and view counts from the saved source of a profile's reels grid
+    
+    Returns:
+        list: Reel dictionaries in grid order
+    """
+    return ReelExtractor().parse_grid_entries(grid_entries_from_html(html, base_url), selector_used='html_grid')
+
+def _extract_page(job):
+    """Process pool entry point: extract the details of one (reel_url, html) page"""
+    reel_url, html, extract_caption, extract_likes_dates, reference_time = job
+    try:
+        return extract_reel_details_from_html(html, reel_url, extract_caption, extract_likes_dates, reference_time)
+    except Exception as e:
+        logger.warning(f"❌ Failed to extract reel details from saved page {reel_url}: {e}")
+        return None
+
+def extract_many(pages, workers=None, extract_caption=True, extract_likes_dates=True, reference_time=None):
+    """
+    Extract reel details from many saved pages, in parallel across processes
+    
+    Args:
+        pages (iterable): (reel_url, html) pairs
+        workers (int): Number of processes (None = one per CPU, 1 = in this process)
+        extract_caption (bool): Whether to extract captions
+        extract_likes_dates (bool): Whether to extract likes and post dates
+        reference_time (datetime): "Now" for relative dates, shared by every page
+    
+    Returns:
+        list: Details dictionaries (None for pages that failed) in the order of pages
+    """
+    reference_time = reference_time or datetime.now()
+    jobs = [(reel_url, html, extract_caption, extract_likes_dates, reference_time) for reel_url, html in pages]
+    
+    if workers == 1 or len(jobs) <= 1:
+        return [_extract_page(job) for job in jobs]
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_extract_page, jobs, chunksize=max(1, len(jobs) // 32)))
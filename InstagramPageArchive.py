@@ -0,0 +1,267 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import threading
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from InstagramHtmlExtractor import extract_reel_details_from_html, extract_reels_from_grid_html
+from InstagramReelCache import ReelDetailCache
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PAGE_KINDS = ('reel', 'grid')
+
+class PageArchive:
+    """Content-addressed store of gzip-compressed page sources, for re-extraction without a browser"""
+    
+    def __init__(self, archive_dir):
+        """
+        Open (or create) the archive
+        
+        Args:
+            archive_dir (str): Directory holding objects/ and index.jsonl
+        """
+        self.archive_dir = archive_dir
+        self.objects_dir = os.path.join(archive_dir, "objects")
+        self.index_path = os.path.join(archive_dir, "index.jsonl")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        
+        self.pages_stored = 0
+        self.bytes_written = 0
+        
+        # Enrichment workers share one archive, so index appends are guarded by a lock
+        self._lock = threading.Lock()
+        self._index = None
+    
+    def object_path(self, sha256):
+        """Path of the compressed page source with the given hash"""
+        return os.path.join(self.objects_dir, sha256[:2], f"{sha256}.html.gz")
+    
+    def store(self, kind, url, html):
+        """
+        Archive one captured page source
+        
+        Identical sources are stored once; every capture still gets an index entry.
+        
+        Args:
+            kind (str): 'reel' for reel pages, 'grid' for the profile's reels grid
+            url (str): URL the page was captured from
+            html (str): Page source
+        
+        Returns:
+            str: SHA-256 of the page source
+        """
+        if kind not in PAGE_KINDS:
+            raise ValueError(f"Unknown page kind: {kind}")
+        
+        data = html.encode('utf-8')
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self.object_path(sha256)
+        
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(temp_path, 'wb', compresslevel=6) as f:
+                f.write(data)
+            os.replace(temp_path, path)
+            with self._lock:
+                self.bytes_written += os.path.getsize(path)
+        
+        entry = {
+            'kind': kind,
+            'url': url,
+            'sha256': sha256,
+            'size': len(data),
+            'captured_at': datetime.now().isoformat(),
+        }
+        with self._lock:
+            if self._index is None:
+                self._index = open(self.index_path, 'a', encoding='utf-8')
+            self._index.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._index.flush()
+            self.pages_stored += 1
+        
+        return sha256
+    
+    def load(self, sha256):
+        """
+        Read an archived page source
+        
+        Returns:
+            str: The page source
+        """
+        with gzip.open(self.object_path(sha256), 'rb') as f:
+            return f.read().decode('utf-8')
+    
+    def iter_entries(self, kind=None):
+        """
+        Iterate over the index in capture order
+        
+        Args:
+            kind (str): Only yield captures of this kind (None = all)
+        
+        Yields:
+            dict: Index entries with kind, url, sha256, size and captured_at
+        """
+        if not os.path.exists(self.index_path):
+            return
+        
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Partly written last line of an interrupted run
+                if kind is None or entry.get('kind') == kind:
+                    yield entry
+    
+    def latest_entries(self, kind):
+        """
+        Get the most recent capture of every URL
+        
+        Returns:
+            list: Index entries, one per URL, in order of first capture
+        """
+        latest = {}
+        for entry in self.iter_entries(kind):
+            latest[entry['url']] = entry
+        return list(latest.values())
+    
+    def close(self):
+        """Close the index file"""
+        with self._lock:
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+        if self.pages_stored:
+            logger.info(f"🗃️ Archived {self.pages_stored} pages ({self.bytes_written / 1024:.0f} KB new) to {self.archive_dir}")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def _reextract_grid(job):
+    """Process pool entry point: extract the reels of one archived grid page"""
+    archive_dir, entry = job
+    try:
+        html = PageArchive(archive_dir).load(entry['sha256'])
+        return extract_reels_from_grid_html(html, entry['url'])
+    except Exception as e:
+        logger.warning(f"❌ Failed to re-extract grid page {entry['sha256']}: {e}")
+        return []
+
+def _reextract_reel(job):
+    """Process pool entry point: extract the details of one archived reel page"""
+    archive_dir, entry, extract_caption, extract_likes_dates = job
+    try:
+        html = PageArchive(archive_dir).load(entry['sha256'])
+        # Relative dates ("3 days ago") are relative to when the page was captured
+        captured_at = datetime.fromisoformat(entry['captured_at'])
+        return extract_reel_details_from_html(html, entry['url'], extract_caption, extract_likes_dates, captured_at)
+    except Exception as e:
+        logger.warning(f"❌ Failed to re-extract reel page {entry['url']}: {e}")
+        return None
+
+def reextract_archive(archive_dir, workers=None, extract_caption=True, extract_likes_dates=True):
+    """
+    Replay the current extractors over an archive, in parallel across processes
+    
+    Grid captures give the reel list and view counts (the latest non-N/A count wins),
+    the latest capture of each reel page gives its caption, likes and post date.
+    
+    Args:
+        archive_dir (str): Directory of the PageArchive
+        workers (int): Number of processes (None = one per CPU, 1 = in this process)
+        extract_caption (bool): Whether to extract captions
+        extract_likes_dates (bool): Whether to extract likes and post dates
+    
+    Returns:
+        list: Reel dictionaries in the format written by the scraper
+    """
+    archive = PageArchive(archive_dir)
+    grid_jobs = [(archive_dir, entry) for entry in archive.iter_entries('grid')]
+    reel_entries = archive.latest_entries('reel')
+    reel_jobs = [(archive_dir, entry, extract_caption, extract_likes_dates) for entry in reel_entries]
+    logger.info(f"🗃️ Re-extracting {len(grid_jobs)} grid pages and {len(reel_jobs)} reel pages from {archive_dir}")
+    
+    if workers == 1:
+        grid_results = [_reextract_grid(job) for job in grid_jobs]
+        reel_results = [_reextract_reel(job) for job in reel_jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            grid_results = list(pool.map(_reextract_grid, grid_jobs, chunksize=max(1, len(grid_jobs) // 32)))
+            reel_results = list(pool.map(_reextract_reel, reel_jobs, chunksize=max(1, len(reel_jobs) // 32)))
+    
+    # Grid and reel page URLs of one reel may differ (/user/reel/X/ vs /reel/X/), so join on the shortcode
+    def reel_key(url):
+        return ReelDetailCache.shortcode_from_url(url) or url
+    
+    # Grid captures are in capture order, so later counts replace earlier ones
+    reels = {}
+    for grid_reels in grid_results:
+        for reel in grid_reels:
+            known = reels.get(reel_key(reel['url']))
+            if known is None:
+                reels[reel_key(reel['url'])] = reel
+            elif reel['views'] != 'N/A':
+                known['views'] = reel['views']
+    
+    for entry, details in zip(reel_entries, reel_results):
+        reel = reels.setdefault(reel_key(entry['url']), {
+            'views': 'N/A',
+            'url': entry['url'],
+            'selector_used': 'html_archive',
+            'caption': "",
+        })
+        reel['archived_at'] = entry['captured_at']
+        if details:
+            reel.update(details)
+    
+    results = list(reels.values())
+    for idx, reel in enumerate(results):
+        reel['reel_index'] = idx + 1
+        for field in ('likes', 'post_date_raw', 'post_date'):
+            reel.setdefault(field, "N/A")
+    
+    logger.info(f"✅ Re-extracted {len(results)} reels")
+    return results
+
+def main():
+    """Re-extract reels from an archive and save them as JSON"""
+    parser = argparse.ArgumentParser(description="Re-extract Instagram reels from archived page sources")
+    parser.add_argument('archive_dir', help="Directory of the page archive")
+    parser.add_argument('-o', '--output', help="Output JSON file (default: instagram_reels_reextracted_<timestamp>.json)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Number of processes (default: one per CPU)")
+    parser.add_argument('--no-captions', action='store_true', help="Skip caption extraction")
+    parser.add_argument('--no-likes-dates', action='store_true', help="Skip likes and post date extraction")
+    args = parser.parse_args()
+    
+    if not os.path.exists(os.path.join(args.archive_dir, "index.jsonl")):
+        print(f"❌ No page archive found in {args.archive_dir}")
+        return
+    
+    results = reextract_archive(
+        args.archive_dir,
+        workers=args.workers,
+        extract_caption=not args.no_captions,
+        extract_likes_dates=not args.no_likes_dates
+    )
+    
+    output = args.output or f"instagram_reels_reextracted_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"💾 Saved {len(results)} reels to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import functools
+import json
+import os
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (50, 90, 99)
+
+def percentile(sorted_values, pct):
+    """
+    Nearest-rank percentile of an already sorted list
+    
+    Args:
+        sorted_values (list): Values in ascending order
+        pct (float): Percentile between 0 and 100
+    
+    Returns:
+        float: The percentile (0.0 for an empty list)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))  # ceil without float rounding
+    return sorted_values[int(rank) - 1]
+
+def profiled(name):
+    """
+    Decorator timing every call of a scraper method as a span of its profiler
+    
+    Args:
+        name (str): Span name, e.g. 'phase.enrichment'
+    """
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.span(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+class RunProfiler:
+    """Timing spans and counters of one scrape run, shared by the scraper and its workers"""
+    
+    def __init__(self):
+        """Initialize an empty profile"""
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Forget all spans and counters and restart the run clock"""
+        with self._lock:
+            self.spans = {}     # span name -> list of durations in seconds
+            self.counters = {}  # counter name -> count
+            self.started_at = datetime.now().isoformat()
+            self._start = time.perf_counter()
+    
+    @contextmanager
+    def span(self, name):
+        """
+        Time the enclosed block under name
+        
+        Args:
+            name (str): Span name, e.g. 'phase.grid_extraction' or 'webdriver.get'
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+    
+    def add(self, name, seconds):
+        """Record one duration for a span"""
+        with self._lock:
+            self.spans.setdefault(name, []).append(seconds)
+    
+    def count(self, name, n=1):
+        """Increase a counter (round-trips, sleeps, retries, timeouts...)"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+    
+    def sleep(self, seconds, reason="sleep"):
+        """
+        Sleep and record it, so fixed waits show up in the report
+        
+        Args:
+            seconds (float): Seconds to sleep
+            reason (str): Span name suffix, e.g. 'login_poll' or 'scroll_delay'
+        """
+        if seconds <= 0:
+            return
+        self.count('sleeps')
+        with self.span(f"sleep.{reason}"):
+            time.sleep(seconds)
+    
+    def instrument_driver(self, driver):
+        """
+        Time every WebDriver round-trip of a driver
+        
+        All commands, including those of WebElements, go through driver.execute,
+        so wrapping it once covers page loads, scripts and element lookups.
+        
+        Args:
+            driver: Selenium WebDriver instance
+        """
+        if getattr(driver, '_profiler_instrumented', False):
+            return
+        
+        execute = driver.execute
+        profiler = self
+        
+        def profiled_execute(driver_command, params=None):
+            profiler.count('webdriver_round_trips')
+            with profiler.span(f"webdriver.{driver_command}"):
+                return execute(driver_command, params)
+        
+        driver.execute = profiled_execute
+        driver._profiler_instrumented = True
+    
+    def merge(self, other):
+        """Fold the spans and counters of another profiler (e.g. an enrichment worker) into this one"""
+        with other._lock:
+            spans = {name: list(durations) for name, durations in other.spans.items()}
+            counters = dict(other.counters)
+        
+        with self._lock:
+            for name, durations in spans.items():
+                self.spans.setdefault(name, []).extend(durations)
+            for name, value in counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+    
+    def report(self):
+        """
+        Summarize the run
+        
+        Returns:
+            dict: Wall time, counters and per-span count, total, mean, p50/p90/p99 and max seconds
+        """
+        with self._lock:
+            spans = {name: sorted(durations) for name, durations in self.spans.items()}
+            counters = dict(self.counters)
+            wall = time.perf_counter() - self._start
+            started_at = self.started_at
+        
+        summary = {}
+        for name, durations in sorted(spans.items(), key=lambda item: -sum(item[1])):
+            total = sum(durations)
+            entry = {
+                'count': len(durations),
+                'total_seconds': round(total, 4),
+                'mean_seconds': round(total / len(durations), 4),
+            }
+            for pct in PERCENTILES:
+                entry[f'p{pct}_seconds'] = round(percentile(durations, pct), 4)
+            entry['max_seconds'] = round(durations[-1], 4)
+            summary[name] = entry
+        
+        return {
+            'started_at': started_at,
+            'wall_seconds': round(wall, 3),
+            'counters': counters,
+            'spans': summary,
+        }
+    
+    def save_report(self, filepath):
+        """
+        Write the report as JSON
+        
+        Returns:
+            str: Path of the report file, or None on failure
+        """
+        try:
+            directory = os.path.dirname(filepath)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(self.report(), f, indent=2)
+            logger.info(f"⏱️ Timing report saved to {filepath}")
+            return filepath
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to save timing report: {e}")
+            return None
+    
+    def log_summary(self, top=8):
+        """Log the phases and the slowest spans of the run"""
+        report = self.report()
+        if not report['spans']:
+            return
+        
+        logger.info(f"⏱️ Run profile: {report['wall_seconds']:.1f}s wall, "
+                    + ", ".join(f"{name} {value}" for name, value in sorted(report['counters'].items())))
+        for name, entry in list(report['spans'].items())[:top]:
+            logger.info(f"   {name}: {entry['count']}x, total {entry['total_seconds']:.2f}s, "
+                        f"p50 {entry['p50_seconds'] * 1000:.0f}ms, p90 {entry['p90_seconds'] * 1000:.0f}ms, "
+                        f"p99 {entry['p99_seconds'] * 1000:.0f}ms")
@@ -0,0 +1,147 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+import logging
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Seconds each cached field stays fresh (None = never expires)
+DEFAULT_FIELD_TTLS = {
+    'caption': None,        # Captions are fixed once posted
+    'post_date_raw': None,
+    'post_date': None,      # Stored as an absolute date, so it does not drift
+    'likes': 6 * 60 * 60,   # Likes keep growing, refresh them every 6 hours
+}
+
+# Fields whose empty value is a real result (a reel posted without a caption), not a failed extraction
+EMPTY_VALUE_FIELDS = {'caption'}
+
+SHORTCODE_PATTERN = re.compile(r'/(?:reel|reels|p)/([A-Za-z0-9_-]+)')
+
+class ReelDetailCache:
+    """SQLite cache of reel page details keyed by reel shortcode, with a TTL per field"""
+    
+    def __init__(self, db_path, field_ttls=None):
+        """
+        Open (or create) the cache database
+        
+        Args:
+            db_path (str): Path of the SQLite file
+            field_ttls (dict): Field -> seconds before the cached value is stale (None = forever),
+                               merged over DEFAULT_FIELD_TTLS
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.db_path = db_path
+        self.field_ttls = dict(DEFAULT_FIELD_TTLS)
+        if field_ttls:
+            self.field_ttls.update(field_ttls)
+        
+        self.hits = 0
+        self.misses = 0
+        
+        # Enrichment workers share one cache, so the connection is guarded by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS reel_details ("
+            "shortcode TEXT NOT NULL, field TEXT NOT NULL, value TEXT, updated_at REAL NOT NULL, "
+            "PRIMARY KEY (shortcode, field))"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def shortcode_from_url(reel_url):
+        """
+        Extract the shortcode from a reel URL such as https://www.instagram.com/reel/ABC123/
+        
+        Returns:
+            str: The shortcode, or None if the URL has none
+        """
+        if not reel_url:
+            return None
+        match = SHORTCODE_PATTERN.search(reel_url)
+        return match.group(1) if match else None
+    
+    def get(self, reel_url, fields):
+        """
+        Read the fresh cached values of a reel
+        
+        Args:
+            reel_url (str): URL of the reel
+            fields (iterable): Fields wanted
+        
+        Returns:
+            dict: Field -> cached value, only for fields that are cached and not expired
+        """
+        shortcode = self.shortcode_from_url(reel_url)
+        fields = list(fields)
+        if not shortcode or not fields:
+            return {}
+        
+        placeholders = ",".join("?" * len(fields))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT field, value, updated_at FROM reel_details WHERE shortcode = ? AND field IN ({placeholders})",
+                [shortcode] + fields
+            ).fetchall()
+        
+        now = time.time()
+        fresh = {}
+        for field, value, updated_at in rows:
+            ttl = self.field_ttls.get(field)
+            if ttl is None or now - updated_at < ttl:
+                fresh[field] = value
+        
+        with self._lock:
+            if len(fresh) == len(fields):
+                self.hits += 1
+            else:
+                self.misses += 1
+        return fresh
+    
+    def put(self, reel_url, values):
+        """
+        Store extracted values of a reel
+        
+        "N/A" and None values are skipped so a failed extraction is retried next time.
+        Empty values are skipped too, except for EMPTY_VALUE_FIELDS: an empty caption is
+        cached, so a reel without one is not visited again on every run.
+        
+        Args:
+            reel_url (str): URL of the reel
+            values (dict): Field -> extracted value
+        """
+        shortcode = self.shortcode_from_url(reel_url)
+        if not shortcode:
+            return
+        
+        now = time.time()
+        rows = [
+            (shortcode, field, str(value), now)
+            for field, value in values.items()
+            if field in self.field_ttls and value not in (None, "N/A") and (value != "" or field in EMPTY_VALUE_FIELDS)
+        ]
+        if not rows:
+            return
+        
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO reel_details (shortcode, field, value, updated_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        logger.info(f"🗄️ Reel cache: {self.hits} hits, {self.misses} misses ({self.db_path})")
@@ -5,32 +5,434 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import time
 import re
 import json
 import logging
-from datetime import datetime, timedelta
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from datetime import datetime
 import os
 from tkinter import filedialog
 import tkinter as tk
+from InstagramCheckpoint import ScrapeCheckpoint
+from InstagramReelCache import ReelDetailCache
+from InstagramPageArchive import PageArchive
+from InstagramProfiler import RunProfiler, profiled
+from InstagramCountParser import parse_count
+from InstagramDateParser import RelativeDateParser
+from InstagramHtmlExtractor import ReelExtractor, PAGE_SNAPSHOT_QUERIES, snapshot_query, snapshot_from_html
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Collects every reel anchor of the grid in one round-trip: href, page position
+# and the short texts / overlay labels of the link, its parent and grandparent.
+# Returned anchors are tagged with data-irs-seen so that an incremental call
+# (arguments[0] === true) only returns tiles appended since the previous call.
+GRID_SNAPSHOT_SCRIPT = """
+const incremental = arguments[0] === true;
+const root = document.querySelector('main') || document;
+const overlaySelectors = [
+    "[aria-label*='views']",
+    "[title*='views']",
+    "div[style*='position: absolute'] span",
+    "div[class*='overlay'] span"
+];
+const textOf = (el) => (el.innerText || el.textContent || '').trim();
+const shortTexts = (container, selector) => Array.from(container.querySelectorAll(selector))
+    .map(textOf)
+    .filter(text => text && text.length <= 20);
+const overlays = (container) => overlaySelectors.flatMap(selector =>
+    Array.from(container.querySelectorAll(selector)).map(el => ({
+        label: el.getAttribute('aria-label') || el.getAttribute('title') || textOf(el),
+        text: textOf(el)
+    })));
+
+const links = Array.from(root.querySelectorAll("a[href*='/reel/']"))
+    .filter(link => !incremental || link.getAttribute('data-irs-seen') !== link.href);
+
+return links.map(link => {
+    link.setAttribute('data-irs-seen', link.href);
+    const rect = link.getBoundingClientRect();
+    const parent = link.parentElement;
+    const grandparent = parent ? parent.parentElement : null;
+    return {
+        href: link.href,
+        x: rect.left + window.scrollX,
+        y: rect.top + window.scrollY,
+        width: rect.width,
+        height: rect.height,
+        containers: [link, parent, grandparent].filter(Boolean).map(container => ({
+            spans: shortTexts(container, 'span'),
+            divs: shortTexts(container, 'div'),
+            overlays: overlays(container)
+        }))
+    };
+});
+"""
+
+class _ScriptCondition:
+    """Expected condition that checks the DOM with one script call (no implicit-wait stalls)"""
+    
+    script = "return false;"
+    
+    def __call__(self, driver):
+        try:
+            return bool(driver.execute_script(self.script))
+        except WebDriverException:
+            return False
+
+class caption_node_present(_ScriptCondition):
+    """Expected condition: a caption candidate with text is in the DOM"""
+    
+    script = """
+    const meta = document.querySelector("meta[property='og:description']");
+    if (meta && (meta.getAttribute('content') || '').length > 20) return true;
+    return Array.from(document.querySelectorAll("h1, div._a9zs span, article span[dir='auto']"))
+        .some(el => (el.innerText || el.textContent || '').trim().length > 15);
+    """
+
+class post_datetime_present(_ScriptCondition):
+    """Expected condition: a time element with a datetime attribute is in the DOM"""
+    
+    script = "return document.querySelector('time[datetime]') !== null;"
+
+class likes_anchor_present(_ScriptCondition):
+    """Expected condition: a likes link or a 'N likes' text is in the DOM"""
+    
+    script = """
+    if (document.querySelector("a[href*='/liked_by/']")) return true;
+    return Array.from(document.querySelectorAll('section span, article span'))
+        .some(el => /\\d[\\d,.]*\\s*[KMB]?\\s+likes?/i.test(el.innerText || el.textContent || ''));
+    """
+
+class reel_grid_present(_ScriptCondition):
+    """Expected condition: at least one reel link of the profile grid is in the DOM"""
+    
+    script = "return document.querySelector(\"a[href*='/reel/']\") !== null;"
+
+class login_state_known(_ScriptCondition):
+    """Expected condition: the page shows the login form ('logged_out') or the logged-in navigation ('logged_in')"""
+    
+    script = """
+    if (document.querySelector("input[name='username']")) return 'logged_out';
+    if (document.querySelector("svg[aria-label='Home'], svg[aria-label='New post'], a[href*='/direct/inbox']")) return 'logged_in';
+    return null;
+    """
+    
+    def __call__(self, driver):
+        try:
+            return driver.execute_script(self.script)
+        except WebDriverException:
+            return None
+
+# Saved login cookies live in the user's home, outside any project or output folder,
+# so they cannot end up in a commit or a shared results directory
+DEFAULT_COOKIE_JAR = os.path.join(os.path.expanduser("~"), ".instagram_reels_scraper", "cookies.json")
+
+# Requests blocked in data-only mode: nothing the extractors read comes from them
+DATA_ONLY_BLOCKED_URLS = [
+    # Reel videos and audio
+    "*.mp4*", "*.m4v*", "*.m4a*", "*.webm*",
+    # Posters, thumbnails and avatars
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.heic*", "*.ico*",
+    # Fonts
+    "*.woff*", "*.ttf*", "*.otf*",
+    # Third-party trackers and client event logging
+    "*connect.facebook.net*", "*facebook.com/tr*", "*google-analytics.com*", "*googletagmanager.com*",
+    "*doubleclick.net*", "*/logging_client_events*", "*/ajax/bz*", "*graph.instagram.com/logging*",
+]
+
+# Bytes the current page has transferred so far, from the browser's Resource Timing entries
+TRANSFER_SIZE_SCRIPT = """
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+let bytes = 0;
+for (const entry of entries) bytes += entry.transferSize || entry.encodedBodySize || 0;
+return {bytes: bytes, requests: entries.length};
+"""
+
+# Reads text and attributes of every element matched by the queries in arguments[0]
+# in one call, so extractors do not pay one WebDriver round-trip per element
+PAGE_SNAPSHOT_SCRIPT = """
+const snapshot = {};
+const textOf = node => (node && node.getClientRects && node.getClientRects().length)
+    ? (node.innerText || '').trim() : '';
+
+for (const query of arguments[0]) {
+    let nodes = [];
+    try {
+        if (query.xpath) {
+            const result = document.evaluate(query.xpath, document, null,
+                                             XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+        } else {
+            nodes = Array.from(document.querySelectorAll(query.css));
+        }
+    } catch (e) {
+        nodes = [];
+    }
+    
+    snapshot[query.key] = nodes.map(node => {
+        const record = {
+            text: textOf(node),
+            title: node.getAttribute('title'),
+            datetime: node.getAttribute('datetime'),
+            content: node.getAttribute('content'),
+        };
+        if (query.parent) record.parent_text = textOf(node.parentElement);
+        return record;
+    });
+}
+return snapshot;
+"""
+
+class _LiveElementRecord:
+    """Page snapshot record read from a live element on demand (used when the snapshot script fails)"""
+    
+    def __init__(self, element):
+        self.element = element
+    
+    def get(self, name):
+        """Read one field: text, parent_text or an attribute"""
+        try:
+            if name == 'text':
+                return self.element.text.strip()
+            if name == 'parent_text':
+                return self.element.find_element(By.XPATH, "..").text.strip()
+            return self.element.get_attribute(name)
+        except Exception:
+            return None
+
+class PolitenessBudget:
+    """Shared pacing for reel page visits, used by every enrichment worker"""
+    
+    def __init__(self, min_interval=1.0):
+        """
+        Initialize the politeness budget
+        
+        Args:
+            min_interval (float): Minimum seconds between two page visits across all workers
+        """
+        self.min_interval = max(0.0, float(min_interval))
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def acquire(self):
+        """Block until the caller is allowed to start its next page visit"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        
+        wait = slot - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+class ReelIndex:
+    """Ordered, de-duplicated collection of reels shared by the scroll loops and final clean-up"""
+    
+    def __init__(self, reels=None):
+        """
+        Initialize the reel index
+        
+        Args:
+            reels (iterable): Optional reels to add in order
+        """
+        self._reels = {}  # dedup key -> reel, keeps insertion order
+        self._seen_views = set()
+        if reels:
+            self.extend(reels)
+    
+    @staticmethod
+    def key_for(reel):
+        """Return the dedup key of a reel: its URL, or its views when there is no URL"""
+        url = reel.get('url', '')
+        if url:
+            return ('url', url)
+        views = reel.get('views', '')
+        if views:
+            return ('views', views)
+        return None
+    
+    def add(self, reel):
+        """
+        Add a reel unless it is already indexed
+        
+        Returns:
+            bool: True if the reel was new and added
+        """
+        key = self.key_for(reel)
+        if key is None or key in self._reels:
+            return False
+        
+        # A reel without URL is only new if no indexed reel shows the same views
+        if key[0] == 'views' and key[1] in self._seen_views:
+            return False
+        
+        self._reels[key] = reel
+        views = reel.get('views', '')
+        if views:
+            self._seen_views.add(views)
+        return True
+    
+    def extend(self, reels):
+        """Add several reels and return how many were new"""
+        return sum(1 for reel in reels if self.add(reel))
+    
+    def merge(self, reel):
+        """
+        Fill in the fields an indexed copy of a reel is missing
+        
+        A fresh grid capture has current views but no details, while a saved copy
+        of the same reel may already carry its caption, likes and dates.
+        
+        Returns:
+            bool: True if an indexed copy was found and updated
+        """
+        key = self.key_for(reel)
+        known = self._reels.get(key) if key else None
+        if known is None or known is reel:
+            return False
+        
+        for field, value in reel.items():
+            if known.get(field) in (None, '', 'N/A'):
+                known[field] = value
+        return True
+    
+    def has_url(self, url):
+        """Check whether a reel URL is already indexed"""
+        return ('url', url) in self._reels
+    
+    def trim(self, limit):
+        """Keep only the first limit reels in insertion order"""
+        if len(self._reels) <= limit:
+            return
+        
+        kept = list(self._reels.items())[:limit]
+        self._reels = dict(kept)
+        self._seen_views = {reel.get('views', '') for _, reel in kept if reel.get('views', '')}
+    
+    def to_list(self):
+        """Return the indexed reels as a list in insertion order"""
+        return list(self._reels.values())
+    
+    def __contains__(self, reel):
+        key = self.key_for(reel)
+        return key is not None and key in self._reels
+    
+    def __len__(self):
+        return len(self._reels)
+    
+    def __iter__(self):
+        return iter(list(self._reels.values()))
+
+class ReelStreamWriter:
+    """Append-only JSONL sink that writes every finished reel as one line"""
+    
+    def __init__(self, filepath, flush_every=1, fsync_every=10):
+        """
+        Open the stream file for appending
+        
+        Args:
+            filepath (str): Path of the .jsonl file
+            flush_every (int): Flush the file buffer after this many records
+            fsync_every (int): Force records to disk after this many records (0 disables fsync)
+        """
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.filepath = filepath
+        self.flush_every = max(1, int(flush_every))
+        self.fsync_every = max(0, int(fsync_every))
+        self.records_written = 0
+        self._file = open(filepath, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+    
+    def write(self, record):
+        """Append one reel record as a JSON line"""
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            self.records_written += 1
+            
+            if self.records_written % self.flush_every == 0:
+                self._file.flush()
+            if self.fsync_every and self.records_written % self.fsync_every == 0:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+    
+    def close(self):
+        """Flush, sync and close the stream file"""
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            finally:
+                self._file.close()
+                self._file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 class InstagramReelsScraper:
-    def __init__(self, headless=False, user_agent=None):
+    def __init__(self, headless=False, user_agent=None, grid_snapshot=True, adaptive_wait=True, html_extraction=False,
+                 profile_dir=None, cookie_jar=None, data_only=False, base_url="https://www.instagram.com",
+                 offline=False, chromedriver_path=None):
         """
         Initialize the Instagram Reels scraper
         
         Args:
             headless (bool): Run browser in headless mode
             user_agent (str): Custom user agent string
+            grid_snapshot (bool): Read the reels grid with one script call instead of per-element lookups
+            adaptive_wait (bool): After a scroll, wait only until the grid grows instead of sleeping the full delay
+            html_extraction (bool): Fetch each reel page's source once and parse it in Python
+                                    instead of running the snapshot script in the browser
+            profile_dir (str): Persistent Chrome user data directory (keeps the login, cookies and cache)
+            cookie_jar (str): JSON file the login cookies are saved to and restored from
+            data_only (bool): Block images, video, fonts and trackers (the extractors only read text)
+            base_url (str): Site root the profile and login URLs are built on (a local fixture site in benchmarks)
+            offline (bool): Never go online for ChromeDriver: skip the connectivity check and the
+                            webdriver-manager download and only use a ChromeDriver already on this machine
+            chromedriver_path (str): ChromeDriver executable to use; implies offline
         """
         self.driver = None
         self.headless = headless
         self.user_agent = user_agent
+        self.profile_dir = profile_dir
+        self.cookie_jar = cookie_jar
+        self.data_only = data_only
+        self.base_url = base_url.rstrip('/')
+        self.chromedriver_path = chromedriver_path
+        self.offline = offline or bool(chromedriver_path)
+        self.grid_snapshot = grid_snapshot
+        self.adaptive_wait = adaptive_wait
+        self.html_extraction = html_extraction
+        self.wait_report = {}  # condition name -> readiness timings versus the fixed sleep it replaced
+        self.transfer_report = {}  # reel URL -> bytes and requests transferred by its page
+        self.profiler = RunProfiler()  # Phase spans, WebDriver round-trips, sleeps and retries
+        self.stream_writer = None  # Optional ReelStreamWriter receiving finished reels
+        self.checkpoint = None  # Optional ScrapeCheckpoint of the running job
+        self.detail_cache = None  # Optional ReelDetailCache consulted before visiting reel pages
+        self.page_archive = None  # Optional PageArchive keeping the source of every visited page
+        self.date_parser = RelativeDateParser()  # Reset at the start of every scrape run
+        self._report_lock = threading.Lock()
+        self._grid_seen_urls = set()  # Reel URLs already returned by the grid extraction
+        self._page_snapshot = None  # Texts and attributes of the current reel page load
+        self._page_snapshot_failed = False
         
     def check_internet_connectivity(self):
         """Check if internet connection is available for ChromeDriver download"""
@@ -100,11 +502,90 @@ class InstagramReelsScraper:
         
         return potential_paths
 
+    def _build_chrome_options(self):
+        """Build the Chrome options shared by every driver setup strategy"""
+        options = Options()
+        
+        if self.headless:
+            options.add_argument("--headless")
+            logger.info("👻 Running in headless mode")
+        
+        # A persistent profile keeps the login and the browser cache between runs
+        if self.profile_dir:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            options.add_argument(f"--user-data-dir={os.path.abspath(self.profile_dir)}")
+            logger.info(f"👤 Using browser profile: {self.profile_dir}")
+        
+        options.add_argument("--start-maximized")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-plugins")
+        
+        if self.user_agent:
+            options.add_argument(f"--user-agent={self.user_agent}")
+        else:
+            options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        
+        options.add_argument("--memory-pressure-off")
+        options.add_argument("--max_old_space_size=4096")
+        options.add_argument("--log-level=3")
+        options.add_experimental_option("excludeSwitches", ["enable-logging"])
+        
+        # Data-only browsing: no images or autoplay here; video, fonts and trackers are
+        # stopped by the DATA_ONLY_BLOCKED_URLS patterns set on every tab in _prepare_tab
+        if self.data_only:
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_argument("--autoplay-policy=user-gesture-required")
+            options.add_argument("--mute-audio")
+            logger.info("🪶 Data-only mode: images, video, fonts and trackers are blocked")
+        
+        return options
+    
+    def _configure_driver(self):
+        """Apply the settings every freshly started driver needs"""
+        self.profiler.instrument_driver(self.driver)
+        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        self.driver.implicitly_wait(10)
+        self.driver.set_page_load_timeout(30)
+        self._prepare_tab()
+    
+    def _prepare_tab(self):
+        """
+        Apply the per-tab DevTools settings to the current tab
+        
+        Request blocking and the resource timing buffer belong to one tab, so this runs
+        for the first tab and again for every tab opened for a reel page.
+        """
+        try:
+            # Keep every request of a reel page in the timeline used by the transfer report
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": "performance.setResourceTimingBufferSize(5000);"
+            })
+            if self.data_only:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": DATA_ONLY_BLOCKED_URLS})
+        except Exception as e:
+            logger.debug(f"DevTools tab settings unavailable: {e}")
+    
+    @profiled('phase.setup_driver')
     def setup_driver(self):
         """Setup Chrome driver with connectivity check and improved network handling"""
         try:
             logger.info("🔧 Setting up Chrome driver...")
             
+            if self.offline:
+                logger.info("📴 Offline mode: skipping the connectivity check and ChromeDriver download")
+                return self._setup_local_driver(self._build_chrome_options())
+            
             # First check internet connectivity
             if not self.check_internet_connectivity():
                 logger.error("❌ Cannot download ChromeDriver without internet access")
@@ -116,32 +597,7 @@ class InstagramReelsScraper:
                 logger.error("   5. Clear DNS cache: ipconfig /flushdns")
                 return False
             
-            # Chrome options
-            options = Options()
-            
-            if self.headless:
-                options.add_argument("--headless")
-                logger.info("👻 Running in headless mode")
-            
-            options.add_argument("--start-maximized")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-plugins")
-            
-            if self.user_agent:
-                options.add_argument(f"--user-agent={self.user_agent}")
-            else:
-                options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            
-            options.add_argument("--memory-pressure-off")
-            options.add_argument("--max_old_space_size=4096")
-            options.add_argument("--log-level=3")
-            options.add_experimental_option("excludeSwitches", ["enable-logging"])
+            options = self._build_chrome_options()
             
             # Configure webdriver-manager for better connectivity
             os.environ['WDM_LOG_LEVEL'] = '0'  # Show detailed logs
@@ -190,9 +646,7 @@ class InstagramReelsScraper:
                         logger.info(f"✅ Internet download successful using {strategy['name']}!")
                         
                         # Configure driver settings
-                        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                        self.driver.implicitly_wait(10)
-                        self.driver.set_page_load_timeout(30)
+                        self._configure_driver()
                         
                         logger.info("✅ Chrome driver initialized successfully")
                         return True
@@ -202,7 +656,8 @@ class InstagramReelsScraper:
                         
                         if attempt < max_retries - 1:
                             logger.info(f"🔄 Retrying in {retry_delay} seconds...")
-                            time.sleep(retry_delay)
+                            self.profiler.count('retries')
+                            self.profiler.sleep(retry_delay, 'driver_retry')
                             retry_delay += 2  # Increase delay for next retry
                         else:
                             logger.warning(f"❌ All attempts failed for {strategy['name']}")
@@ -234,109 +689,7 @@ class InstagramReelsScraper:
             
             # NEW: Try LOCAL ChromeDriver as fallback after internet download fails
             logger.info("🔍 Internet download failed, searching for local ChromeDriver...")
-            
-            local_paths = [
-                # Current script directory (recommended location)
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), "chromedriver.exe"),
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), "chromedriver"),
-                
-                # Current working directory
-                os.path.join(os.getcwd(), "chromedriver.exe"),
-                os.path.join(os.getcwd(), "chromedriver"),
-                
-                # Downloads folder (common place for manual downloads)
-                os.path.join(os.path.expanduser("~"), "Downloads", "chromedriver.exe"),
-                os.path.join(os.path.expanduser("~"), "Downloads", "chromedriver"),
-                
-                # Desktop (another common place)
-                os.path.join(os.path.expanduser("~"), "Desktop", "chromedriver.exe"),
-                os.path.join(os.path.expanduser("~"), "Desktop", "chromedriver"),
-                
-                # System PATH locations
-                "C:\\Windows\\System32\\chromedriver.exe",
-                "C:\\Windows\\chromedriver.exe",
-                
-                # Program Files
-                "C:\\Program Files\\chromedriver\\chromedriver.exe",
-                "C:\\Program Files (x86)\\chromedriver\\chromedriver.exe",
-                
-                # Common installation directories
-                "C:\\chromedriver\\chromedriver.exe",
-                "C:\\tools\\chromedriver\\chromedriver.exe",
-                
-                # User-specific paths
-                os.path.join(os.path.expanduser("~"), "chromedriver.exe"),
-                os.path.join(os.path.expanduser("~"), "bin", "chromedriver.exe"),
-                
-                # WebDriver cache directories - ENHANCED
-                *self._find_chromedriver_in_wdm_cache(),
-            ]
-            
-            for driver_path in local_paths:
-                try:
-                    if os.path.exists(driver_path):
-                        logger.info(f"🔧 Found local ChromeDriver: {driver_path}")
-                        
-                        # Test if the local driver works
-                        service = Service(driver_path)
-                        self.driver = webdriver.Chrome(service=service, options=options)
-                        
-                        logger.info("✅ Local ChromeDriver successful!")
-                        
-                        # Configure driver settings
-                        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                        self.driver.implicitly_wait(10)
-                        self.driver.set_page_load_timeout(30)
-                        
-                        logger.info("✅ Chrome driver initialized successfully with local file")
-                        logger.info("💡 Tip: Local ChromeDriver bypassed network issues!")
-                        return True
-                        
-                except Exception as e:
-                    logger.debug(f"Local ChromeDriver at {driver_path} failed: {e}")
-                    continue
-            
-            logger.warning("❌ No working local ChromeDriver found")
-            
-            # Try system PATH (ChromeDriver in environment PATH)
-            logger.info("🔍 Trying system PATH ChromeDriver...")
-            try:
-                self.driver = webdriver.Chrome(options=options)
-                logger.info("✅ System PATH ChromeDriver successful!")
-                
-                # Configure driver settings
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                self.driver.implicitly_wait(10)
-                self.driver.set_page_load_timeout(30)
-                
-                logger.info("✅ Chrome driver initialized successfully from system PATH")
-                return True
-                
-            except Exception as e:
-                logger.warning(f"❌ System PATH ChromeDriver failed: {e}")
-            
-            # Final error message with manual instructions
-            logger.error("🔧 MANUAL CHROMEDRIVER DOWNLOAD (If automatic download keeps failing):")
-            logger.error("   📋 Step-by-step instructions:")
-            logger.error("   1. Check your Chrome version:")
-            logger.error("      - Open Chrome browser")
-            logger.error("      - Go to: chrome://version/")
-            logger.error("      - Note down the version (e.g., 120.0.6099.109)")
-            logger.error("   2. Download matching ChromeDriver:")
-            logger.error("      - Go to: https://chromedriver.chromium.org/downloads")
-            logger.error("      - Download ChromeDriver for your Chrome version")
-            logger.error("      - Choose 'chromedriver_win32.zip' for Windows")
-            logger.error("   3. Extract and place ChromeDriver:")
-            logger.error(f"      - Extract chromedriver.exe from the zip file")
-            logger.error(f"      - Place it in this folder: {os.path.dirname(os.path.abspath(__file__))}")
-            logger.error("   4. Restart the script:")
-            logger.error("      - The script will automatically detect the local ChromeDriver")
-            logger.error("      - No internet connection needed after this!")
-            logger.error("💡 Alternative: Add ChromeDriver to system PATH")
-            logger.error("   - Place chromedriver.exe in C:\\Windows\\System32\\")
-            logger.error("   - Or add ChromeDriver folder to Windows PATH environment variable")
-            
-            return False
+            return self._setup_local_driver(options)
             
         except Exception as e:
             logger.error(f"❌ Failed to setup driver: {e}")
@@ -347,114 +700,139 @@ class InstagramReelsScraper:
             logger.error("   4. Check system date/time")
             return False
 
-    def convert_relative_date_to_formatted_date(self, date_text):
+    def _setup_local_driver(self, options):
         """
-        Convert relative date (like '2 hours ago') to formatted date (like '12 July 2025')
-        Keep existing date formats as-is
+        Start Chrome with a ChromeDriver already on this machine, without any network access
+        
+        Tries the explicit chromedriver_path first, then the usual download locations and the
+        webdriver-manager cache, then the system PATH.
         
         Args:
-            date_text (str): Original date text from Instagram
+            options: Chrome options built by _build_chrome_options
             
         Returns:
-            str: Formatted date string
+            bool: True if the driver started
         """
-        if not date_text or date_text == "N/A":
-            return "N/A"
-        
-        try:
-            # Get current time
-            now = datetime.now()
-            
-            # Clean the text
-            date_text = date_text.strip().lower()
-            
-            # Check if it's already in a date format (contains month names)
-            month_names = [
-                'january', 'february', 'march', 'april', 'may', 'june',
-                'july', 'august', 'september', 'october', 'november', 'december',
-                'jan', 'feb', 'mar', 'apr', 'may', 'jun',
-                'jul', 'aug', 'sep', 'oct', 'nov', 'dec'
-            ]
+        local_paths = [
+            # ChromeDriver passed explicitly
+            *([self.chromedriver_path] if self.chromedriver_path else []),
             
-            # If it already contains a month name, keep it as-is but format it properly
-            if any(month in date_text for month in month_names):
-                # Try to parse and reformat existing date
-                try:
-                    # Handle formats like "July 26", "July 26, 2024", "26 July", etc.
-                    for fmt in ['%B %d', '%b %d', '%d %B', '%d %b', '%B %d, %Y', '%b %d, %Y']:
-                        try:
-                            parsed_date = datetime.strptime(date_text.title(), fmt)
-                            # If no year specified, assume current year
-                            if parsed_date.year == 1900:
-                                parsed_date = parsed_date.replace(year=now.year)
-                            return parsed_date.strftime('%d %B %Y')
-                        except:
-                            continue
+            # Current script directory (recommended location)
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "chromedriver.exe"),
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "chromedriver"),
+            
+            # Current working directory
+            os.path.join(os.getcwd(), "chromedriver.exe"),
+            os.path.join(os.getcwd(), "chromedriver"),
+            
+            # Downloads folder (common place for manual downloads)
+            os.path.join(os.path.expanduser("~"), "Downloads", "chromedriver.exe"),
+            os.path.join(os.path.expanduser("~"), "Downloads", "chromedriver"),
+            
+            # Desktop (another common place)
+            os.path.join(os.path.expanduser("~"), "Desktop", "chromedriver.exe"),
+            os.path.join(os.path.expanduser("~"), "Desktop", "chromedriver"),
+            
+            # System PATH locations
+            "C:\\Windows\\System32\\chromedriver.exe",
+            "C:\\Windows\\chromedriver.exe",
+            
+            # Program Files
+            "C:\\Program Files\\chromedriver\\chromedriver.exe",
+            "C:\\Program Files (x86)\\chromedriver\\chromedriver.exe",
+            
+            # Common installation directories
+            "C:\\chromedriver\\chromedriver.exe",
+            "C:\\tools\\chromedriver\\chromedriver.exe",
+            
+            # User-specific paths
+            os.path.join(os.path.expanduser("~"), "chromedriver.exe"),
+            os.path.join(os.path.expanduser("~"), "bin", "chromedriver.exe"),
+            
+            # WebDriver cache directories - ENHANCED
+            *self._find_chromedriver_in_wdm_cache(),
+        ]
+        
+        for driver_path in local_paths:
+            try:
+                if os.path.exists(driver_path):
+                    logger.info(f"🔧 Found local ChromeDriver: {driver_path}")
                     
-                    # If parsing fails, return the original text cleaned up
-                    return date_text.title()
-                except:
-                    return date_text.title()
-            
-            # Handle relative dates
-            target_date = now
-            
-            # Minutes ago
-            minutes_match = re.search(r'(\d+)\s*(?:minute|minutes|min|mins?)\s*ago', date_text)
-            if minutes_match:
-                minutes = int(minutes_match.group(1))
-                target_date = now - timedelta(minutes=minutes)
-            
-            # Hours ago
-            elif re.search(r'(\d+)\s*(?:hour|hours|hr|hrs?)\s*ago', date_text):
-                hours_match = re.search(r'(\d+)\s*(?:hour|hours|hr|hrs?)\s*ago', date_text)
-                hours = int(hours_match.group(1))
-                target_date = now - timedelta(hours=hours)
-            
-            # Days ago
-            elif re.search(r'(\d+)\s*(?:day|days|d)\s*ago', date_text):
-                days_match = re.search(r'(\d+)\s*(?:day|days|d)\s*ago', date_text)
-                days = int(days_match.group(1))
-                target_date = now - timedelta(days=days)
-            
-            # Weeks ago
-            elif re.search(r'(\d+)\s*(?:week|weeks|w)\s*ago', date_text):
-                weeks_match = re.search(r'(\d+)\s*(?:week|weeks|w)\s*ago', date_text)
-                weeks = int(weeks_match.group(1))
-                target_date = now - timedelta(weeks=weeks)
-            
-            # Months ago (approximate)
-            elif re.search(r'(\d+)\s*(?:month|months|mo)\s*ago', date_text):
-                months_match = re.search(r'(\d+)\s*(?:month|months|mo)\s*ago', date_text)
-                months = int(months_match.group(1))
-                target_date = now - timedelta(days=months * 30)  # Approximate
-            
-            # Years ago
-            elif re.search(r'(\d+)\s*(?:year|years|y)\s*ago', date_text):
-                years_match = re.search(r'(\d+)\s*(?:year|years|y)\s*ago', date_text)
-                years = int(years_match.group(1))
-                target_date = now - timedelta(days=years * 365)  # Approximate
-            
-            # Special cases
-            elif 'yesterday' in date_text:
-                target_date = now - timedelta(days=1)
-            elif 'today' in date_text or 'now' in date_text:
-                target_date = now
-            else:
-                # If we can't parse it, return the original text
-                logger.warning(f"Could not parse date: {date_text}")
-                return date_text
+                    # Test if the local driver works
+                    service = Service(driver_path)
+                    self.driver = webdriver.Chrome(service=service, options=options)
+                    
+                    logger.info("✅ Local ChromeDriver successful!")
+                    
+                    # Configure driver settings
+                    self._configure_driver()
+                    
+                    logger.info("✅ Chrome driver initialized successfully with local file")
+                    logger.info("💡 Tip: Local ChromeDriver bypassed network issues!")
+                    return True
+                    
+            except Exception as e:
+                logger.debug(f"Local ChromeDriver at {driver_path} failed: {e}")
+                continue
+        
+        logger.warning("❌ No working local ChromeDriver found")
+        
+        # Try system PATH (ChromeDriver in environment PATH)
+        logger.info("🔍 Trying system PATH ChromeDriver...")
+        try:
+            self.driver = webdriver.Chrome(options=options)
+            logger.info("✅ System PATH ChromeDriver successful!")
             
-            # Format the target date as "12 July 2025"
-            formatted_date = target_date.strftime('%d %B %Y')
+            # Configure driver settings
+            self._configure_driver()
             
-            logger.debug(f"Converted '{date_text}' to '{formatted_date}'")
-            return formatted_date
+            logger.info("✅ Chrome driver initialized successfully from system PATH")
+            return True
             
         except Exception as e:
-            logger.warning(f"Error converting date '{date_text}': {e}")
-            return date_text  # Return original if conversion fails
+            logger.warning(f"❌ System PATH ChromeDriver failed: {e}")
+        
+        # Final error message with manual instructions
+        logger.error("🔧 MANUAL CHROMEDRIVER DOWNLOAD (If automatic download keeps failing):")
+        logger.error("   📋 Step-by-step instructions:")
+        logger.error("   1. Check your Chrome version:")
+        logger.error("      - Open Chrome browser")
+        logger.error("      - Go to: chrome://version/")
+        logger.error("      - Note down the version (e.g., 120.0.6099.109)")
+        logger.error("   2. Download matching ChromeDriver:")
+        logger.error("      - Go to: https://chromedriver.chromium.org/downloads")
+        logger.error("      - Download ChromeDriver for your Chrome version")
+        logger.error("      - Choose 'chromedriver_win32.zip' for Windows")
+        logger.error("   3. Extract and place ChromeDriver:")
+        logger.error(f"      - Extract chromedriver.exe from the zip file")
+        logger.error(f"      - Place it in this folder: {os.path.dirname(os.path.abspath(__file__))}")
+        logger.error("   4. Restart the script:")
+        logger.error("      - The script will automatically detect the local ChromeDriver")
+        logger.error("      - No internet connection needed after this!")
+        logger.error("💡 Alternative: Add ChromeDriver to system PATH")
+        logger.error("   - Place chromedriver.exe in C:\\Windows\\System32\\")
+        logger.error("   - Or add ChromeDriver folder to Windows PATH environment variable")
+        
+        return False
+
+    @profiled('extract.date_conversion')
+    def convert_relative_date_to_formatted_date(self, date_text):
+        """
+        Convert relative date (like '2 hours ago') to formatted date (like '12 July 2025')
+        Keep existing date formats as-is
+        
+        Relative dates are resolved against the reference time of the current run,
+        so every reel of one run is dated from the same "now".
+        
+        Args:
+            date_text (str): Original date text from Instagram
+            
+        Returns:
+            str: Formatted date string
+        """
+        return self.date_parser.parse(date_text)
 
+    @profiled('phase.manual_login')
     def manual_login(self, timeout=300):
         """
         Manual login to Instagram with improved error handling
@@ -467,7 +845,7 @@ class InstagramReelsScraper:
         """
         try:
             logger.info("🔐 Opening Instagram login page...")
-            self.driver.get("https://www.instagram.com/accounts/login/")
+            self.driver.get(f"{self.base_url}/accounts/login/")
             
             # Wait for login page to load
             WebDriverWait(self.driver, 15).until(
@@ -490,7 +868,7 @@ class InstagramReelsScraper:
             
             while time.time() - start_time < timeout:
                 try:
-                    time.sleep(3)
+                    self.profiler.sleep(3, 'login_poll')
                     
                     current_url = self.driver.current_url
                     logger.debug(f"Current URL: {current_url}")
@@ -539,6 +917,110 @@ class InstagramReelsScraper:
             logger.error(f"❌ Login error: {e}")
             return False
     
+    @profiled('phase.login')
+    def ensure_login(self, timeout=300, allow_manual=True):
+        """
+        Log in by restoring the saved session, falling back to manual login only when it is invalid
+        
+        Args:
+            timeout (int): Maximum time to wait for a manual login (seconds)
+            allow_manual (bool): Open the login page when no valid session exists
+                                 (False for unattended runs, which then fail fast)
+        
+        Returns:
+            bool: True if the browser is logged in
+        """
+        cookies = self._load_cookie_jar()
+        if cookies:
+            self._restore_session_cookies(cookies, f"{self.base_url}/")
+        
+        # Only a saved session is worth checking; without one go straight to the login page
+        if (cookies or self.profile_dir) and self.is_logged_in():
+            logger.info("✅ Restored saved Instagram session")
+            self.save_session_cookies()  # Keep the refreshed cookies for the next run
+            return True
+        
+        if not allow_manual:
+            logger.error("❌ No valid saved session and manual login is disabled")
+            return False
+        
+        if not self.manual_login(timeout):
+            return False
+        
+        self.save_session_cookies()
+        return True
+    
+    def is_logged_in(self, timeout=10):
+        """
+        Check whether the browser holds a valid Instagram session (one page load)
+        
+        Args:
+            timeout (int): Maximum time to wait for the home page to show its login state
+        
+        Returns:
+            bool: True if the home page shows the logged-in navigation
+        """
+        try:
+            self.driver.get(f"{self.base_url}/")
+            if not self.driver.get_cookie('sessionid'):
+                return False
+            
+            state = WebDriverWait(self.driver, timeout).until(login_state_known())
+            return state == 'logged_in' and 'accounts/login' not in self.driver.current_url
+        except TimeoutException:
+            logger.warning("⚠️ Could not tell whether the saved session is valid")
+            return False
+        except Exception as e:
+            logger.warning(f"Session check failed: {e}")
+            return False
+    
+    def save_session_cookies(self):
+        """
+        Save the session cookies to the cookie jar (if one is configured)
+        
+        Returns:
+            bool: True if the cookies were saved
+        """
+        if not self.cookie_jar:
+            return False
+        
+        cookies = self._get_session_cookies()
+        if not cookies:
+            return False
+        
+        try:
+            directory = os.path.dirname(self.cookie_jar)
+            if directory:
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            
+            # The cookies grant access to the account, so keep the file private
+            tmp_path = f"{self.cookie_jar}.tmp"
+            with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+                json.dump({'saved_at': datetime.now().isoformat(), 'cookies': cookies}, f)
+            os.replace(tmp_path, self.cookie_jar)
+            
+            logger.info(f"🍪 Saved {len(cookies)} session cookies to {self.cookie_jar}")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to save session cookies: {e}")
+            return False
+    
+    def _load_cookie_jar(self):
+        """Read the cookies saved by save_session_cookies (empty list if there are none)"""
+        if not self.cookie_jar or not os.path.exists(self.cookie_jar):
+            return []
+        
+        try:
+            with open(self.cookie_jar, 'r', encoding='utf-8') as f:
+                cookies = json.load(f).get('cookies', [])
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable cookie jar {self.cookie_jar}: {e}")
+            return []
+        
+        # Expired cookies are rejected by the browser anyway
+        now = time.time()
+        return [cookie for cookie in cookies if cookie.get('expiry', now + 1) > now]
+    
     def _element_exists(self, selector, timeout=2):
         """Check if element exists without throwing exceptions"""
         try:
@@ -552,7 +1034,7 @@ class InstagramReelsScraper:
     def _handle_login_popups(self):
         """Handle common Instagram popups after login"""
         try:
-            time.sleep(2)
+            self.profiler.sleep(2, 'login_popups')
             
             # Common popup button texts
             popup_texts = [
@@ -566,7 +1048,7 @@ class InstagramReelsScraper:
                     for btn in buttons:
                         if btn.is_displayed():
                             btn.click()
-                            time.sleep(1)
+                            self.profiler.sleep(1, 'login_popups')
                             logger.info(f"✅ Closed popup: {text}")
                             break
                 except:
@@ -575,11 +1057,58 @@ class InstagramReelsScraper:
         except Exception as e:
             logger.warning(f"Warning: Could not handle popups: {e}")
     
-    def _extract_caption_from_url(self, reel_url):
-        """Extract caption by visiting the reel URL"""
+    @profiled('phase.reel_page')
+    def _extract_reel_details_from_url(self, reel_url, extract_caption=True, extract_likes_dates=True):
+        """
+        Extract caption, likes and post date with a single visit to the reel URL
+        
+        Args:
+            reel_url (str): URL of the reel page
+            extract_caption (bool): Whether to extract the caption
+            extract_likes_dates (bool): Whether to extract likes and post date
+            
+        Returns:
+            dict: Reel details with caption, likes, post_date_raw, post_date and
+                  visited (False when the reel page never loaded)
+        """
+        details = {
+            'caption': "",
+            'likes': "N/A",
+            'post_date_raw': "N/A",
+            'post_date': "N/A",
+            'visited': False,
+        }
+        
         if not reel_url:
-            return ""
+            return details
+        
+        # Use cached values first and only visit the page for missing or expired fields
+        extract_likes = extract_date = extract_likes_dates
+        if self.detail_cache:
+            wanted = []
+            if extract_caption:
+                wanted.append('caption')
+            if extract_likes_dates:
+                wanted += ['likes', 'post_date_raw', 'post_date']
+            
+            cached = self.detail_cache.get(reel_url, wanted)
+            details.update(cached)
+            
+            # Fields expire separately (likes after hours, dates never), so each is checked on its own
+            if extract_caption and 'caption' in cached:
+                extract_caption = False
+            if extract_likes and 'likes' in cached:
+                extract_likes = False
+            # The formatted date is derived from the raw one, so they are refreshed together
+            if extract_date and 'post_date_raw' in cached and 'post_date' in cached:
+                extract_date = False
+            
+            if not (extract_caption or extract_likes or extract_date):
+                logger.info(f"🗄️ Reel details served from cache: {reel_url}")
+                details['visited'] = True
+                return details
         
+        main_window = None
         try:
             # Store current window handle
             main_window = self.driver.current_window_handle
@@ -587,452 +1116,332 @@ class InstagramReelsScraper:
             # Open new tab
             self.driver.execute_script("window.open('');")
             self.driver.switch_to.window(self.driver.window_handles[-1])
+            self._prepare_tab()
             
             # Navigate to reel URL
             self.driver.get(reel_url)
+            self._invalidate_page_snapshot()
             
             # Wait for page to load
             WebDriverWait(self.driver, 10).until(
                 EC.any_of(
                     EC.presence_of_element_located((By.TAG_NAME, "h1")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "article")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "main"))
+                    EC.presence_of_element_located((By.TAG_NAME, "article")),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "main")),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "section"))
                 )
             )
-            
-            time.sleep(2)
-            
-            # Get username from URL for filtering
-            username = reel_url.split('/')[-3] if len(reel_url.split('/')) > 3 else ""
-            
-            # Try multiple caption selectors with improved logic
-            caption_selectors = [
-                "h1",  # Main caption
-                "div._a9zs span",  # Alternative caption
-                "span[dir='auto']",  # Generic caption
-                "article span[dir='auto']",  # Article caption
-                "div[data-testid='post-comment-root'] span",  # Comment root
-                "div._ac7v span[dir='auto']",  # Another variant
-                "div._aacl._aaco._aacu._aacx._aada span",  # Specific Instagram classes
-                "div[role='button'] + div span",  # Caption next to buttons
-                "div[data-testid] span[dir='auto']",  # Data testid variants
-                "meta[property='og:description']",  # Meta description fallback
-            ]
-            
-            candidate_captions = []
-            
-            # Collect all potential captions
-            for selector in caption_selectors:
-                try:
-                    if selector.startswith("meta"):
-                        # Handle meta tags differently
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            content = element.get_attribute("content")
-                            if content and len(content) > 20:
-                                candidate_captions.append(content.strip())
-                    else:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            text = element.text.strip()
-                            if text and len(text) > 15:  # Increased minimum length
-                                candidate_captions.append(text)
-                except:
-                    continue
-            
-            # Score and select the best caption
-            best_caption = ""
-            best_score = 0
-            
-            # Debug: Log all candidate captions for troubleshooting
-            logger.debug(f"Found {len(candidate_captions)} potential captions")
-            for i, caption in enumerate(candidate_captions):
-                logger.debug(f"Caption {i+1}: {caption[:100]}...")
-            
-            for caption in candidate_captions:
-                if not caption:
-                    continue
-                    
-                score = 0
-                caption_lower = caption.lower()
-                
-                # Skip if it's just the username
-                if caption.strip().lower() == username.lower():
-                    continue
-                
-                # Skip if it's a short generic text
-                if len(caption) < 20:
-                    continue
-                
-                # UNIVERSAL Positive scoring criteria
-                if len(caption) > 100:
-                    score += 5  # Very long text is highly likely to be caption
-                elif len(caption) > 50:
-                    score += 3  # Longer text is more likely to be caption
-                
-                if '#' in caption:
-                    score += 3  # Contains hashtags (universal sign of captions)
-                
-                # Universal emoji detection (any emoji suggests it's content, not UI)
-                import re
-                emoji_pattern = re.compile("["
-                    u"\U0001F600-\U0001F64F"  # emoticons
-                    u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-                    u"\U0001F680-\U0001F6FF"  # transport & map symbols
-                    u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-                    u"\U00002702-\U000027B0"
-                    u"\U000024C2-\U0001F251"
-                    "]+", flags=re.UNICODE)
-                if emoji_pattern.search(caption):
-                    score += 2  # Contains emojis
-                
-                # Multiple sentences or line breaks indicate real content
-                if '\n' in caption or '. ' in caption or '! ' in caption or '? ' in caption:
-                    score += 3  # Multiple sentences or line breaks
-                
-                # Check if it contains multiple words (real content vs UI elements)
-                word_count = len(caption.split())
-                if word_count >= 10:
-                    score += 3  # Many words = likely caption
-                elif word_count >= 5:
-                    score += 2  # Some words = possible caption
-                elif word_count >= 3:
-                    score += 1  # Few words = maybe caption
-                
-                # URLs or mentions suggest real content
-                if 'http' in caption_lower or '@' in caption or '.' in caption:
-                    score += 1  # Contains links or mentions
-                
-                # Punctuation patterns of real content
-                punctuation_count = sum(1 for char in caption if char in '.,!?;:')
-                if punctuation_count >= 3:
-                    score += 2  # Good punctuation suggests real content
-                elif punctuation_count >= 1:
-                    score += 1
-                
-                # UNIVERSAL Negative scoring criteria
-                
-                # Common UI elements and generic text
-                ui_elements = [
-                    'follow', 'following', 'followers', 'likes', 'like', 'share', 'comment',
-                    'view', 'views', 'watch', 'play', 'pause', 'volume', 'mute',
-                    'close', 'back', 'next', 'previous', 'settings', 'options'
-                ]
-                if any(ui_word == caption_lower.strip() for ui_word in ui_elements):
-                    score -= 10  # Definitely UI element, not caption
-                
-                # Single word is very unlikely to be caption (unless it's long)
-                if len(caption.split()) == 1 and len(caption) < 15:
-                    score -= 5  # Single short word is unlikely to be caption
-                
-                # Username repetition check (more thorough)
-                if caption.lower().strip() == username.lower():
-                    score -= 10  # Exact username match
-                
-                # If it's mostly numbers or very short, probably not caption
-                if re.match(r'^[\d\s,\.]+$', caption.strip()):
-                    score -= 8  # Just numbers (like view counts)
-                
-                # Common social media UI text
-                common_ui_phrases = [
-                    'suggested for you', 'recommended', 'sponsored', 'advertisement',
-                    'see more', 'see less', 'show more', 'show less', 'read more'
-                ]
-                if any(phrase in caption_lower for phrase in common_ui_phrases):
-                    score -= 8  # UI phrases
-                
-                # Log scoring for debugging
-                logger.debug(f"Caption: '{caption[:50]}...' -> Score: {score}")
-                
-                # Select best scoring caption
-                if score > best_score:
-                    best_score = score
-                    best_caption = caption
-            
-            logger.info(f"Best caption selected with score: {best_score}")
-            
-            # If no good caption found, try a broader search
-            if not best_caption:
-                try:
-                    logger.info("No good caption found, trying broader search...")
-                    # Look for any longer text that might be the caption
-                    all_spans = self.driver.find_elements(By.TAG_NAME, "span")
-                    for span in all_spans:
-                        text = span.text.strip()
-                        if (len(text) > 50 and  # Reduced threshold
-                            text.lower() != username.lower() and
-                            len(text.split()) > 3 and  # Must have multiple words
-                            not re.match(r'^[\d\s,\.]+$', text)):  # Not just numbers
-                            # Additional check: prefer text with hashtags or emojis
-                            if '#' in text or emoji_pattern.search(text):
-                                best_caption = text
-                                logger.info(f"Found caption via broader search: {text[:50]}...")
-                                break
-                            # If no emoji/hashtag, still consider if it's long enough
-                            elif len(text) > 100:
-                                best_caption = text
-                                logger.info(f"Found long caption via broader search: {text[:50]}...")
-                                break
-                except Exception as e:
-                    logger.warning(f"Error in broader search: {e}")
-            
-            # Close tab and switch back to main window
-            self.driver.close()
-            self.driver.switch_to.window(main_window)
-            
-            return best_caption[:2500] if best_caption else ""  # Limit caption length
+            details['visited'] = True
+            
+            # Wait until the data we need is in the DOM (at most the former fixed 3 seconds)
+            conditions = {}
+            if extract_caption:
+                conditions['caption_node'] = caption_node_present()
+            if extract_date:
+                conditions['post_datetime'] = post_datetime_present()
+            if extract_likes:
+                conditions['likes_anchor'] = likes_anchor_present()
+            self._wait_for_conditions(conditions, replaced_sleep=3)
+            self._archive_page('reel', reel_url)
+            
+            if extract_caption:
+                details['caption'] = self._find_caption(reel_url)
+            
+            if extract_likes:
+                # Extract likes count
+                details['likes'] = self._find_likes_count()
+            
+            if extract_date:
+                # Extract post date and convert it to formatted date
+                raw_date, posted_at = self._find_post_datetime()
+                if posted_at:
+                    # The time[datetime] fast path already parsed the exact post time
+                    details['post_date_raw'] = raw_date
+                    details['post_date'] = RelativeDateParser.format_datetime(posted_at)
+                else:
+                    raw_date = self._find_post_date()
+                    if raw_date and raw_date != "N/A":
+                        details['post_date_raw'] = raw_date
+                        details['post_date'] = self.convert_relative_date_to_formatted_date(raw_date)
+                        logger.info(f"📅 Date conversion: '{raw_date}' → '{details['post_date']}'")
+            
+            if self.detail_cache:
+                fields = []
+                if extract_caption:
+                    fields.append('caption')
+                if extract_likes:
+                    fields.append('likes')
+                if extract_date:
+                    fields += ['post_date_raw', 'post_date']
+                self.detail_cache.put(reel_url, {field: details[field] for field in fields})
+            
+            self._record_transfer(reel_url)
             
         except Exception as e:
-            logger.warning(f"❌ Failed to extract caption from {reel_url}: {e}")
-            # Make sure we're back on main window
+            logger.warning(f"❌ Failed to extract reel details from {reel_url}: {e}")
+            self.profiler.count('reel_page_failures')
+        
+        finally:
+            # Close tab and switch back to main window
+            self._invalidate_page_snapshot()
             try:
-                self.driver.switch_to.window(main_window)
+                if main_window and self.driver.current_window_handle != main_window:
+                    self.driver.close()
+                if main_window:
+                    self.driver.switch_to.window(main_window)
             except:
                 pass
-            return ""
+        
+        return details
     
-    def _extract_likes_and_date_from_url(self, reel_url):
-        """Extract likes count and post date by visiting the reel URL"""
-        if not reel_url:
-            return "N/A", "N/A"
+    def _get_page_snapshot(self):
+        """
+        Return the snapshot of the current page load, taking it on first use
+        
+        Returns:
+            dict: Selector -> list of element records, or None if the snapshot script failed
+        """
+        if self._page_snapshot is None and not self._page_snapshot_failed:
+            try:
+                if self.html_extraction:
+                    self._page_snapshot = snapshot_from_html(self.driver.page_source)
+                else:
+                    self._page_snapshot = self.driver.execute_script(PAGE_SNAPSHOT_SCRIPT, PAGE_SNAPSHOT_QUERIES) or {}
+            except Exception as e:
+                logger.debug(f"Page snapshot failed, reading elements one by one: {e}")
+                self._page_snapshot_failed = True
+        return self._page_snapshot
+    
+    def _archive_page(self, kind, url):
+        """
+        Store the source of the current page in the page archive, if one is open
+        
+        Args:
+            kind (str): 'reel' or 'grid'
+            url (str): URL of the page
+        """
+        if not self.page_archive:
+            return
         
         try:
-            # Store current window handle
-            main_window = self.driver.current_window_handle
-            
-            # Open new tab
-            self.driver.execute_script("window.open('');")
-            self.driver.switch_to.window(self.driver.window_handles[-1])
-            
-            # Navigate to reel URL
-            self.driver.get(reel_url)
-            
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.TAG_NAME, "article")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "main")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "section"))
-                )
-            )
-            
-            time.sleep(3)  # Wait for content to fully load
-            
-            likes_count = "N/A"
-            post_date = "N/A"
-            
-            # Extract likes count
-            likes_count = self._find_likes_count()
+            html = self.driver.page_source
+            self.page_archive.store(kind, url, html)
             
-            # Extract post date
-            raw_date = self._find_post_date()
-            
-            # Convert date to formatted date
-            if raw_date and raw_date != "N/A":
-                post_date = self.convert_relative_date_to_formatted_date(raw_date)
-                logger.info(f"📅 Date conversion: '{raw_date}' → '{post_date}'")
-            else:
-                post_date = "N/A"
-            
-            # Close tab and switch back to main window
-            self.driver.close()
-            self.driver.switch_to.window(main_window)
+            # The source is already here, so HTML extraction need not fetch it again
+            if kind == 'reel' and self.html_extraction and self._page_snapshot is None:
+                self._page_snapshot = snapshot_from_html(html)
+        except Exception as e:
+            logger.warning(f"Could not archive {kind} page {url}: {e}")
+    
+    def _invalidate_page_snapshot(self):
+        """Forget the page snapshot after navigating away from the page it was taken on"""
+        self._page_snapshot = None
+        self._page_snapshot_failed = False
+    
+    def _page_records(self, selector):
+        """
+        Get text and attributes of the elements matching one of the snapshot selectors
+        
+        Args:
+            selector (str): A selector listed in PAGE_SNAPSHOT_QUERIES
             
-            return likes_count, post_date
+        Returns:
+            list: Records supporting .get('text' | 'parent_text' | attribute name)
+        """
+        snapshot = self._get_page_snapshot()
+        if snapshot is not None:
+            return snapshot.get(selector, [])
+        
+        # Snapshot unavailable: fall back to live elements, read lazily
+        query = snapshot_query(selector)
+        if 'xpath' in query:
+            elements = self.driver.find_elements(By.XPATH, query['xpath'])
+        else:
+            elements = self.driver.find_elements(By.CSS_SELECTOR, query['css'])
+        return [_LiveElementRecord(element) for element in elements]
+    
+    @profiled('phase.ready_wait')
+    def _wait_for_conditions(self, conditions, replaced_sleep):
+        """
+        Wait for expected conditions in order, sharing one deadline
+        
+        Args:
+            conditions (dict): Condition name -> expected condition callable
+            replaced_sleep (float): Fixed sleep these conditions replace, used as the deadline
+        """
+        start = time.monotonic()
+        deadline = start + replaced_sleep
+        
+        for name, condition in conditions.items():
+            remaining = deadline - time.monotonic()
+            ready = False
+            try:
+                if remaining > 0:
+                    WebDriverWait(self.driver, remaining, poll_frequency=0.1).until(condition)
+                    ready = True
+                else:
+                    ready = bool(condition(self.driver))
+            except TimeoutException:
+                logger.debug(f"Condition '{name}' not met within {replaced_sleep}s")
+                self.profiler.count('wait_timeouts')
             
+            self._record_wait(name, time.monotonic() - start, replaced_sleep, ready)
+    
+    def _start_run_reports(self):
+        """Clear the reports of the previous scrape so each run reports only its own work"""
+        with self._report_lock:
+            self.wait_report = {}
+            self.transfer_report = {}
+    
+    def _record_wait(self, name, elapsed, replaced_sleep, ready):
+        """Add one condition wait to the timing report"""
+        with self._report_lock:
+            entry = self.wait_report.setdefault(name, {
+                'waits': 0, 'timeouts': 0, 'waited_seconds': 0.0, 'replaced_seconds': 0.0, 'saved_seconds': 0.0
+            })
+            entry['waits'] += 1
+            entry['timeouts'] += 0 if ready else 1
+            entry['waited_seconds'] += elapsed
+            entry['replaced_seconds'] += replaced_sleep
+            entry['saved_seconds'] += max(0.0, replaced_sleep - elapsed)
+    
+    def _merge_wait_report(self, report):
+        """Fold the timing report of an enrichment worker into this scraper's report"""
+        with self._report_lock:
+            for name, other in report.items():
+                entry = self.wait_report.setdefault(name, dict.fromkeys(other, 0))
+                for key, value in other.items():
+                    entry[key] += value
+    
+    def get_wait_report(self):
+        """
+        Get how much time each readiness condition saved compared to the fixed sleeps
+        
+        Returns:
+            dict: Condition name -> waits, timeouts, waited/replaced/saved seconds and average wait
+        """
+        with self._report_lock:
+            report = {}
+            for name, entry in self.wait_report.items():
+                report[name] = dict(entry)
+                report[name]['average_wait_seconds'] = entry['waited_seconds'] / entry['waits'] if entry['waits'] else 0.0
+            return report
+    
+    def log_wait_report(self):
+        """Log the readiness condition timing report"""
+        report = self.get_wait_report()
+        if not report:
+            return
+        
+        logger.info("⏱️ Wait condition report:")
+        for name, entry in report.items():
+            logger.info(f"   {name}: {entry['waits']} waits, avg {entry['average_wait_seconds']:.2f}s, "
+                        f"{entry['timeouts']} timeouts, saved {entry['saved_seconds']:.1f}s "
+                        f"of {entry['replaced_seconds']:.1f}s fixed sleep")
+
+    def _record_transfer(self, reel_url):
+        """Add the bytes transferred by the open reel page to the transfer report"""
+        try:
+            transfer = self.driver.execute_script(TRANSFER_SIZE_SCRIPT) or {}
         except Exception as e:
-            logger.warning(f"❌ Failed to extract likes and date from {reel_url}: {e}")
-            # Make sure we're back on main window
-            try:
-                if len(self.driver.window_handles) > 1:
-                    self.driver.close()
-                self.driver.switch_to.window(main_window)
-            except:
-                pass
-            return "N/A", "N/A"
+            logger.debug(f"Could not measure transfer size of {reel_url}: {e}")
+            return
+        
+        with self._report_lock:
+            self.transfer_report[reel_url] = {
+                'bytes': int(transfer.get('bytes', 0)),
+                'requests': int(transfer.get('requests', 0)),
+            }
+    
+    def _merge_transfer_report(self, report):
+        """Fold the transfer report of an enrichment worker into this scraper's report"""
+        with self._report_lock:
+            self.transfer_report.update(report)
+    
+    def get_transfer_report(self):
+        """
+        Get the bytes transferred per reel page, as reported by the browser's Resource Timing
+        
+        Cross-origin responses without a Timing-Allow-Origin header count by their
+        encoded body size (or zero), so the totals are a lower bound.
+        
+        Returns:
+            dict: pages, total_bytes, average_bytes, max_bytes, requests and reels (URL -> bytes, requests)
+        """
+        with self._report_lock:
+            reels = {url: dict(entry) for url, entry in self.transfer_report.items()}
+        
+        total = sum(entry['bytes'] for entry in reels.values())
+        return {
+            'pages': len(reels),
+            'total_bytes': total,
+            'average_bytes': total / len(reels) if reels else 0.0,
+            'max_bytes': max((entry['bytes'] for entry in reels.values()), default=0),
+            'requests': sum(entry['requests'] for entry in reels.values()),
+            'data_only': self.data_only,
+            'reels': reels,
+        }
+    
+    def log_transfer_report(self):
+        """Log how many bytes the reel page visits transferred"""
+        report = self.get_transfer_report()
+        if not report['pages']:
+            return
+        
+        logger.info(f"📶 Transfer report ({'data-only' if self.data_only else 'full'} browsing): "
+                    f"{report['pages']} reel pages, {report['total_bytes'] / 1024 / 1024:.1f} MB total, "
+                    f"avg {report['average_bytes'] / 1024:.0f} KB/reel, max {report['max_bytes'] / 1024:.0f} KB, "
+                    f"{report['requests']} requests")
+
+    def _extract_caption_from_url(self, reel_url):
+        """Extract caption by visiting the reel URL"""
+        return self._extract_reel_details_from_url(reel_url, extract_likes_dates=False)['caption']
     
+    def _extract_likes_and_date_from_url(self, reel_url):
+        """Extract likes count and post date by visiting the reel URL"""
+        details = self._extract_reel_details_from_url(reel_url, extract_caption=False)
+        return details['likes'], details['post_date']
+    
+    def _page_extractor(self):
+        """Extractor reading the snapshot of the current reel page"""
+        return ReelExtractor(self._page_records)
+    
+    @profiled('extract.caption')
+    def _find_caption(self, reel_url):
+        """Find the best scoring caption on the currently open reel page"""
+        return self._page_extractor().find_caption(reel_url)
+    
+    @profiled('extract.likes')
     def _find_likes_count(self):
         """Find likes count on individual reel page"""
-        try:
-            # Multiple selectors for likes count
-            likes_selectors = [
-                # Likes button/text patterns
-                "button[type='button'] span:contains('likes')",
-                "a[href*='/liked_by/'] span",
-                "section button span",
-                "div[role='button'] span",
-                
-                # Alternative patterns
-                "span[dir='auto']:contains('likes')",
-                "span:contains(' likes')",
-                "button span:contains('like')",
-                
-                # Specific Instagram classes (these change frequently)
-                "span._aacl._aaco._aacu._aacx._aada",
-                "span._ac2a",
-                "div._ae5c span",
-            ]
-            
-            for selector in likes_selectors:
-                try:
-                    if ':contains(' in selector:
-                        # Use XPath for contains
-                        xpath_selector = selector.replace(':contains(', '[contains(text(), ').replace(')', ')]')
-                        elements = self.driver.find_elements(By.XPATH, f"//*{xpath_selector}")
-                    else:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        text = element.text.strip()
-                        
-                        # Check if this looks like a likes count
-                        if self._is_likes_count(text):
-                            logger.info(f"👍 Found likes: {text}")
-                            return text
-                        
-                        # Check parent/sibling elements
-                        try:
-                            parent = element.find_element(By.XPATH, "..")
-                            parent_text = parent.text.strip()
-                            if self._is_likes_count(parent_text):
-                                logger.info(f"👍 Found likes in parent: {parent_text}")
-                                return parent_text
-                        except:
-                            continue
-                            
-                except Exception as e:
-                    logger.debug(f"Error with likes selector {selector}: {e}")
-                    continue
-            
-            # Alternative method: look for patterns in all text
-            try:
-                all_spans = self.driver.find_elements(By.TAG_NAME, "span")
-                for span in all_spans:
-                    text = span.text.strip()
-                    # Look for patterns like "1,234 likes" or "1.2K likes"
-                    likes_match = re.search(r'([\d,]+(?:\.\d+)?[KMB]?)\s*likes?', text, re.IGNORECASE)
-                    if likes_match:
-                        likes_text = likes_match.group(1)
-                        logger.info(f"👍 Found likes via pattern: {likes_text}")
-                        return likes_text
-            except:
-                pass
-                
-        except Exception as e:
-            logger.debug(f"Error finding likes count: {e}")
+        return self._page_extractor().find_likes_count()
+    
+    @profiled('extract.post_datetime')
+    def _find_post_datetime(self):
+        """
+        Read the machine-readable post timestamp from the first time[datetime] of the page
         
-        return "N/A"
+        Returns:
+            tuple: (raw attribute value, timezone-aware datetime), or (None, None) if missing
+        """
+        return self._page_extractor().find_post_datetime()
     
+    @profiled('extract.post_date')
     def _find_post_date(self):
         """Find post date on individual reel page"""
-        try:
-            # Multiple selectors for post date/time
-            date_selectors = [
-                # Time elements
-                "time",
-                "time[datetime]",
-                "span[title]",
-                
-                # Common date patterns
-                "a[href*='/p/'] time",
-                "article time",
-                "div time",
-                
-                # Alternative selectors
-                "span._a9ze",
-                "div._a9ze",
-                "span[dir='auto'][title]",
-            ]
-            
-            for selector in date_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        # Check datetime attribute first
-                        datetime_attr = element.get_attribute("datetime")
-                        if datetime_attr:
-                            logger.info(f"📅 Found datetime attribute: {datetime_attr}")
-                            return datetime_attr
-                        
-                        # Check title attribute
-                        title_attr = element.get_attribute("title")
-                        if title_attr and self._is_date_text(title_attr):
-                            logger.info(f"📅 Found date in title: {title_attr}")
-                            return title_attr
-                        
-                        # Check text content
-                        text = element.text.strip()
-                        if text and self._is_date_text(text):
-                            logger.info(f"📅 Found date text: {text}")
-                            return text
-                            
-                except Exception as e:
-                    logger.debug(f"Error with date selector {selector}: {e}")
-                    continue
-            
-            # Alternative method: look for date patterns in all text
-            try:
-                all_elements = self.driver.find_elements(By.CSS_SELECTOR, "*[title]")
-                for element in all_elements:
-                    title = element.get_attribute("title")
-                    if title and self._is_date_text(title):
-                        logger.info(f"📅 Found date in title attribute: {title}")
-                        return title
-                        
-                # Look for text patterns
-                all_spans = self.driver.find_elements(By.TAG_NAME, "span")
-                for span in all_spans:
-                    text = span.text.strip()
-                    if self._is_date_text(text):
-                        logger.info(f"📅 Found date text: {text}")
-                        return text
-                        
-            except:
-                pass
-                
-        except Exception as e:
-            logger.debug(f"Error finding post date: {e}")
-        
-        return "N/A"
+        return self._page_extractor().find_post_date()
     
     def _is_likes_count(self, text):
         """Check if text looks like a likes count"""
-        if not text:
-            return False
-        
-        # Patterns for likes count
-        patterns = [
-            r'^\d+[.,]?\d*[KMB]?\s*$',  # Just numbers with K/M/B
-            r'^\d{1,3}(,\d{3})*\s*$',   # Numbers with commas
-            r'^\d+\s*$'                 # Plain numbers
-        ]
-        
-        # Remove common words and check
-        clean_text = re.sub(r'\s*(likes?|like)\s*', '', text, flags=re.IGNORECASE).strip()
-        
-        return any(re.match(pattern, clean_text) for pattern in patterns)
+        return ReelExtractor().is_likes_count(text)
     
     def _is_date_text(self, text):
         """Check if text looks like a date/time"""
-        if not text or len(text) < 3:
-            return False
-        
-        # Patterns for date/time text
-        date_patterns = [
-            r'\d+\s*(minute|minutes|min|mins?)\s*ago',
-            r'\d+\s*(hour|hours|hr|hrs?)\s*ago',
-            r'\d+\s*(day|days|d)\s*ago',
-            r'\d+\s*(week|weeks|w)\s*ago',
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+',
-            r'\d{4}-\d{2}-\d{2}',  # ISO date format
-            r'\d{1,2}/\d{1,2}/\d{4}',  # MM/DD/YYYY format
-        ]
-        
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in date_patterns)
+        return ReelExtractor().is_date_text(text)
 
-    def scrape_reels_views(self, target_username, max_scrolls=3, delay=3, extract_captions=True, extract_likes_dates=True):
+    @profiled('run.scrape_reels_views')
+    def scrape_reels_views(self, target_username, max_scrolls=3, delay=3, extract_captions=True, extract_likes_dates=True,
+                           enrich_workers=1, politeness_interval=1.0, checkpoint_dir=None):
         """
         Scrape Instagram Reels view counts with improved error handling
         
@@ -1042,15 +1451,26 @@ class InstagramReelsScraper:
             delay (int): Delay between actions in seconds
             extract_captions (bool): Whether to extract captions (slower but more complete)
             extract_likes_dates (bool): Whether to extract likes and dates (slower but more complete)
+            enrich_workers (int): Number of browser workers visiting reel pages in parallel
+            politeness_interval (float): Minimum seconds between reel page visits across all workers
+            checkpoint_dir (str): Save progress here and resume an interrupted run (optional)
         
         Returns:
             list: List of dictionaries containing reel data
         """
-        reels_data = []
+        reels_data = ReelIndex()
+        completed = False
+        
+        # All relative dates of this run are resolved against the same "now"
+        self.date_parser = RelativeDateParser()
+        self._start_run_reports()
+        
+        # Without enrichment a reel is finished as soon as it is discovered
+        stream_discovered = not (extract_captions or extract_likes_dates)
         
         try:
             # Navigate to the Reels page
-            url = f"https://www.instagram.com/{target_username}/reels/"
+            url = f"{self.base_url}/{target_username}/reels/"
             logger.info(f"🌐 Navigating to: {url}")
             
             self.driver.get(url)
@@ -1072,44 +1492,38 @@ class InstagramReelsScraper:
             if self._check_profile_issues():
                 return []
             
-            # Wait a bit longer for initial content to fully load
-            time.sleep(5)
+            # Wait for the first reel tiles instead of a fixed 5 second sleep
+            self._wait_for_conditions({'reel_grid': reel_grid_present()}, replaced_sleep=5)
             
             # FIRST: Capture initial visible reels (before any scrolling)
             logger.info("🔍 Capturing initial visible reels...")
+            self._grid_seen_urls.clear()
             initial_reels = self._extract_view_counts_with_urls()
             if initial_reels:
-                reels_data.extend(initial_reels)
+                self._collect_reels(reels_data, initial_reels, stream=stream_discovered)
                 logger.info(f"✅ Found {len(initial_reels)} initial reels")
             
+            # Pick up an interrupted run: restore its reels and scroll back to where it stopped
+            start_scroll = self._resume_from_checkpoint(checkpoint_dir, target_username, reels_data, delay,
+                                                        max_scrolls=max_scrolls, stream=stream_discovered)
+            
             # THEN: Scroll to load more content and capture new reels
-            for i in range(max_scrolls):
+            for i in range(start_scroll, max_scrolls):
                 try:
                     logger.info(f"📜 Scrolling to load more content... ({i+1}/{max_scrolls})")
                     
                     # Get current reels count before scrolling
                     current_count = len(reels_data)
                     
-                    # Scroll down
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(delay)
+                    # Scroll down and wait for new tiles (at most delay seconds)
+                    self._scroll_and_wait(delay)
                     
-                    # Extract new reels after scrolling
-                    new_reels = self._extract_view_counts_with_urls()
+                    # Extract only the reels appended by this scroll
+                    new_reels = self._extract_view_counts_with_urls(incremental=True)
                     
                     # Add only new reels (not duplicates)
-                    if new_reels:
-                        for reel in new_reels:
-                            # Check if this reel URL is already captured
-                            reel_url = reel.get('url', '')
-                            existing_urls = [r.get('url', '') for r in reels_data]
-                            
-                            if reel_url and reel_url not in existing_urls:
-                                reels_data.append(reel)
-                            elif not reel_url:  # If no URL, check by views to avoid duplicates
-                                existing_views = [r.get('views', '') for r in reels_data]
-                                if reel.get('views', '') not in existing_views:
-                                    reels_data.append(reel)
+                    self._collect_reels(reels_data, new_reels, stream=stream_discovered)
+                    self._save_discovery(reels_data, i + 1)
                     
                     new_count = len(reels_data)
                     logger.info(f"📊 Total reels after scroll {i+1}: {new_count} (added {new_count - current_count})")
@@ -1120,48 +1534,35 @@ class InstagramReelsScraper:
                     
                 except Exception as e:
                     logger.warning(f"Scrolling error: {e}")
+                    self.profiler.count('scroll_errors')
                     continue
             
+            # Archive the grid once, fully scrolled, before enrichment navigates away from it
+            self._archive_page('grid', self.driver.current_url)
+            
             # Extract captions, likes, and dates if requested
-            if (extract_captions or extract_likes_dates) and reels_data:
-                logger.info("📝 Extracting additional data (captions, likes, dates)...")
-                for i, reel in enumerate(reels_data):
-                    if 'url' in reel and reel['url'] and reel['url'] != 'N/A':
-                        logger.info(f"📝 Processing reel {i+1}/{len(reels_data)}...")
-                        
-                        if extract_captions:
-                            caption = self._extract_caption_from_url(reel['url'])
-                            reel['caption'] = caption
-                            if caption:
-                                logger.info(f"✅ Caption extracted: {caption[:50]}...")
-                        
-                        if extract_likes_dates:
-                            likes, date = self._extract_likes_and_date_from_url(reel['url'])
-                            reel['likes'] = likes
-                            reel['post_date'] = date
-                            reel['post_date_raw'] = date  # Keep original for reference
-                            logger.info(f"✅ Likes: {likes}, Date: {date}")
-                        
-                        time.sleep(1)  # Be gentle with requests
-                    else:
-                        # Set default values if no URL
-                        if extract_captions:
-                            reel['caption'] = ""
-                        if extract_likes_dates:
-                            reel['likes'] = "N/A"
-                            reel['post_date'] = "N/A"
-                            reel['post_date_raw'] = "N/A"
+            self._enrich_reels(reels_data, extract_captions, extract_likes_dates,
+                               workers=enrich_workers, politeness_interval=politeness_interval)
             
             # Remove duplicates and re-index properly
             unique_reels = self._remove_duplicates_and_reindex(reels_data)
+            self.log_wait_report()
+            self.log_transfer_report()
+            self.profiler.log_summary()
+            completed = True
             
             return unique_reels
             
         except Exception as e:
             logger.error(f"❌ Error occurred during scraping: {e}")
             return []
+        
+        finally:
+            self._finish_checkpoint(completed)
 
-    def scrape_reels_by_count(self, target_username, target_posts=20, delay=3, extract_captions=True, extract_likes_dates=True, max_scrolls=50):
+    @profiled('run.scrape_reels_by_count')
+    def scrape_reels_by_count(self, target_username, target_posts=20, delay=3, extract_captions=True, extract_likes_dates=True, max_scrolls=50,
+                              enrich_workers=1, politeness_interval=1.0, checkpoint_dir=None):
         """
         Scrape Instagram Reels until reaching target number of posts
         
@@ -1172,15 +1573,26 @@ class InstagramReelsScraper:
             extract_captions (bool): Whether to extract captions (slower but more complete)
             extract_likes_dates (bool): Whether to extract likes and dates (slower but more complete)
             max_scrolls (int): Maximum number of scrolls to prevent infinite loops
+            enrich_workers (int): Number of browser workers visiting reel pages in parallel
+            politeness_interval (float): Minimum seconds between reel page visits across all workers
+            checkpoint_dir (str): Save progress here and resume an interrupted run (optional)
         
         Returns:
             list: List of dictionaries containing reel data
         """
-        reels_data = []
+        reels_data = ReelIndex()
+        completed = False
+        
+        # All relative dates of this run are resolved against the same "now"
+        self.date_parser = RelativeDateParser()
+        self._start_run_reports()
+        
+        # Without enrichment a reel is finished as soon as it is discovered
+        stream_discovered = not (extract_captions or extract_likes_dates)
         
         try:
             # Navigate to the Reels page
-            url = f"https://www.instagram.com/{target_username}/reels/"
+            url = f"{self.base_url}/{target_username}/reels/"
             logger.info(f"🌐 Navigating to: {url}")
             logger.info(f"🎯 Target posts: {target_posts}")
             
@@ -1203,24 +1615,30 @@ class InstagramReelsScraper:
             if self._check_profile_issues():
                 return []
             
-            # Wait a bit longer for initial content to fully load
-            time.sleep(5)
+            # Wait for the first reel tiles instead of a fixed 5 second sleep
+            self._wait_for_conditions({'reel_grid': reel_grid_present()}, replaced_sleep=5)
             
             # FIRST: Capture initial visible reels
             logger.info("🔍 Capturing initial visible reels...")
+            self._grid_seen_urls.clear()
             initial_reels = self._extract_view_counts_with_urls()
             if initial_reels:
-                reels_data.extend(initial_reels)
+                self._collect_reels(reels_data, initial_reels, limit=target_posts, stream=stream_discovered)
                 logger.info(f"✅ Found {len(initial_reels)} initial reels")
                 logger.info(f"📊 Progress: {len(reels_data)}/{target_posts} reels captured")
             
+            # Pick up an interrupted run: restore its reels and scroll back to where it stopped
+            start_scroll = self._resume_from_checkpoint(checkpoint_dir, target_username, reels_data, delay,
+                                                        max_scrolls=max_scrolls, limit=target_posts,
+                                                        stream=stream_discovered)
+            
             # Check if we already have enough reels
             if len(reels_data) >= target_posts:
                 logger.info(f"✅ Target reached with initial load! Found {len(reels_data)} reels")
-                reels_data = reels_data[:target_posts]  # Trim to exact target
+                reels_data.trim(target_posts)  # Trim to exact target
             else:
                 # THEN: Scroll to load more content until we reach target
-                scroll_count = 0
+                scroll_count = start_scroll
                 consecutive_no_new_reels = 0
                 
                 while len(reels_data) < target_posts and scroll_count < max_scrolls:
@@ -1232,33 +1650,16 @@ class InstagramReelsScraper:
                         # Get current reels count before scrolling
                         current_count = len(reels_data)
                         
-                        # Scroll down
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(delay)
+                        # Scroll down and wait for new tiles (at most delay seconds)
+                        self._scroll_and_wait(delay)
                         
-                        # Extract new reels after scrolling
-                        new_reels = self._extract_view_counts_with_urls()
+                        # Extract only the reels appended by this scroll
+                        new_reels = self._extract_view_counts_with_urls(incremental=True)
                         
-                        # Add only new reels (not duplicates)
-                        new_reels_added = 0
-                        if new_reels:
-                            for reel in new_reels:
-                                # Check if this reel URL is already captured
-                                reel_url = reel.get('url', '')
-                                existing_urls = [r.get('url', '') for r in reels_data]
-                                
-                                if reel_url and reel_url not in existing_urls:
-                                    reels_data.append(reel)
-                                    new_reels_added += 1
-                                elif not reel_url:  # If no URL, check by views to avoid duplicates
-                                    existing_views = [r.get('views', '') for r in reels_data]
-                                    if reel.get('views', '') not in existing_views:
-                                        reels_data.append(reel)
-                                        new_reels_added += 1
-                                
-                                # Stop if we've reached our target
-                                if len(reels_data) >= target_posts:
-                                    break
+                        # Add only new reels (not duplicates), stopping at the target
+                        new_reels_added = self._collect_reels(reels_data, new_reels, limit=target_posts,
+                                                              stream=stream_discovered)
+                        self._save_discovery(reels_data, scroll_count)
                         
                         new_count = len(reels_data)
                         logger.info(f"📊 Added {new_reels_added} new reels. Total: {new_count}/{target_posts}")
@@ -1266,7 +1667,7 @@ class InstagramReelsScraper:
                         # Check if we reached the target
                         if len(reels_data) >= target_posts:
                             logger.info(f"🎯 Target reached! Found {len(reels_data)} reels")
-                            reels_data = reels_data[:target_posts]  # Trim to exact target
+                            reels_data.trim(target_posts)  # Trim to exact target
                             break
                         
                         # If no new reels found, increment counter
@@ -1283,11 +1684,13 @@ class InstagramReelsScraper:
                             consecutive_no_new_reels = 0  # Reset counter when we find new reels
                         
                         # Add a longer delay if we're getting close to prevent rate limiting
-                        if len(reels_data) > target_posts * 0.8:  # 80% of target
-                            time.sleep(delay + 2)
+                        # (adaptive waiting already backs off while nothing new arrives)
+                        if not self.adaptive_wait and len(reels_data) > target_posts * 0.8:  # 80% of target
+                            self.profiler.sleep(delay + 2, 'rate_limit_delay')
                         
                     except Exception as e:
                         logger.warning(f"Scrolling error: {e}")
+                        self.profiler.count('scroll_errors')
                         continue
                 
                 # Final status
@@ -1296,55 +1699,424 @@ class InstagramReelsScraper:
                 else:
                     logger.warning(f"⚠️ Could not reach target. Found {len(reels_data)}/{target_posts} reels after {scroll_count} scrolls")
             
+            # Archive the grid once, fully scrolled, before enrichment navigates away from it
+            self._archive_page('grid', self.driver.current_url)
+            
             # Extract captions, likes, and dates if requested
-            if (extract_captions or extract_likes_dates) and reels_data:
-                logger.info("📝 Extracting additional data (captions, likes, dates)...")
-                for i, reel in enumerate(reels_data):
-                    logger.info(f"📝 Processing reel {i+1}/{len(reels_data)} ({((i+1)/len(reels_data)*100):.1f}%)...")
-                    
-                    if 'url' in reel and reel['url'] and reel['url'] != 'N/A':
-                        if extract_captions:
-                            caption = self._extract_caption_from_url(reel['url'])
-                            reel['caption'] = caption
-                            if caption:
-                                logger.info(f"✅ Caption extracted: {caption[:50]}...")
-                        
-                        if extract_likes_dates:
-                            likes, date = self._extract_likes_and_date_from_url(reel['url'])
-                            reel['likes'] = likes
-                            reel['post_date'] = date
-                            reel['post_date_raw'] = date  # Keep original for reference
-                            logger.info(f"✅ Likes: {likes}, Date: {date}")
-                        
-                        time.sleep(1)  # Be gentle with requests
-                    else:
-                        # Set default values if no URL
-                        if extract_captions:
-                            reel['caption'] = ""
-                        if extract_likes_dates:
-                            reel['likes'] = "N/A"
-                            reel['post_date'] = "N/A"
-                            reel['post_date_raw'] = "N/A"
+            self._enrich_reels(reels_data, extract_captions, extract_likes_dates,
+                               workers=enrich_workers, politeness_interval=politeness_interval)
+            
+            # Final trim to ensure exact count
+            if len(reels_data) > target_posts:
+                reels_data.trim(target_posts)
+                logger.info(f"✂️ Trimmed to exact target: {len(reels_data)} reels")
             
             # Remove duplicates and re-index properly
             unique_reels = self._remove_duplicates_and_reindex(reels_data)
             
-            # Final trim to ensure exact count
-            if len(unique_reels) > target_posts:
-                unique_reels = unique_reels[:target_posts]
-                logger.info(f"✂️ Trimmed to exact target: {len(unique_reels)} reels")
-            
+            self.log_wait_report()
+            self.log_transfer_report()
+            self.profiler.log_summary()
+            completed = True
             logger.info(f"🏁 Final result: {len(unique_reels)} reels collected")
             return unique_reels
             
         except Exception as e:
             logger.error(f"❌ Error occurred during scraping by count: {e}")
             return []
+        
+        finally:
+            self._finish_checkpoint(completed)
+
+    @profiled('phase.resume')
+    def _resume_from_checkpoint(self, checkpoint_dir, target_username, reels_data, delay, max_scrolls,
+                                limit=None, stream=False):
+        """
+        Open the job checkpoint and restore an interrupted run into reels_data
+        
+        The grid is scrolled back to the saved depth so the next scroll loads
+        reels that were not discovered yet.
+        
+        Args:
+            checkpoint_dir (str): Directory holding checkpoint files (None disables checkpointing)
+            target_username (str): Instagram username being scraped
+            reels_data (ReelIndex): Index of collected reels, filled in place
+            delay (int): Maximum seconds to wait after each replayed scroll
+            max_scrolls (int): Never replay more scrolls than this
+            limit (int): Stop restoring once the index holds this many reels (optional)
+            stream (bool): Write restored reels to the stream sink right away
+            
+        Returns:
+            int: Number of scrolls already performed
+        """
+        self.checkpoint = None
+        if not checkpoint_dir:
+            return 0
+        
+        self.checkpoint = ScrapeCheckpoint(checkpoint_dir, target_username)
+        scroll_depth = 0
+        
+        if self.checkpoint.load():
+            # The first grid capture already indexed some of these reels without their details
+            self._collect_reels(reels_data, self.checkpoint.reels, limit=limit, stream=stream, merge=True)
+            scroll_depth = min(self.checkpoint.scroll_depth, max_scrolls)
+            
+            for i in range(scroll_depth):
+                if limit is not None and len(reels_data) >= limit:
+                    break
+                logger.info(f"⏩ Replaying scroll {i+1}/{scroll_depth} from checkpoint...")
+                self._scroll_and_wait(delay)
+                self._collect_reels(reels_data, self._extract_view_counts_with_urls(incremental=True),
+                                    limit=limit, stream=stream)
+        
+        self.checkpoint.update_discovery(reels_data.to_list(), scroll_depth)
+        return scroll_depth
+    
+    def _save_discovery(self, reels_data, scroll_depth):
+        """Save the discovered reels and scroll depth to the checkpoint, if enabled"""
+        if self.checkpoint:
+            self.checkpoint.update_discovery(reels_data.to_list(), scroll_depth)
+    
+    def _finish_checkpoint(self, completed):
+        """Delete the checkpoint after a completed run, or flush it so the run can be resumed"""
+        if not self.checkpoint:
+            return
+        if completed:
+            self.checkpoint.clear()
+        else:
+            self.checkpoint.save(force=True)
+            logger.info(f"💾 Progress saved to {self.checkpoint.path}, run again to resume")
+        self.checkpoint = None
+
+    def _collect_reels(self, reels_data, new_reels, limit=None, stream=False, merge=False):
+        """
+        Add newly extracted reels to the index
+        
+        Args:
+            reels_data (ReelIndex): Index of collected reels
+            new_reels (list): Reels returned by the grid extraction
+            limit (int): Stop adding once the index holds this many reels (optional)
+            stream (bool): Write each added reel to the stream sink right away
+            merge (bool): Fill in missing fields of reels that are already indexed
+            
+        Returns:
+            int: Number of reels that were new
+        """
+        added = 0
+        for reel in new_reels or []:
+            if merge and reel in reels_data:
+                reels_data.merge(reel)
+                continue
+            if limit is not None and len(reels_data) >= limit:
+                break
+            if reels_data.add(reel):
+                added += 1
+                if stream:
+                    self._emit_finished_reel(reel)
+        return added
+    
+    def open_stream(self, filepath, flush_every=1, fsync_every=10):
+        """
+        Stream every finished reel to a JSONL file while scraping
+        
+        Args:
+            filepath (str): Path of the .jsonl file (appended to if it exists)
+            flush_every (int): Flush the file buffer after this many records
+            fsync_every (int): Force records to disk after this many records (0 disables fsync)
+            
+        Returns:
+            str: Path of the stream file
+        """
+        self.close_stream()
+        self.stream_writer = ReelStreamWriter(filepath, flush_every, fsync_every)
+        logger.info(f"📝 Streaming reels to {filepath}")
+        return filepath
+    
+    def open_detail_cache(self, db_path, field_ttls=None):
+        """
+        Reuse reel details from earlier runs instead of re-visiting reel pages
+        
+        Args:
+            db_path (str): Path of the SQLite cache file
+            field_ttls (dict): Field -> seconds before a cached value expires (None = never)
+            
+        Returns:
+            ReelDetailCache: The opened cache
+        """
+        self.close_detail_cache()
+        self.detail_cache = ReelDetailCache(db_path, field_ttls)
+        logger.info(f"🗄️ Using reel detail cache: {db_path}")
+        return self.detail_cache
+    
+    def close_detail_cache(self):
+        """Close the reel detail cache if one is open"""
+        if self.detail_cache:
+            self.detail_cache.close()
+            self.detail_cache = None
+    
+    def open_page_archive(self, archive_dir):
+        """
+        Keep the compressed source of every visited reel page and grid capture
+        
+        The archive can be re-extracted later without a browser:
+        python InstagramPageArchive.py <archive_dir>
+        
+        Args:
+            archive_dir (str): Directory of the archive
+            
+        Returns:
+            PageArchive: The opened archive
+        """
+        self.close_page_archive()
+        self.page_archive = PageArchive(archive_dir)
+        logger.info(f"🗃️ Archiving page sources to {archive_dir}")
+        return self.page_archive
+    
+    def close_page_archive(self):
+        """Close the page archive if one is open"""
+        if self.page_archive:
+            self.page_archive.close()
+            self.page_archive = None
+    
+    def close_stream(self):
+        """Flush and close the JSONL stream if one is open"""
+        if self.stream_writer:
+            self.stream_writer.close()
+            logger.info(f"📁 Streamed {self.stream_writer.records_written} reels to {self.stream_writer.filepath}")
+            self.stream_writer = None
+    
+    def _emit_finished_reel(self, reel):
+        """Write a finished reel to the stream sink, if streaming is enabled"""
+        if not self.stream_writer:
+            return
+        try:
+            self.stream_writer.write(reel)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to stream reel {reel.get('url', '')}: {e}")
+
+    @profiled('phase.enrichment')
+    def _enrich_reels(self, reels_data, extract_captions, extract_likes_dates, workers=1, politeness_interval=1.0):
+        """
+        Fill in caption, likes and date for every reel by visiting its page
+        
+        With more than one worker, the reel list is shared through a queue between
+        independent browser sessions that all draw from the same politeness budget.
+        
+        Args:
+            reels_data (list): Reel dictionaries to enrich in place
+            extract_captions (bool): Whether to extract captions
+            extract_likes_dates (bool): Whether to extract likes and dates
+            workers (int): Number of browser workers (1 uses the main driver only)
+            politeness_interval (float): Minimum seconds between page visits across all workers
+        """
+        if not (extract_captions or extract_likes_dates) or not reels_data:
+            return
+        
+        logger.info("📝 Extracting additional data (captions, likes, dates)...")
+        
+        jobs = queue.Queue()
+        total = len(reels_data)
+        resumed = 0
+        for i, reel in enumerate(reels_data):
+            if self.checkpoint and self.checkpoint.is_finished(reel.get('url', '')):
+                # Already enriched by an interrupted run
+                resumed += 1
+                self._emit_finished_reel(reel)
+            elif 'url' in reel and reel['url'] and reel['url'] != 'N/A':
+                jobs.put((i + 1, reel))
+            else:
+                # Set default values if no URL
+                if extract_captions:
+                    reel['caption'] = ""
+                if extract_likes_dates:
+                    reel['likes'] = "N/A"
+                    reel['post_date'] = "N/A"
+                    reel['post_date_raw'] = "N/A"
+                self._emit_finished_reel(reel)
+        
+        if resumed:
+            logger.info(f"♻️ Skipping {resumed} reels already enriched before the interruption")
+        
+        budget = PolitenessBudget(politeness_interval)
+        workers = max(1, min(int(workers or 1), jobs.qsize()))
+        
+        if workers > 1:
+            logger.info(f"👥 Starting {workers} enrichment workers for {jobs.qsize()} reels...")
+            cookies = self._get_session_cookies()
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich") as pool:
+                for worker_id in range(workers):
+                    pool.submit(self._run_enrichment_worker, worker_id + 1, jobs, total, budget,
+                                cookies, extract_captions, extract_likes_dates)
+            
+            if not jobs.empty():
+                logger.warning(f"⚠️ {jobs.qsize()} reels left by workers, finishing on main browser...")
+        
+        # Main driver handles everything in single-worker mode, and any leftovers otherwise
+        self._drain_enrichment_queue(jobs, total, budget, extract_captions, extract_likes_dates)
+    
+    def _run_enrichment_worker(self, worker_id, jobs, total, budget, cookies, extract_captions, extract_likes_dates):
+        """Run one enrichment worker with its own browser session until the queue is empty"""
+        worker = InstagramReelsScraper(headless=self.headless, user_agent=self.user_agent,
+                                       grid_snapshot=self.grid_snapshot, adaptive_wait=self.adaptive_wait,
+                                       html_extraction=self.html_extraction, data_only=self.data_only,
+                                       base_url=self.base_url, offline=self.offline,
+                                       chromedriver_path=self.chromedriver_path)
+        try:
+            if not worker.setup_driver():
+                logger.warning(f"⚠️ Worker {worker_id} could not start a browser")
+                return
+            
+            worker._restore_session_cookies(cookies, self._peek_first_url(jobs))
+            worker.stream_writer = self.stream_writer
+            worker.checkpoint = self.checkpoint
+            worker.detail_cache = self.detail_cache
+            worker.page_archive = self.page_archive
+            worker.date_parser = self.date_parser
+            logger.info(f"✅ Worker {worker_id} ready")
+            worker._drain_enrichment_queue(jobs, total, budget, extract_captions, extract_likes_dates)
+            
+        except Exception as e:
+            logger.warning(f"❌ Worker {worker_id} stopped: {e}")
+        finally:
+            self._merge_wait_report(worker.wait_report)
+            self._merge_transfer_report(worker.transfer_report)
+            self.profiler.merge(worker.profiler)
+            worker.detail_cache = None  # Owned by the main scraper
+            worker.page_archive = None
+            worker.stream_writer = None
+            worker.close()
+    
+    def _drain_enrichment_queue(self, jobs, total, budget, extract_captions, extract_likes_dates):
+        """Enrich reels from the shared queue with this scraper's driver"""
+        while True:
+            try:
+                position, reel = jobs.get_nowait()
+            except queue.Empty:
+                return
+            
+            logger.info(f"📝 Processing reel {position}/{total} ({(position/total*100):.1f}%)...")
+            with self.profiler.span('sleep.politeness'):
+                budget.acquire()  # Be gentle with requests
+            visited = self._enrich_reel(reel, extract_captions, extract_likes_dates)
+            self._emit_finished_reel(reel)
+            
+            # Reels whose page never loaded are retried when the run is resumed
+            if visited and self.checkpoint:
+                self.checkpoint.mark_finished(reel)
+    
+    def _enrich_reel(self, reel, extract_captions, extract_likes_dates):
+        """
+        Visit one reel page and store its caption, likes and date on the reel dictionary
+        
+        Returns:
+            bool: True if the reel page was loaded
+        """
+        details = self._extract_reel_details_from_url(reel['url'], extract_captions, extract_likes_dates)
+        
+        if extract_captions:
+            reel['caption'] = details['caption']
+            if details['caption']:
+                logger.info(f"✅ Caption extracted: {details['caption'][:50]}...")
+        
+        if extract_likes_dates:
+            reel['likes'] = details['likes']
+            reel['post_date'] = details['post_date']
+            reel['post_date_raw'] = details['post_date_raw']  # Keep original for reference
+            logger.info(f"✅ Likes: {details['likes']}, Date: {details['post_date']}")
+        
+        return details['visited']
+    
+    def _peek_first_url(self, jobs):
+        """Return the URL of the next queued reel without removing it"""
+        with jobs.mutex:
+            return jobs.queue[0][1]['url'] if jobs.queue else None
+    
+    def _get_session_cookies(self):
+        """Read the cookies of the logged-in main session"""
+        try:
+            return self.driver.get_cookies()
+        except Exception as e:
+            logger.warning(f"Could not read session cookies: {e}")
+            return []
+    
+    def _restore_session_cookies(self, cookies, url):
+        """Load cookies from another session into this driver for the site serving url"""
+        if not cookies or not url:
+            return
+        
+        # Cookies can only be added for the domain that is currently open
+        parts = urlparse(url)
+        self.driver.get(f"{parts.scheme}://{parts.netloc}/")
+        
+        restored = 0
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+                restored += 1
+            except Exception as e:
+                logger.debug(f"Skipping cookie {cookie.get('name')}: {e}")
+        
+        logger.debug(f"Restored {restored}/{len(cookies)} session cookies")
 
     def format_likes_count(self, likes_str):
         """Convert likes count string to number (same logic as views)"""
         return self.format_view_count(likes_str)
 
+    def _grid_metrics(self):
+        """Return (reel anchor count, document height) of the current page in one script call"""
+        try:
+            metrics = self.driver.execute_script(
+                "return [document.querySelectorAll(\"a[href*='/reel/']\").length, document.body.scrollHeight];"
+            )
+            return int(metrics[0]), int(metrics[1])
+        except Exception as e:
+            logger.debug(f"Could not read grid metrics: {e}")
+            return None
+    
+    @profiled('phase.scroll')
+    def _scroll_and_wait(self, delay, initial_interval=0.1, backoff=2.0, max_interval=1.0):
+        """
+        Scroll to the bottom of the page and wait for new content
+        
+        With adaptive waiting the wait ends as soon as the reel anchor count or the
+        document height grows. While nothing arrives the polling interval backs off
+        exponentially, and the wait never exceeds delay seconds.
+        
+        Args:
+            delay (float): Maximum seconds to wait for new content
+            initial_interval (float): First polling interval in seconds
+            backoff (float): Factor applied to the polling interval after each empty poll
+            max_interval (float): Upper bound for the polling interval in seconds
+            
+        Returns:
+            bool: True if the grid grew (always True without adaptive waiting)
+        """
+        baseline = self._grid_metrics() if self.adaptive_wait else None
+        
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        
+        if baseline is None:
+            self.profiler.sleep(delay, 'scroll_delay')
+            return True
+        
+        start = time.monotonic()
+        deadline = start + delay
+        interval = initial_interval
+        
+        while True:
+            metrics = self._grid_metrics()
+            if metrics and (metrics[0] > baseline[0] or metrics[1] > baseline[1]):
+                logger.debug(f"Grid grew after {time.monotonic() - start:.2f}s: {baseline} → {metrics}")
+                return True
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.debug(f"Grid did not grow within {delay}s")
+                return False
+            
+            self.profiler.sleep(min(interval, remaining), 'scroll_poll')
+            interval = min(interval * backoff, max_interval)
+
     def _check_profile_issues(self):
         """Check for common profile issues"""
         try:
@@ -1372,16 +2144,41 @@ class InstagramReelsScraper:
             logger.warning(f"Could not check profile issues: {e}")
             return False
     
-    def _extract_view_counts_with_urls(self):
-        """Extract view counts and URLs using multiple methods with proper grid traversal"""
+    @profiled('phase.grid_extraction')
+    def _extract_view_counts_with_urls(self, incremental=False):
+        """
+        Extract view counts and URLs using multiple methods with proper grid traversal
+        
+        Args:
+            incremental (bool): Only return reels appended to the grid since the previous call
+            
+        Returns:
+            list: List of dictionaries containing reel data
+        """
         reels_data = []
         
         # Enhanced comprehensive search that focuses on getting both views and URLs
         logger.info("🔄 Searching for reels with views and URLs...")
         
         try:
-            # Wait a moment for content to stabilize
-            time.sleep(2)
+            # Wait a moment for content to stabilize. With adaptive waiting a scroll only returns
+            # once the grid grew, and a full capture waits until the grid has reel tiles
+            if not self.adaptive_wait:
+                self.profiler.sleep(2, 'grid_settle')
+            elif not incremental:
+                self._wait_for_conditions({'grid_settle': reel_grid_present()}, replaced_sleep=2)
+            
+            # Fast path: read the whole grid (or only its new tiles) in a single script call
+            if self.grid_snapshot:
+                reels_data = self._extract_grid_snapshot(incremental)
+                if reels_data:
+                    return reels_data
+                
+                # No new tiles is a valid answer once the grid has been read before
+                if incremental and self._grid_seen_urls:
+                    logger.info("🔍 No new reel tiles since the last scroll")
+                    return []
+                logger.info("🔄 Grid snapshot found no reels, walking grid elements...")
             
             # First, try to find the main grid container
             grid_selectors = [
@@ -1478,6 +2275,39 @@ class InstagramReelsScraper:
             logger.error(f"Error in enhanced search: {e}")
             return []
 
+    def _extract_grid_snapshot(self, incremental=False):
+        """Extract view counts and URLs from a single JavaScript snapshot of the reels grid"""
+        try:
+            snapshot = self.driver.execute_script(GRID_SNAPSHOT_SCRIPT, incremental) or []
+        except Exception as e:
+            logger.warning(f"Grid snapshot failed: {e}")
+            return []
+        
+        # Anchors re-rendered by the page lose their mark, so also filter on URLs seen before
+        if incremental:
+            snapshot = [entry for entry in snapshot if entry.get('href') not in self._grid_seen_urls]
+        
+        logger.info(f"🔍 Grid snapshot returned {len(snapshot)} {'new ' if incremental else ''}reel links")
+        reels_data = self._parse_grid_snapshot(snapshot)
+        self._grid_seen_urls.update(reel['url'] for reel in reels_data)
+        return reels_data
+    
+    def _parse_grid_snapshot(self, snapshot):
+        """
+        Turn grid snapshot entries into reel dictionaries
+        
+        Args:
+            snapshot (list): Entries with href, x, y, width, height and containers
+            
+        Returns:
+            list: Reel dictionaries sorted by grid position
+        """
+        return ReelExtractor().parse_grid_entries(snapshot)
+    
+    def _view_count_from_snapshot(self, entry):
+        """Find the view count of one grid snapshot entry (same search order as _find_view_count_in_reel_link)"""
+        return ReelExtractor().view_count_from_grid_entry(entry)
+
     def _find_view_count_in_reel_link(self, link_element):
         """Find view count within a reel link element and its parents"""
         try:
@@ -1662,39 +2492,16 @@ class InstagramReelsScraper:
     
     def _is_view_count(self, text):
         """Check if text looks like a view count"""
-        if not text:
-            return False
-        
-        # Patterns for view counts
-        patterns = [
-            r'^\d+[.,]?\d*[KMB]?$',  # 1.2K, 500M, 1B
-            r'^\d{1,3}(,\d{3})*$',   # 1,000,000
-            r'^\d+(\.\d+)?[KMB]$',   # 1.5K, 2.3M
-            r'^\d+$'                 # Plain numbers
-        ]
-        
-        return any(re.match(pattern, text) for pattern in patterns)
+        return ReelExtractor().is_view_count(text)
     
+    @profiled('phase.dedupe')
     def _remove_duplicates_and_reindex(self, reels_data):
         """Remove duplicate view counts and URLs with improved deduplication and proper indexing"""
-        unique_reels = []
-        seen_urls = set()
-        seen_views = set()
-        
-        for reel in reels_data:
-            url = reel.get('url', '')
-            views = reel.get('views', '')
-            
-            # Use URL as primary deduplication key
-            if url and url not in seen_urls:
-                unique_reels.append(reel)
-                seen_urls.add(url)
-                if views:
-                    seen_views.add(views)
-            elif not url and views and views not in seen_views:
-                # If no URL, use views for deduplication
-                unique_reels.append(reel)
-                seen_views.add(views)
+        # Use URL as primary deduplication key, views when there is no URL
+        if isinstance(reels_data, ReelIndex):
+            unique_reels = reels_data.to_list()
+        else:
+            unique_reels = ReelIndex(reels_data).to_list()
         
         # Sort by position to maintain proper grid order (top to bottom, left to right)
         def sort_key(reel):
@@ -1715,17 +2522,7 @@ class InstagramReelsScraper:
     
     def format_view_count(self, view_str):
         """Convert view count string to number"""
-        try:
-            if 'K' in view_str:
-                return float(view_str.replace('K', '').replace(',', '')) * 1000
-            elif 'M' in view_str:
-                return float(view_str.replace('M', '').replace(',', '')) * 1000000
-            elif 'B' in view_str:
-                return float(view_str.replace('B', '').replace(',', '')) * 1000000000
-            else:
-                return float(view_str.replace(',', ''))
-        except:
-            return 0
+        return parse_count(view_str)
         
     def choose_output_directory(self):
         """Let user choose output directory"""
@@ -1752,6 +2549,7 @@ class InstagramReelsScraper:
             logger.warning(f"Error choosing directory: {e}")
             return os.getcwd()  # Fallback to current directory
 
+    @profiled('phase.save')
     def save_results(self, results, filename=None, output_dir=None):
         """Save results to JSON file with custom directory"""
         if not filename:
@@ -1765,8 +2563,10 @@ class InstagramReelsScraper:
             filepath = filename
         
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            # Ensure directory exists (a bare filename is saved in the current directory)
+            directory = os.path.dirname(filepath)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
             
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(results, f, indent=2, ensure_ascii=False)
@@ -1785,6 +2585,9 @@ class InstagramReelsScraper:
     
     def close(self):
         """Close the driver"""
+        self.close_stream()
+        self.close_detail_cache()
+        self.close_page_archive()
         if self.driver:
             try:
                 self.driver.quit()
@@ -1800,9 +2603,18 @@ def main():
     HEADLESS = False  # Set to True to run without GUI
     EXTRACT_CAPTIONS = True  # Set to False to skip caption extraction (faster)
     EXTRACT_LIKES_DATES = True  # Set to False to skip likes and dates extraction (faster)
+    ENRICH_WORKERS = 1  # Number of parallel browsers visiting reel pages for captions/likes/dates
+    STREAM_JSONL = True  # Append each finished reel to a .jsonl file while scraping (crash-safe)
+    CHECKPOINT_DIR = ".checkpoints"  # Save progress here and resume interrupted runs (None to disable)
+    DETAIL_CACHE = ".cache/reel_details.sqlite3"  # Reuse captions/dates from earlier runs (None to disable)
+    PAGE_ARCHIVE = None  # e.g. ".archive" to keep page sources for re-extraction (None to disable)
+    COOKIE_JAR = DEFAULT_COOKIE_JAR  # Reuse the saved login instead of logging in every run (None to disable)
+    PROFILE_DIR = None  # e.g. ".session/chrome-profile" for a persistent Chrome profile (None for a fresh one)
+    DATA_ONLY = False  # Set to True to block images, video, fonts and trackers (saves bandwidth)
+    TIMING_REPORT = True  # Save a JSON report of where the run's time went
     
     # Initialize scraper
-    scraper = InstagramReelsScraper(headless=HEADLESS)
+    scraper = InstagramReelsScraper(headless=HEADLESS, profile_dir=PROFILE_DIR, cookie_jar=COOKIE_JAR, data_only=DATA_ONLY)
     
     try:
         # Setup driver
@@ -1810,18 +2622,33 @@ def main():
             logger.error("❌ Failed to setup driver. Exiting...")
             return
         
-        # Login
-        if not scraper.manual_login():
+        # Login (restores the saved session when it is still valid)
+        if not scraper.ensure_login():
             logger.error("❌ Failed to login. Exiting...")
             return
         
+        # Reuse reel details cached by earlier runs
+        if DETAIL_CACHE:
+            scraper.open_detail_cache(DETAIL_CACHE)
+        
+        # Keep visited pages so they can be re-extracted after Instagram changes its markup
+        if PAGE_ARCHIVE:
+            scraper.open_page_archive(PAGE_ARCHIVE)
+        
+        # Stream finished reels to disk as they are discovered
+        if STREAM_JSONL:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            scraper.open_stream(f"instagram_reels_data_{TARGET_USERNAME}_{timestamp}.jsonl")
+        
         # Scrape reels
         logger.info("🚀 Starting Instagram Reels scraper...")
         results = scraper.scrape_reels_views(
             TARGET_USERNAME, 
             max_scrolls=MAX_SCROLLS, 
             extract_captions=EXTRACT_CAPTIONS,
-            extract_likes_dates=EXTRACT_LIKES_DATES
+            extract_likes_dates=EXTRACT_LIKES_DATES,
+            enrich_workers=ENRICH_WORKERS,
+            checkpoint_dir=CHECKPOINT_DIR
         )
         
         # Display results
@@ -1888,6 +2715,11 @@ def main():
             print("5. Try running in non-headless mode to see what's happening")
             print("6. Try setting EXTRACT_CAPTIONS = False for faster testing")
             print("7. Try setting EXTRACT_LIKES_DATES = False for faster testing")
+        
+        # Saved last so the report covers startup, login, scraping and saving
+        if TIMING_REPORT:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            scraper.profiler.save_report(f"instagram_reels_timing_{TARGET_USERNAME}_{timestamp}.json")
     
     except KeyboardInterrupt:
         logger.info("⏹️ Scraping interrupted by user")
@@ -0,0 +1,284 @@
+"""
+Benchmark of InstagramDataConverter on synthetic scrape outputs, with a regression baseline
+
+Generates 10k/100k/1M records in the scraper's output schema (view and like strings,
+post dates, grid positions, captions with emoji), then times load_json_data,
+process_data, save_to_excel and save_to_csv separately and measures each stage's
+peak traced memory. Results are compared with a stored baseline; the run exits with
+status 1 when a stage got slower or bigger than the allowed tolerance, and with status 2
+(before benchmarking) when the baseline was measured on a different input format or seed.
+A baseline from another Python, pandas or machine is still compared, with a warning.
+
+Usage:
+    python benchmarks/bench_converter.py [--sizes 10000 100000 1000000] [--format json|jsonl]
+                                         [--baseline benchmarks/converter_baseline.json]
+                                         [--update-baseline] [--time-tolerance 0.25]
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from fixture_site import CAPTION_WORDS, EMOJIS, display_count
+from InstagramDataConverter import InstagramDataConverter
+
+STAGES = ('load_json_data', 'process_data', 'save_to_excel', 'save_to_csv')
+INPUT_META = ('format', 'seed')  # Results measured on other input are not comparable
+ENVIRONMENT_META = ('python', 'pandas', 'machine')  # Comparable, but expect some drift
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "converter_baseline.json")
+SELECTORS = ['grid_search_main', 'grid_search_article', 'html_grid', 'reel_link_fallback']
+HASHTAGS = ['#reels', '#summer', '#behindthescenes', '#newdrop', '#travel', '#fyp']
+
+def generate_records(count, seed=42):
+    """
+    Build synthetic scrape output in the scraper's record schema
+    
+    Args:
+        count (int): Number of records
+        seed (int): Random seed, so every run benchmarks the same data
+    
+    Returns:
+        list: Reel dictionaries like those saved by InstagramReelsScraper.save_results
+    """
+    rng = random.Random(seed)
+    scraped_at = datetime(2025, 7, 12, 15, 30)
+    records = []
+    for index in range(count):
+        posted = scraped_at - timedelta(hours=rng.randint(1, 24 * 900))
+        views = rng.choice([rng.randint(100, 9_999), rng.randint(10_000, 999_999), rng.randint(1_000_000, 90_000_000)])
+        likes = max(1, views // rng.randint(8, 60))
+        
+        words = [rng.choice(CAPTION_WORDS) for _ in range(rng.randint(0, 30))]
+        caption = ""
+        if words:
+            caption = f"{' '.join(words).capitalize()} {rng.choice(EMOJIS)} {' '.join(rng.sample(HASHTAGS, 2))}"
+        
+        records.append({
+            'views': 'N/A' if rng.random() < 0.02 else display_count(views),
+            'url': f"https://www.instagram.com/bench_user/reel/BX{index:09d}/",
+            'reel_index': index + 1,
+            'position': {'row': 150 + (index // 4) * 320, 'col': 80 + (index % 4) * 240},
+            'selector_used': rng.choice(SELECTORS),
+            'timestamp': (scraped_at + timedelta(milliseconds=index * 40)).isoformat(),
+            'caption': caption,
+            'likes': 'N/A' if rng.random() < 0.05 else f"{likes:,}",
+            'post_date_raw': posted.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            'post_date': posted.strftime('%d %B %Y'),
+        })
+    return records
+
+def write_dataset(records, directory, file_format):
+    """Write records the way the scraper does (a JSON array, or one record per line for JSONL)"""
+    path = os.path.join(directory, f"instagram_reels_data_bench.{file_format}")
+    with open(path, 'w', encoding='utf-8') as f:
+        if file_format == 'jsonl':
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            json.dump(records, f, indent=2, ensure_ascii=False)
+    return path
+
+def run_stages(converter, json_path, output_dir, trace_memory):
+    """
+    Run the four converter stages once
+    
+    With trace_memory, each stage's peak traced allocation (above what was allocated
+    when it started) is measured instead of its time, since tracing slows it down.
+    
+    Returns:
+        dict: Stage name -> seconds, or peak bytes when tracing memory
+    """
+    results = {}
+    
+    def measure(stage, func):
+        gc.collect()
+        if trace_memory:
+            tracemalloc.start()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            value = func()
+            results[stage] = tracemalloc.get_traced_memory()[1] - start_bytes
+            tracemalloc.stop()
+        else:
+            start = time.perf_counter()
+            value = func()
+            results[stage] = time.perf_counter() - start
+        return value
+    
+    data = measure('load_json_data', lambda: converter.load_json_data(json_path))
+    df = measure('process_data', lambda: converter.process_data(data))
+    del data
+    measure('save_to_excel', lambda: converter.save_to_excel(df, "bench.xlsx", output_dir))
+    measure('save_to_csv', lambda: converter.save_to_csv(df, "bench.csv", output_dir))
+    return results
+
+def benchmark_size(size, args):
+    """
+    Benchmark all stages on one dataset size
+    
+    Returns:
+        dict: Stage name -> {'seconds': best time, 'peak_mb': peak traced memory}
+    """
+    converter = InstagramDataConverter()
+    work_dir = tempfile.mkdtemp(prefix="bench_converter_")
+    try:
+        records = generate_records(size, seed=args.seed)
+        json_path = write_dataset(records, work_dir, args.format)
+        del records
+        
+        timings = [run_stages(converter, json_path, work_dir, trace_memory=False) for _ in range(args.repeat)]
+        memory = None if args.no_memory else run_stages(converter, json_path, work_dir, trace_memory=True)
+        
+        results = {}
+        for stage in STAGES:
+            results[stage] = {'seconds': round(min(run[stage] for run in timings), 4)}
+            if memory is not None:
+                results[stage]['peak_mb'] = round(memory[stage] / 1024 / 1024, 2)
+        return results
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def load_baseline(path):
+    """Read a stored baseline, or None if there is none"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def run_meta(args):
+    """Input options and environment the results of this run depend on"""
+    return {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'format': args.format,
+        'seed': args.seed,
+    }
+
+def baseline_differences(baseline, args, keys):
+    """
+    Find the metadata keys on which the baseline differs from this run
+    
+    Keys missing from the baseline (older baseline files) are not reported.
+    
+    Returns:
+        list: Descriptions like "format: baseline json, this run jsonl"
+    """
+    stored = baseline.get('meta', {})
+    current = run_meta(args)
+    return [f"{key}: baseline {stored[key]}, this run {current[key]}"
+            for key in keys if key in stored and stored[key] != current[key]]
+
+def save_baseline(path, results, args):
+    """Store the results as the new baseline"""
+    baseline = {
+        'meta': {'created_at': datetime.now().isoformat(timespec='seconds'), **run_meta(args)},
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+    print(f"Baseline written to {path}")
+
+def compare(results, baseline, args):
+    """
+    Compare results with the baseline
+    
+    Returns:
+        list: Regression descriptions (empty when everything is within tolerance)
+    """
+    regressions = []
+    for size, stages in results.items():
+        for stage, current in stages.items():
+            reference = baseline.get('results', {}).get(size, {}).get(stage)
+            if not reference:
+                continue
+            
+            limit = reference['seconds'] * (1 + args.time_tolerance)
+            # Very short stages are dominated by noise, so give them an absolute floor too
+            if current['seconds'] > limit and current['seconds'] - reference['seconds'] > args.min_seconds:
+                regressions.append(f"{stage} @ {size}: {current['seconds']:.3f}s vs baseline {reference['seconds']:.3f}s")
+            
+            if 'peak_mb' in current and 'peak_mb' in reference:
+                if current['peak_mb'] > reference['peak_mb'] * (1 + args.memory_tolerance) + 1:
+                    regressions.append(f"{stage} @ {size}: {current['peak_mb']:.1f} MB vs baseline {reference['peak_mb']:.1f} MB")
+    return regressions
+
+def change(current, reference):
+    """Relative change as text, e.g. '+12%'"""
+    if not reference:
+        return ""
+    return f"{(current - reference) / reference * 100:+.0f}%"
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark InstagramDataConverter on synthetic datasets")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000], help="Dataset sizes (records)")
+    parser.add_argument('--format', choices=['json', 'jsonl'], default='json', help="Input file format")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per size (best is kept)")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed of the synthetic data")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the traced-memory pass")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument('--update-baseline', action='store_true', help="Store these results as the baseline")
+    parser.add_argument('--time-tolerance', type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)")
+    parser.add_argument('--memory-tolerance', type=float, default=0.15, help="Allowed peak memory growth (0.15 = 15%%)")
+    parser.add_argument('--min-seconds', type=float, default=0.05, help="Slowdowns smaller than this never fail")
+    args = parser.parse_args()
+    
+    logging.disable(logging.WARNING)
+    baseline = None if args.update_baseline else load_baseline(args.baseline)
+    
+    # Refuse before spending minutes on a run that cannot be compared
+    if baseline is not None:
+        mismatches = baseline_differences(baseline, args, INPUT_META)
+        if mismatches:
+            print(f"Baseline {args.baseline} was measured on different input ({'; '.join(mismatches)}).")
+            print("Rerun with the baseline's options, or store a new baseline with --update-baseline")
+            sys.exit(2)
+        for difference in baseline_differences(baseline, args, ENVIRONMENT_META):
+            print(f"Warning: baseline measured in another environment ({difference}); timings may differ for that reason alone")
+    
+    results = {}
+    for size in args.sizes:
+        print(f"Benchmarking {size:,} records...", flush=True)
+        results[str(size)] = benchmark_size(size, args)
+    
+    print()
+    print(f"{'records':>9}  {'stage':<16}{'seconds':>10}{'change':>8}{'peak MB':>10}{'change':>8}")
+    for size, stages in results.items():
+        for stage, current in stages.items():
+            reference = (baseline or {}).get('results', {}).get(size, {}).get(stage, {})
+            peak = current.get('peak_mb')
+            print(f"{int(size):>9,}  {stage:<16}{current['seconds']:>10.3f}"
+                  f"{change(current['seconds'], reference.get('seconds')):>8}"
+                  f"{'' if peak is None else f'{peak:.1f}':>10}"
+                  f"{change(peak, reference.get('peak_mb')) if peak is not None else '':>8}")
+    
+    if args.update_baseline:
+        save_baseline(args.baseline, results, args)
+        return
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to store one")
+        return
+    
+    regressions = compare(results, baseline, args)
+    if regressions:
+        print("\nRegressions against the baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("\nNo regressions against the baseline")
+
+if __name__ == "__main__":
+    main()
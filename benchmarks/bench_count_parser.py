@@ -0,0 +1,91 @@
+"""
+Micro-benchmark of count parsing: the former per-method parsers versus InstagramCountParser
+
+Usage:
+    python benchmarks/bench_count_parser.py [--calls 200000]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from InstagramCountParser import parse_count, parse_counts, parse_cache_info
+
+# Display strings as they appear on the reels grid and reel pages
+SAMPLE_COUNTS = [
+    '1.2K', '3,400', '2M', '45.6K', '987', '12.3M', '1B', '1,234,567', 'N/A', '',
+    '45.6K likes', '1,234 likes', '7 likes', '2.5M likes', '10K',
+]
+
+def legacy_view_count(view_str):
+    """Former InstagramDataConverter.convert_views_to_numeric"""
+    if not view_str or view_str == 'N/A':
+        return 0
+    try:
+        view_str = str(view_str).strip()
+        if 'K' in view_str:
+            return float(view_str.replace('K', '').replace(',', '')) * 1000
+        elif 'M' in view_str:
+            return float(view_str.replace('M', '').replace(',', '')) * 1000000
+        elif 'B' in view_str:
+            return float(view_str.replace('B', '').replace(',', '')) * 1000000000
+        else:
+            return float(view_str.replace(',', ''))
+    except:
+        return 0
+
+def legacy_likes_count(likes_str):
+    """Former InstagramDataConverter.convert_likes_to_numeric"""
+    if not likes_str or likes_str == 'N/A':
+        return 0
+    try:
+        likes_str = str(likes_str).strip()
+        likes_str = re.sub(r'\s*likes?\s*$', '', likes_str, flags=re.IGNORECASE).strip()
+        if 'K' in likes_str.upper():
+            return float(likes_str.upper().replace('K', '').replace(',', '')) * 1000
+        elif 'M' in likes_str.upper():
+            return float(likes_str.upper().replace('M', '').replace(',', '')) * 1000000
+        elif 'B' in likes_str.upper():
+            return float(likes_str.upper().replace('B', '').replace(',', '')) * 1000000000
+        else:
+            return float(likes_str.replace(',', ''))
+    except:
+        return 0
+
+def per_call_ns(func, values):
+    """Average nanoseconds per call of func over values (best of 5 runs)"""
+    best = min(timeit.repeat(lambda: [func(v) for v in values], number=1, repeat=5))
+    return best / len(values) * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark count parsing")
+    parser.add_argument('--calls', type=int, default=200000, help="Number of values parsed per run")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    values = [rng.choice(SAMPLE_COUNTS) for _ in range(args.calls)]
+    
+    # Both parsers must agree on every sample before timing them
+    for value in SAMPLE_COUNTS:
+        expected = legacy_likes_count(value) if 'like' in value else legacy_view_count(value)
+        assert parse_count(value) == expected, (value, parse_count(value), expected)
+    
+    results = [
+        ("legacy views", per_call_ns(legacy_view_count, values)),
+        ("legacy likes", per_call_ns(legacy_likes_count, values)),
+        ("parse_count", per_call_ns(parse_count, values)),
+    ]
+    batch_best = min(timeit.repeat(lambda: parse_counts(values), number=1, repeat=5))
+    results.append(("parse_counts (batch)", batch_best / len(values) * 1e9))
+    
+    print(f"{'parser':<24}{'ns/call':>10}")
+    for name, ns in results:
+        print(f"{name:<24}{ns:>10.1f}")
+    print(f"memo: {parse_cache_info()}")
+
+if __name__ == "__main__":
+    main()
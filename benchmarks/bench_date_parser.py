@@ -0,0 +1,104 @@
+"""
+Benchmark of post date parsing: the former per-call parser versus RelativeDateParser
+
+Usage:
+    python benchmarks/bench_date_parser.py [--dates 50000]
+"""
+import argparse
+import logging
+import os
+import random
+import re
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from InstagramDateParser import RelativeDateParser
+
+# Date texts as Instagram shows them on reel pages
+DATE_CORPUS = [
+    '1 minute ago', '5 minutes ago', '12 mins ago', '1 hour ago', '3 hours ago', '17 hrs ago',
+    '1 day ago', '2 days ago', '6 days ago', '4d ago', '1 week ago', '3 weeks ago', '5w ago',
+    '2 months ago', '1 year ago', 'Yesterday', 'Today', 'Just now',
+    'July 26', 'December 1', 'Mar 3', 'Sep 14', '26 July', '3 Mar',
+    'July 26, 2024', 'January 5, 2023', 'Oct 30, 2022', 'Feb 29, 2024',
+    '2024-07-26T10:15:00.000Z', '2025-07-11T22:04:31.000Z',
+]
+
+def legacy_convert(date_text, now):
+    """Former InstagramReelsScraper.convert_relative_date_to_formatted_date (now passed in)"""
+    if not date_text or date_text == "N/A":
+        return "N/A"
+    try:
+        date_text = date_text.strip().lower()
+        month_names = [
+            'january', 'february', 'march', 'april', 'may', 'june',
+            'july', 'august', 'september', 'october', 'november', 'december',
+            'jan', 'feb', 'mar', 'apr', 'may', 'jun',
+            'jul', 'aug', 'sep', 'oct', 'nov', 'dec'
+        ]
+        if any(month in date_text for month in month_names):
+            for fmt in ['%B %d', '%b %d', '%d %B', '%d %b', '%B %d, %Y', '%b %d, %Y']:
+                try:
+                    parsed_date = datetime.strptime(date_text.title(), fmt)
+                    if parsed_date.year == 1900:
+                        parsed_date = parsed_date.replace(year=now.year)
+                    return parsed_date.strftime('%d %B %Y')
+                except:
+                    continue
+            return date_text.title()
+        
+        minutes_match = re.search(r'(\d+)\s*(?:minute|minutes|min|mins?)\s*ago', date_text)
+        if minutes_match:
+            target_date = now - timedelta(minutes=int(minutes_match.group(1)))
+        elif re.search(r'(\d+)\s*(?:hour|hours|hr|hrs?)\s*ago', date_text):
+            target_date = now - timedelta(hours=int(re.search(r'(\d+)\s*(?:hour|hours|hr|hrs?)\s*ago', date_text).group(1)))
+        elif re.search(r'(\d+)\s*(?:day|days|d)\s*ago', date_text):
+            target_date = now - timedelta(days=int(re.search(r'(\d+)\s*(?:day|days|d)\s*ago', date_text).group(1)))
+        elif re.search(r'(\d+)\s*(?:week|weeks|w)\s*ago', date_text):
+            target_date = now - timedelta(weeks=int(re.search(r'(\d+)\s*(?:week|weeks|w)\s*ago', date_text).group(1)))
+        elif re.search(r'(\d+)\s*(?:month|months|mo)\s*ago', date_text):
+            target_date = now - timedelta(days=int(re.search(r'(\d+)\s*(?:month|months|mo)\s*ago', date_text).group(1)) * 30)
+        elif re.search(r'(\d+)\s*(?:year|years|y)\s*ago', date_text):
+            target_date = now - timedelta(days=int(re.search(r'(\d+)\s*(?:year|years|y)\s*ago', date_text).group(1)) * 365)
+        elif 'yesterday' in date_text:
+            target_date = now - timedelta(days=1)
+        elif 'today' in date_text or 'now' in date_text:
+            target_date = now
+        else:
+            return date_text
+        return target_date.strftime('%d %B %Y')
+    except Exception:
+        return date_text
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark post date parsing")
+    parser.add_argument('--dates', type=int, default=50000, help="Number of date texts parsed per run")
+    args = parser.parse_args()
+    
+    logging.disable(logging.WARNING)
+    now = datetime(2025, 7, 12, 15, 30)
+    rng = random.Random(42)
+    dates = [rng.choice(DATE_CORPUS) for _ in range(args.dates)]
+    
+    # Show the corpus results, flagging any text the former parser read differently
+    date_parser = RelativeDateParser(reference_time=now)
+    for date_text in DATE_CORPUS:
+        new, old = date_parser.parse(date_text), legacy_convert(date_text, now)
+        marker = "" if new == old else "   (differs)"
+        print(f"{date_text!r:<20} -> {new!r}{marker}")
+    
+    legacy = min(timeit.repeat(lambda: [legacy_convert(d, datetime.now()) for d in dates], number=1, repeat=3))
+    uncached = min(timeit.repeat(lambda: [RelativeDateParser(reference_time=now).parse(d) for d in dates], number=1, repeat=3))
+    memoized = min(timeit.repeat(lambda: RelativeDateParser(reference_time=now).parse_many(dates), number=1, repeat=3))
+    
+    print()
+    print(f"{'parser':<28}{'us/date':>10}")
+    print(f"{'legacy':<28}{legacy / len(dates) * 1e6:>10.2f}")
+    print(f"{'RelativeDateParser (no memo)':<28}{uncached / len(dates) * 1e6:>10.2f}")
+    print(f"{'RelativeDateParser':<28}{memoized / len(dates) * 1e6:>10.2f}")
+
+if __name__ == "__main__":
+    main()
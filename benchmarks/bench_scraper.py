@@ -0,0 +1,190 @@
+"""
+End-to-end scraper benchmark against the local fixture site (no Instagram login needed)
+
+For each grid size this runs the real scrape_reels_by_count (grid discovery with
+infinite scroll), one full _extract_view_counts_with_urls over the loaded grid, and
+_enrich_reels over a sample of reel pages, then reports reels/sec, WebDriver
+round-trips per reel and peak RSS. Needs Chrome and a ChromeDriver already on this
+machine: the scraper runs offline, so it never checks connectivity or downloads one.
+
+Usage:
+    python benchmarks/bench_scraper.py [--sizes 100 1000 10000] [--enrich-sample 100]
+                                       [--workers 1] [--archive .archive] [--json out.json]
+                                       [--chromedriver /path/to/chromedriver]
+
+Without --chromedriver the usual local locations, the webdriver-manager cache and the
+PATH are searched.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixture_site import FixtureSite
+from InstagramScraper import InstagramReelsScraper
+
+try:
+    import psutil  # Optional: includes the browser processes in the peak RSS
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+class PeakRssSampler:
+    """Samples the RSS of this process and its children (browsers, drivers) in the background"""
+    
+    def __init__(self, interval=0.2):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def _current_bytes(self):
+        if psutil is None:
+            if resource is None:
+                return 0
+            # ru_maxrss is kilobytes on Linux, bytes on macOS; Python process only
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak if sys.platform == 'darwin' else peak * 1024
+        
+        process = psutil.Process()
+        total = 0
+        for proc in [process] + process.children(recursive=True):
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+    
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_bytes = max(self.peak_bytes, self._current_bytes())
+            self._stop.wait(self.interval)
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        self.peak_bytes = max(self.peak_bytes, self._current_bytes())
+
+def round_trips(scraper):
+    """WebDriver round-trips recorded so far by the scraper's profiler"""
+    return scraper.profiler.report()['counters'].get('webdriver_round_trips', 0)
+
+def run_size(size, args):
+    """Benchmark discovery, grid extraction and enrichment for one grid size"""
+    result = {'reels': size}
+    with FixtureSite(reels=size, per_load=args.per_load, load_delay_ms=args.load_delay_ms,
+                     latency_ms=args.latency_ms, archive_dir=args.archive) as site:
+        scraper = InstagramReelsScraper(headless=not args.show_browser, base_url=site.base_url,
+                                        data_only=args.data_only, html_extraction=args.html_extraction,
+                                        offline=True, chromedriver_path=args.chromedriver)
+        try:
+            if not scraper.setup_driver():
+                raise RuntimeError("could not start Chrome")
+            
+            with PeakRssSampler() as sampler:
+                # Grid discovery: navigate, infinite scroll, incremental extraction
+                scraper.profiler.reset()
+                start = time.perf_counter()
+                reels = scraper.scrape_reels_by_count(
+                    site.user, target_posts=size, delay=args.delay, extract_captions=False,
+                    extract_likes_dates=False, max_scrolls=size // args.per_load + 10
+                )
+                elapsed = time.perf_counter() - start
+                trips = round_trips(scraper)
+                result['discovery'] = {
+                    'found': len(reels),
+                    'seconds': round(elapsed, 2),
+                    'reels_per_sec': round(len(reels) / elapsed, 1) if elapsed else 0.0,
+                    'round_trips_per_reel': round(trips / len(reels), 2) if reels else None,
+                }
+                
+                # One full extraction of the grid as loaded now
+                scraper.profiler.reset()
+                start = time.perf_counter()
+                grid = scraper._extract_view_counts_with_urls()
+                result['grid_extraction'] = {
+                    'reels': len(grid),
+                    'seconds': round(time.perf_counter() - start, 3),
+                    'round_trips': round_trips(scraper),
+                }
+                
+                # Enrichment of a sample of reel pages
+                sample = [dict(reel) for reel in reels[:args.enrich_sample]]
+                if sample:
+                    scraper.profiler.reset()
+                    start = time.perf_counter()
+                    scraper._enrich_reels(sample, True, True, workers=args.workers, politeness_interval=0)
+                    elapsed = time.perf_counter() - start
+                    trips = round_trips(scraper)
+                    enriched = sum(1 for reel in sample if reel.get('likes') not in (None, 'N/A'))
+                    result['enrichment'] = {
+                        'reels': len(sample),
+                        'with_likes': enriched,
+                        'seconds': round(elapsed, 2),
+                        'reels_per_sec': round(len(sample) / elapsed, 2) if elapsed else 0.0,
+                        'round_trips_per_reel': round(trips / len(sample), 2),
+                    }
+            
+            result['peak_rss_mb'] = round(sampler.peak_bytes / 1024 / 1024, 1)
+            result['http_requests'] = site.requests
+        finally:
+            scraper.close()
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scraper against a local fixture site")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], help="Grid sizes to benchmark")
+    parser.add_argument('--enrich-sample', type=int, default=100, help="Reel pages visited per size")
+    parser.add_argument('--workers', type=int, default=1, help="Enrichment browsers")
+    parser.add_argument('--delay', type=int, default=3, help="Scroll delay passed to the scraper")
+    parser.add_argument('--per-load', type=int, default=12, help="Tiles appended per infinite-scroll load")
+    parser.add_argument('--load-delay-ms', type=int, default=150, help="Delay before appended tiles appear")
+    parser.add_argument('--latency-ms', type=int, default=0, help="Added latency per HTTP response")
+    parser.add_argument('--archive', default=None, help="Page archive with recorded reel pages to replay")
+    parser.add_argument('--data-only', action='store_true', help="Benchmark data-only browsing")
+    parser.add_argument('--html-extraction', action='store_true', help="Parse reel pages from their source in Python")
+    parser.add_argument('--show-browser', action='store_true', help="Do not run headless")
+    parser.add_argument('--chromedriver', default=None, help="ChromeDriver executable (default: search local paths)")
+    parser.add_argument('--json', default=None, help="Also write the results to this JSON file")
+    args = parser.parse_args()
+    
+    logging.disable(logging.WARNING)
+    results = []
+    for size in args.sizes:
+        print(f"Benchmarking {size} reels...", flush=True)
+        results.append(run_size(size, args))
+    
+    print()
+    print(f"{'reels':>7}{'found':>8}{'disc r/s':>10}{'rt/reel':>9}{'grid s':>8}"
+          f"{'enrich r/s':>12}{'rt/reel':>9}{'peak MB':>9}")
+    for result in results:
+        discovery = result['discovery']
+        enrichment = result.get('enrichment', {})
+        print(f"{result['reels']:>7}{discovery['found']:>8}{discovery['reels_per_sec']:>10}"
+              f"{discovery['round_trips_per_reel'] or 0:>9}{result['grid_extraction']['seconds']:>8}"
+              f"{enrichment.get('reels_per_sec', 0):>12}{enrichment.get('round_trips_per_reel', 0):>9}"
+              f"{result['peak_rss_mb']:>9}")
+    if psutil is None:
+        print("peak MB covers this Python process only (install psutil to include the browsers)")
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
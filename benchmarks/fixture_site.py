@@ -0,0 +1,293 @@
+"""
+Local fixture site imitating Instagram's reels grid and reel pages for offline benchmarks
+
+/<user>/reels/ serves a grid that appends tiles with JavaScript whenever the page is
+scrolled to the bottom (infinite scroll). /<user>/reel/<id>/ and /reel/<id>/ serve reel
+pages with a caption, likes, a time[datetime] element and og:description. Reel pages can
+also be replayed from a page archive recorded with InstagramPageArchive; those reels come
+first on the grid.
+
+Usage:
+    python benchmarks/fixture_site.py [--reels 1000] [--port 8800] [--archive .archive]
+"""
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from InstagramPageArchive import PageArchive
+from InstagramReelCache import ReelDetailCache
+
+CAPTION_WORDS = [
+    'Sunny', 'vibes', 'at', 'the', 'beach', 'today', 'new', 'collection', 'drop', 'behind', 'the',
+    'scenes', 'with', 'our', 'team', 'weekend', 'promo', 'only', 'in', 'stores', 'now',
+]
+EMOJIS = ['🌊', '🔥', '✨', '🎉', '💙', '📣']
+
+GRID_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>@{user} • Reels</title>
+<style>
+body {{ margin: 0; font-family: sans-serif; }}
+#grid {{ display: grid; grid-template-columns: repeat(4, 1fr); gap: 4px; max-width: 960px; margin: 0 auto; }}
+.tile {{ height: 320px; background: #ddd; position: relative; }}
+.tile a {{ display: block; height: 100%; }}
+</style></head>
+<body><main role="main"><article><header><h2>{user}</h2></header><div id="grid"></div></article></main>
+<script>
+const TOTAL = {total}, PER_LOAD = {per_load}, LOAD_DELAY_MS = {load_delay_ms}, USER = "{user}";
+const VIEWS = {views};
+const RECORDED = {recorded};
+const grid = document.getElementById('grid');
+let loaded = 0, loading = false;
+
+function tile(index) {{
+    const outer = document.createElement('div');
+    outer.className = 'tile';
+    outer.innerHTML = '<a href="/' + USER + '/reel/' + shortcode(index) + '/"><div>' +
+        '<div style="position: absolute; bottom: 8px; left: 8px"><span>' + VIEWS[index % VIEWS.length] + '</span></div>' +
+        '</div></a>';
+    return outer;
+}}
+
+function shortcode(index) {{
+    return index < RECORDED.length ? RECORDED[index] : 'FX' + String(index).padStart(7, '0');
+}}
+
+function loadMore() {{
+    const end = Math.min(TOTAL, loaded + PER_LOAD);
+    const fragment = document.createDocumentFragment();
+    for (; loaded < end; loaded++) fragment.appendChild(tile(loaded));
+    grid.appendChild(fragment);
+}}
+
+window.addEventListener('scroll', () => {{
+    if (loading || loaded >= TOTAL) return;
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 400) {{
+        loading = true;
+        setTimeout(() => {{ loadMore(); loading = false; }}, LOAD_DELAY_MS);
+    }}
+}});
+
+loadMore();
+</script></body></html>
+"""
+
+REEL_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{user} on Instagram</title>
+<meta property="og:description" content="{likes} likes, {comments} comments - {user} on {date_long}: {caption_attr}">
+</head>
+<body><main role="main"><article>
+<header><a href="/{user}/">{user}</a></header>
+<div><div role="button">Follow</div><div><h1 dir="auto">{caption}</h1></div></div>
+<section><a href="/reel/{shortcode}/liked_by/"><span>{likes}</span> likes</a></section>
+<div><a href="/reel/{shortcode}/"><time datetime="{datetime}" title="{date_short}">{relative}</time></a></div>
+</article></main></body></html>
+"""
+
+def shortcode_for(index):
+    """Shortcode of the index-th synthetic reel (same as the grid's JavaScript)"""
+    return f"FX{index:07d}"
+
+def index_for(shortcode):
+    """Index of a synthetic reel from its shortcode, or None"""
+    match = re.fullmatch(r'FX(\d{7})', shortcode or '')
+    return int(match.group(1)) if match else None
+
+def display_count(value):
+    """Format a count the way Instagram displays it (987, 12.3K, 1.2M)"""
+    if value >= 1_000_000:
+        return f"{value / 1_000_000:.1f}M".replace('.0M', 'M')
+    if value >= 10_000:
+        return f"{value / 1_000:.1f}K".replace('.0K', 'K')
+    return f"{value:,}"
+
+def _number(seed, low, high):
+    """Deterministic pseudo-random integer in [low, high] for a seed string"""
+    digest = int(hashlib.sha256(seed.encode('utf-8')).hexdigest()[:12], 16)
+    return low + digest % (high - low + 1)
+
+def synthetic_views(count=97):
+    """View count labels cycled through by the grid"""
+    return [display_count(_number(f"views-{i}", 300, 3_000_000)) for i in range(count)]
+
+def synthetic_reel_page(user, shortcode, now=None):
+    """
+    Render the page of one synthetic reel
+    
+    Returns:
+        str: HTML of the reel page
+    """
+    now = now or datetime.now(timezone.utc)
+    index = index_for(shortcode) or 0
+    words = [CAPTION_WORDS[_number(f"{shortcode}-w{i}", 0, len(CAPTION_WORDS) - 1)] for i in range(12)]
+    caption = f"{' '.join(words).capitalize()} {EMOJIS[index % len(EMOJIS)]} #reel{index}"
+    posted = now - timedelta(hours=6 * index + 1)
+    days = (now - posted).days
+    
+    return REEL_PAGE.format(
+        user=user,
+        shortcode=shortcode,
+        caption=html.escape(caption),
+        caption_attr=html.escape(caption, quote=True),
+        likes=f"{_number(f'{shortcode}-likes', 3, 250_000):,}",
+        comments=_number(f"{shortcode}-comments", 0, 900),
+        datetime=posted.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+        date_long=posted.strftime('%B %d, %Y'),
+        date_short=posted.strftime('%b %d, %Y'),
+        relative=f"{days}d" if days else f"{max(1, (now - posted).seconds // 3600)}h",
+    )
+
+class FixtureSite:
+    """Threaded local HTTP server serving the fixture pages"""
+    
+    def __init__(self, reels=1000, user="fixture_user", port=0, per_load=12, load_delay_ms=150,
+                 latency_ms=0, archive_dir=None):
+        """
+        Configure the site
+        
+        Args:
+            reels (int): Number of reels on the grid
+            user (str): Username of the fixture profile
+            port (int): Port to listen on (0 = any free port)
+            per_load (int): Tiles appended per infinite-scroll load
+            load_delay_ms (int): Delay before appended tiles appear, like a feed request
+            latency_ms (int): Added to every HTTP response, to imitate a remote server
+            archive_dir (str): Page archive whose recorded reel pages replace the synthetic ones
+        """
+        self.reels = reels
+        self.user = user
+        self.per_load = per_load
+        self.load_delay_ms = load_delay_ms
+        self.latency_ms = latency_ms
+        self.requests = 0
+        self._views = synthetic_views()
+        self._lock = threading.Lock()
+        
+        # Recorded reel pages by shortcode (latest capture wins)
+        self._archive = None
+        self._recorded = {}
+        if archive_dir:
+            self._archive = PageArchive(archive_dir)
+            for entry in self._archive.latest_entries('reel'):
+                shortcode = ReelDetailCache.shortcode_from_url(entry['url'])
+                if shortcode:
+                    self._recorded[shortcode] = entry['sha256']
+        
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+    
+    @property
+    def base_url(self):
+        """Root URL of the site, e.g. http://127.0.0.1:8800"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def recorded_shortcodes(self):
+        """Shortcodes of the recorded reel pages"""
+        return list(self._recorded)
+    
+    def grid_page(self, user):
+        """HTML of the reels grid of a profile"""
+        return GRID_PAGE.format(user=html.escape(user), total=self.reels, per_load=self.per_load,
+                                load_delay_ms=self.load_delay_ms, views=json.dumps(self._views),
+                                recorded=json.dumps(self.recorded_shortcodes()))
+    
+    def reel_page(self, user, shortcode):
+        """HTML of a reel page (recorded if available), or None for unknown reels"""
+        if shortcode in self._recorded:
+            return self._archive.load(self._recorded[shortcode])
+        index = index_for(shortcode)
+        if index is None or index >= self.reels:
+            return None
+        return synthetic_reel_page(user, shortcode)
+    
+    def _handler_class(self):
+        site = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with site._lock:
+                    site.requests += 1
+                if site.latency_ms:
+                    time.sleep(site.latency_ms / 1000)
+                
+                path = self.path.split('?', 1)[0]
+                body = None
+                match = re.fullmatch(r'/([^/]+)/reels/?', path)
+                if match:
+                    body = site.grid_page(match.group(1))
+                else:
+                    match = re.fullmatch(r'/(?:([^/]+)/)?reels?/([A-Za-z0-9_-]+)/?', path)
+                    if match:
+                        body = site.reel_page(match.group(1) or site.user, match.group(2))
+                    elif path == '/':
+                        body = "<html><body><main role='main'>fixture site</main></body></html>"
+                
+                if body is None:
+                    self.send_error(404)
+                    return
+                
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output readable
+        
+        return Handler
+    
+    def start(self):
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop serving"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._archive:
+            self._archive.close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Instagram fixture site")
+    parser.add_argument('--reels', type=int, default=1000, help="Number of reels on the grid")
+    parser.add_argument('--port', type=int, default=8800, help="Port to listen on")
+    parser.add_argument('--user', default="fixture_user", help="Username of the fixture profile")
+    parser.add_argument('--archive', default=None, help="Page archive with recorded reel pages to serve")
+    parser.add_argument('--latency-ms', type=int, default=0, help="Added latency per response")
+    args = parser.parse_args()
+    
+    site = FixtureSite(reels=args.reels, user=args.user, port=args.port, latency_ms=args.latency_ms,
+                       archive_dir=args.archive)
+    print(f"Serving {args.reels} reels at {site.base_url}/{args.user}/reels/ (Ctrl+C to stop)")
+    if site.recorded_shortcodes():
+        print(f"Replaying {len(site.recorded_shortcodes())} recorded reel pages")
+    try:
+        site._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site.stop()
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import threading
-import json
 import os
 import sys
 from datetime import datetime
@@ -17,17 +16,17 @@ sys.path.append(parent_dir)
 
 # Import your existing modules - try different import patterns
 try:
-    from InstagramScraper import InstagramReelsScraper
+    from InstagramScraper import InstagramReelsScraper, DEFAULT_COOKIE_JAR
     from InstagramDataConverter import InstagramDataConverter
 except ImportError:
     try:
-        from Instagram_Reels_Scraper.InstagramScraper import InstagramReelsScraper
+        from Instagram_Reels_Scraper.InstagramScraper import InstagramReelsScraper, DEFAULT_COOKIE_JAR
         from Instagram_Reels_Scraper.InstagramDataConverter import InstagramDataConverter
     except ImportError:
         try:
             # If running from parent directory
             sys.path.append(os.path.join(parent_dir, 'Scraper'))
-            from InstagramScraper import InstagramReelsScraper
+            from InstagramScraper import InstagramReelsScraper, DEFAULT_COOKIE_JAR
             from InstagramDataConverter import InstagramDataConverter
         except ImportError as e:
             print(f"Error importing modules: {e}")
@@ -291,7 +290,22 @@ class InstagramScraperGUI:
         self.delay_var = tk.IntVar(value=3)
         delay_spinbox = ttk.Spinbox(settings_row2, from_=1, to=10, textvariable=self.delay_var, width=6)
         delay_spinbox.pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Label(settings_row2, text="sec", font=('Arial', 9), foreground='gray').pack(side=tk.LEFT)
+        ttk.Label(settings_row2, text="sec", font=('Arial', 9), foreground='gray').pack(side=tk.LEFT, padx=(0, 20))
+        
+        # Parallel detail workers setting
+        ttk.Label(settings_row2, text="Detail workers:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=(0, 5))
+        self.enrich_workers_var = tk.IntVar(value=1)
+        workers_spinbox = ttk.Spinbox(settings_row2, from_=1, to=8, textvariable=self.enrich_workers_var, width=6)
+        workers_spinbox.pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Label(settings_row2, text="browsers", font=('Arial', 9), foreground='gray').pack(side=tk.LEFT, padx=(0, 20))
+        
+        self.remember_login_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(settings_row2, text="Remember login", 
+                       variable=self.remember_login_var).pack(side=tk.LEFT, padx=(0, 20))
+        
+        self.data_only_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(settings_row2, text="Data-only browsing", 
+                       variable=self.data_only_var).pack(side=tk.LEFT)
         
         # Third row of settings - Checkboxes
         settings_row3 = ttk.Frame(settings_frame)
@@ -307,7 +321,19 @@ class InstagramScraperGUI:
         
         self.extract_likes_dates_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(settings_row3, text="Extract likes & dates", 
-                       variable=self.extract_likes_dates_var).pack(side=tk.LEFT)
+                       variable=self.extract_likes_dates_var).pack(side=tk.LEFT, padx=(0, 20))
+        
+        self.resume_checkpoint_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(settings_row3, text="Resume from checkpoint", 
+                       variable=self.resume_checkpoint_var).pack(side=tk.LEFT, padx=(0, 20))
+        
+        self.use_detail_cache_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(settings_row3, text="Reuse cached details", 
+                       variable=self.use_detail_cache_var).pack(side=tk.LEFT, padx=(0, 20))
+        
+        self.archive_pages_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(settings_row3, text="Archive page sources", 
+                       variable=self.archive_pages_var).pack(side=tk.LEFT)
         
         # Fourth row - Auto-convert options
         settings_row4 = ttk.Frame(settings_frame)
@@ -373,6 +399,12 @@ class InstagramScraperGUI:
         self.export_csv_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(format_frame, text="CSV", variable=self.export_csv_var).pack(side="left", padx=5)
         
+        self.export_parquet_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(format_frame, text="Parquet", variable=self.export_parquet_var).pack(side="left", padx=5)
+        
+        self.export_jsonl_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(format_frame, text="JSONL stream (saved while scraping)", variable=self.export_jsonl_var).pack(side="left", padx=5)
+        
         # Buttons Section - Better organized
         buttons_frame = ttk.LabelFrame(main_frame, text="🎛️ Controls", padding="12")
         buttons_frame.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
@@ -567,20 +599,24 @@ class InstagramScraperGUI:
             json_files = []
             excel_files = []
             csv_files = []
+            columnar_files = []
             
             for file in os.listdir(output_dir):
                 full_path = os.path.join(output_dir, file)
                 if os.path.isfile(full_path):
-                    if file.lower().endswith('.json') and 'instagram' in file.lower():
+                    # Only scrape results; timing reports are JSON files too
+                    if file.lower().endswith(('.json', '.jsonl')) and file.lower().startswith('instagram_reels_data_'):
                         json_files.append(file)
                     elif file.lower().endswith('.xlsx') and 'instagram' in file.lower():
                         excel_files.append(file)
                     elif file.lower().endswith('.csv') and 'instagram' in file.lower():
                         csv_files.append(file)
+                    elif file.lower().endswith(('.parquet', '.feather')) and 'instagram' in file.lower():
+                        columnar_files.append(file)
             
             # Sort files by modification time (newest first)
             all_files = []
-            for f in json_files + excel_files + csv_files:
+            for f in json_files + excel_files + csv_files + columnar_files:
                 full_path = os.path.join(output_dir, f)
                 if os.path.exists(full_path):
                     all_files.append((f, os.path.getmtime(full_path)))
@@ -609,7 +645,7 @@ class InstagramScraperGUI:
             latest_time = 0
             
             for file in os.listdir(output_dir):
-                if file.lower().endswith('.json') and 'instagram' in file.lower():
+                if file.lower().endswith(('.json', '.jsonl')) and file.lower().startswith('instagram_reels_data_'):
                     full_path = os.path.join(output_dir, file)
                     file_time = os.path.getmtime(full_path)
                     if file_time > latest_time:
@@ -626,13 +662,14 @@ class InstagramScraperGUI:
             # Convert with current settings
             output_excel = self.auto_convert_excel_var.get()
             output_csv = self.auto_convert_csv_var.get()
+            columnar_format = 'parquet' if self.export_parquet_var.get() else None
             
-            if not output_excel and not output_csv:
-                messagebox.showwarning("No Output Format", "Please select at least one output format (Excel or CSV).")
+            if not output_excel and not output_csv and not columnar_format:
+                messagebox.showwarning("No Output Format", "Please select at least one output format (Excel, CSV or Parquet).")
                 return
             
             # Start conversion in thread
-            thread = threading.Thread(target=self._convert_thread, args=(latest_json, output_excel, output_csv), daemon=True)
+            thread = threading.Thread(target=self._convert_thread, args=(latest_json, output_excel, output_csv, columnar_format), daemon=True)
             thread.start()
             
         except Exception as e:
@@ -647,8 +684,8 @@ class InstagramScraperGUI:
             json_file = filedialog.askopenfilename(
                 title="Select Instagram JSON file",
                 filetypes=[
-                    ("Instagram JSON files", "instagram_reels_data_*.json"),
-                    ("JSON files", "*.json"),
+                    ("Instagram JSON files", "instagram_reels_data_*.json instagram_reels_data_*.jsonl"),
+                    ("JSON files", "*.json *.jsonl"),
                     ("All files", "*.*")
                 ],
                 initialdir=self.output_dir_var.get()
@@ -662,13 +699,14 @@ class InstagramScraperGUI:
             # Convert with current settings
             output_excel = self.auto_convert_excel_var.get()
             output_csv = self.auto_convert_csv_var.get()
+            columnar_format = 'parquet' if self.export_parquet_var.get() else None
             
-            if not output_excel and not output_csv:
-                messagebox.showwarning("No Output Format", "Please select at least one output format (Excel or CSV).")
+            if not output_excel and not output_csv and not columnar_format:
+                messagebox.showwarning("No Output Format", "Please select at least one output format (Excel, CSV or Parquet).")
                 return
             
             # Start conversion in thread
-            thread = threading.Thread(target=self._convert_thread, args=(json_file, output_excel, output_csv), daemon=True)
+            thread = threading.Thread(target=self._convert_thread, args=(json_file, output_excel, output_csv, columnar_format), daemon=True)
             thread.start()
             
         except Exception as e:
@@ -676,7 +714,7 @@ class InstagramScraperGUI:
             self.log_message(error_msg)
             messagebox.showerror("Error", error_msg)
     
-    def _convert_thread(self, json_file_path, output_excel, output_csv):
+    def _convert_thread(self, json_file_path, output_excel, output_csv, columnar_format=None):
         """Conversion thread function"""
         try:
             self.update_progress("Converting data...")
@@ -691,7 +729,8 @@ class InstagramScraperGUI:
                 output_excel=output_excel,
                 output_csv=output_csv,
                 output_dir=output_dir,
-                custom_filename=custom_filename
+                custom_filename=custom_filename,
+                columnar_format=columnar_format
             )
             
             if results:
@@ -751,7 +790,8 @@ class InstagramScraperGUI:
             return
         
         # Validate export formats
-        if not (self.export_json_var.get() or self.export_excel_var.get() or self.export_csv_var.get()):
+        if not (self.export_json_var.get() or self.export_excel_var.get() or self.export_csv_var.get()
+                or self.export_parquet_var.get() or self.export_jsonl_var.get()):
             messagebox.showerror("Error", "Please select at least one export format")
             return
             
@@ -779,6 +819,10 @@ class InstagramScraperGUI:
             export_formats.append("Excel")
         if self.export_csv_var.get():
             export_formats.append("CSV")
+        if self.export_parquet_var.get():
+            export_formats.append("Parquet")
+        if self.export_jsonl_var.get():
+            export_formats.append("JSONL stream")
         export_info = f"• Export formats: {', '.join(export_formats)}" if export_formats else "• Export formats: None"
         
         # Display different settings based on scraping method
@@ -795,6 +839,12 @@ class InstagramScraperGUI:
             f"{method_info}\n"
             f"• Extract captions: {'Yes' if self.extract_captions_var.get() else 'No'}\n"
             f"• Extract likes & dates: {'Yes' if self.extract_likes_dates_var.get() else 'No'}\n"
+            f"• Detail workers: {self.enrich_workers_var.get()}\n"
+            f"• Resume from checkpoint: {'Yes' if self.resume_checkpoint_var.get() else 'No'}\n"
+            f"• Reuse cached details: {'Yes' if self.use_detail_cache_var.get() else 'No'}\n"
+            f"• Archive page sources: {'Yes' if self.archive_pages_var.get() else 'No'}\n"
+            f"• Remember login: {'Yes' if self.remember_login_var.get() else 'No'}\n"
+            f"• Data-only browsing: {'Yes' if self.data_only_var.get() else 'No'}\n"
             f"• Headless mode: {'Yes' if self.headless_var.get() else 'No'}\n"
             f"• Debug mode: {'Yes' if self.debug_mode_var.get() else 'No'}\n\n"
             f"Output Settings:\n"
@@ -845,7 +895,29 @@ class InstagramScraperGUI:
             delay = self.delay_var.get()
             extract_captions = self.extract_captions_var.get()
             extract_likes_dates = self.extract_likes_dates_var.get()
+            enrich_workers = self.enrich_workers_var.get()
             headless = self.headless_var.get()
+            data_only = self.data_only_var.get()
+            
+            # Checkpoints live next to the output so an interrupted run can be resumed
+            checkpoint_dir = None
+            if self.resume_checkpoint_var.get():
+                checkpoint_dir = os.path.join(self.output_dir_var.get(), ".checkpoints")
+            
+            # Captions and dates of reels seen in earlier runs are read from this cache
+            detail_cache_path = None
+            if self.use_detail_cache_var.get():
+                detail_cache_path = os.path.join(self.output_dir_var.get(), ".cache", "reel_details.sqlite3")
+            
+            # Page sources kept here can be re-extracted later with InstagramPageArchive.py
+            archive_dir = None
+            if self.archive_pages_var.get():
+                archive_dir = os.path.join(self.output_dir_var.get(), ".archive")
+            
+            # The login cookies are saved here and restored on the next run
+            cookie_jar = None
+            if self.remember_login_var.get():
+                cookie_jar = DEFAULT_COOKIE_JAR
             
             # Get output settings
             output_dir = self.output_dir_var.get() if self.output_dir_var.get() != os.getcwd() else None
@@ -865,13 +937,19 @@ class InstagramScraperGUI:
             self.log_message(f"⏱️ Delay: {delay} seconds")
             self.log_message(f"📝 Extract captions: {'Yes' if extract_captions else 'No'}")
             self.log_message(f"📊 Extract likes & dates: {'Yes' if extract_likes_dates else 'No'}")
+            self.log_message(f"👥 Detail workers: {enrich_workers}")
+            self.log_message(f"♻️ Checkpoint: {checkpoint_dir or 'Disabled'}")
+            self.log_message(f"🗄️ Detail cache: {detail_cache_path or 'Disabled'}")
+            self.log_message(f"🗃️ Page archive: {archive_dir or 'Disabled'}")
+            self.log_message(f"🍪 Remember login: {'Yes' if cookie_jar else 'No'}")
+            self.log_message(f"🪶 Data-only browsing: {'Yes' if data_only else 'No'}")
             self.log_message(f"👻 Headless mode: {'Yes' if headless else 'No'}")
             self.log_message(f"📁 Output directory: {output_dir or 'Current directory'}")
             if custom_filename:
                 self.log_message(f"📝 Custom filename: {custom_filename}")
             
             # Initialize scraper
-            self.scraper = InstagramReelsScraper(headless=headless)
+            self.scraper = InstagramReelsScraper(headless=headless, cookie_jar=cookie_jar, data_only=data_only)
             
             # All the print statements from InstagramScraper will now appear in the GUI log
             self.update_progress("Setting up Chrome driver...")
@@ -882,13 +960,30 @@ class InstagramScraperGUI:
             
             # Login process
             self.update_progress("Waiting for login...")
-            self.log_message("🔐 Please complete login in the browser...")
+            self.log_message("🔐 Restoring the saved session, or please complete login in the browser...")
             
-            if not self.scraper.manual_login():
+            if not self.scraper.ensure_login():
                 self.log_message("❌ Login failed or timed out")
                 self._scraping_finished()
                 return
             
+            if detail_cache_path:
+                self.scraper.open_detail_cache(detail_cache_path)
+            
+            if archive_dir:
+                self.scraper.open_page_archive(archive_dir)
+            
+            # Stream finished reels to a JSONL file so a crash does not lose them
+            if self.export_jsonl_var.get():
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                if custom_filename:
+                    jsonl_filename = f"{custom_filename}_{timestamp}.jsonl"
+                else:
+                    jsonl_filename = f"instagram_reels_data_{target_username}_{timestamp}.jsonl"
+                jsonl_filepath = os.path.join(output_dir, jsonl_filename) if output_dir else jsonl_filename
+                self.scraper.open_stream(jsonl_filepath)
+                self.log_message(f"💾 Streaming reels to: {jsonl_filepath}")
+            
             # Start scraping - all print output will be captured
             self.update_progress("Scraping reels...")
             self.log_message("🎬 Starting to scrape reels...")
@@ -901,7 +996,9 @@ class InstagramScraperGUI:
                     max_scrolls=scroll_count,
                     delay=delay,
                     extract_captions=extract_captions,
-                    extract_likes_dates=extract_likes_dates
+                    extract_likes_dates=extract_likes_dates,
+                    enrich_workers=enrich_workers,
+                    checkpoint_dir=checkpoint_dir
                 )
             else:
                 # Posts count-based scraping
@@ -910,7 +1007,9 @@ class InstagramScraperGUI:
                     target_posts=target_posts,
                     delay=delay,
                     extract_captions=extract_captions,
-                    extract_likes_dates=extract_likes_dates
+                    extract_likes_dates=extract_likes_dates,
+                    enrich_workers=enrich_workers,
+                    checkpoint_dir=checkpoint_dir
                 )
             
             if results:
@@ -924,21 +1023,15 @@ class InstagramScraperGUI:
                     else:
                         json_filename = f"instagram_reels_data_{target_username}_{timestamp}.json"
                     
-                    # Save with custom directory
-                    if output_dir:
-                        os.makedirs(output_dir, exist_ok=True)
-                        json_filepath = os.path.join(output_dir, json_filename)
-                    else:
-                        json_filepath = json_filename
-                    
-                    # Save results
-                    with open(json_filepath, 'w', encoding='utf-8') as f:
-                        json.dump(results, f, indent=2, ensure_ascii=False)
-                    self.log_message(f"💾 JSON saved: {json_filepath}")
+                    # Save results (timed as the run's save phase)
+                    json_filepath = self.scraper.save_results(results, json_filename, output_dir)
+                    if json_filepath:
+                        self.log_message(f"💾 JSON saved: {json_filepath}")
                 
                 # Auto-convert if enabled
                 if (self.export_excel_var.get() and self.auto_convert_excel_var.get()) or \
-                   (self.export_csv_var.get() and self.auto_convert_csv_var.get()):
+                   (self.export_csv_var.get() and self.auto_convert_csv_var.get()) or \
+                   self.export_parquet_var.get():
                     self.log_message("🔄 Auto-converting results...")
                     self.update_progress("Converting to Excel/CSV...")
                     
@@ -954,11 +1047,20 @@ class InstagramScraperGUI:
                             if csv_path:
                                 self.log_message(f"📄 CSV saved: {csv_path}")
                         
+                        if self.export_parquet_var.get():
+                            parquet_path = self.converter.convert_to_columnar(results, output_dir, custom_filename, 'parquet')
+                            if parquet_path:
+                                self.log_message(f"🧱 Parquet saved: {parquet_path}")
+                            else:
+                                self.log_message("⚠️ Parquet export failed (is pyarrow installed?)")
+                        
                         self.log_message("✅ Auto-conversion completed!")
                         
                     except Exception as e:
                         self.log_message(f"⚠️ Auto-conversion error: {e}")
                 
+                self._save_timing_report(target_username, output_dir)
+                
                 # Display summary
                 self.log_message("📊 Results Summary:")
                 total_views = 0
@@ -1005,6 +1107,7 @@ class InstagramScraperGUI:
                 self.show_completion_dialog(output_location, len(results), target_username)
                 
             else:
+                self._save_timing_report(target_username, output_dir)
                 self.log_message("❌ No reels found or scraping failed")
                 self.update_progress("❌ Scraping failed")
                 messagebox.showwarning(
@@ -1020,6 +1123,14 @@ class InstagramScraperGUI:
         finally:
             self._scraping_finished()
             
+    def _save_timing_report(self, target_username, output_dir):
+        """Save where the run's time went (startup, login, scraping and saving) next to the results"""
+        timing_filename = f"instagram_reels_timing_{target_username}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        timing_filepath = self.scraper.profiler.save_report(
+            os.path.join(output_dir, timing_filename) if output_dir else timing_filename)
+        if timing_filepath:
+            self.log_message(f"⏱️ Timing report saved: {timing_filepath}")
+    
     def _scraping_finished(self):
         """Clean up after scraping"""
         # Restore original stdout/stderr
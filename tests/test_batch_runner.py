@@ -0,0 +1,137 @@
+import json
+import os
+import types
+
+import pytest
+
+import InstagramBatchRunner
+from InstagramBatchRunner import BatchRunner, load_accounts, normalize_account
+from InstagramProfiler import RunProfiler
+
+
+class StubScraper:
+    """Stands in for a logged-in browser session; records the accounts it scrapes"""
+    
+    def __init__(self, scraped):
+        self.scraped = scraped
+        self.driver = types.SimpleNamespace(current_url="https://www.instagram.com/")
+        self.profiler = RunProfiler()
+        self.detail_cache = None
+        self.page_archive = None
+    
+    def _reels(self, username, count):
+        self.scraped.append((username, count))
+        return [{'url': f"https://www.instagram.com/{username}/reel/R{i}/", 'views': "1K"} for i in range(count)]
+    
+    def scrape_reels_by_count(self, username, target_posts=20, **kwargs):
+        return self._reels(username, target_posts)
+    
+    def scrape_reels_views(self, username, max_scrolls=5, **kwargs):
+        return self._reels(username, max_scrolls)
+    
+    def save_results(self, results, filename, output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+        path = os.path.join(output_dir, filename)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(results, f)
+        return path
+    
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def scraped(monkeypatch):
+    scraped = []
+    monkeypatch.setattr(BatchRunner, '_start_session', lambda self, session_id: StubScraper(scraped))
+    return scraped
+
+
+def read_index(output_dir):
+    with open(os.path.join(output_dir, "batch_index.json"), encoding='utf-8') as f:
+        return json.load(f)['accounts']
+
+
+def test_text_file_settings_and_comments(tmp_path):
+    path = tmp_path / "accounts.txt"
+    path.write_text("# Banks\n@bankmandiri posts=50 priority=2\n\nbca  # defaults\nbri scrolls=3 note=weekly\n",
+                    encoding='utf-8')
+    
+    assert load_accounts(str(path)) == [
+        {'username': "bankmandiri", 'posts': 50, 'priority': 2},
+        {'username': "bca"},
+        {'username': "bri", 'scrolls': 3, 'note': "weekly"},
+    ]
+
+
+def test_json_list_of_usernames_and_objects(tmp_path):
+    path = tmp_path / "accounts.json"
+    path.write_text(json.dumps(["bca", {"username": "@bri", "posts": "10", "priority": 1}]), encoding='utf-8')
+    
+    assert load_accounts(str(path)) == [
+        {'username': "bca"},
+        {'username': "bri", 'posts': 10, 'priority': 1},
+    ]
+
+
+@pytest.mark.parametrize("content", ["bca priority=high\n", "bca posts=1.5\n"])
+def test_non_numeric_settings_are_rejected(tmp_path, content):
+    path = tmp_path / "accounts.txt"
+    path.write_text(content, encoding='utf-8')
+    
+    with pytest.raises(ValueError, match="line 1"):
+        load_accounts(str(path))
+
+
+def test_accounts_need_a_username():
+    with pytest.raises(ValueError):
+        normalize_account({'posts': 5})
+    with pytest.raises(ValueError):
+        BatchRunner([{'username': "bca", 'priority': "high"}])
+
+
+def test_accounts_run_by_priority_then_in_order(tmp_path, scraped):
+    accounts = ["first", {'username': "urgent", 'priority': 5}, "second", {'username': "soon", 'priority': 1}]
+    runner = BatchRunner(accounts, output_dir=str(tmp_path), target_posts=2, account_delay=0)
+    
+    index = runner.run()
+    
+    assert [username for username, _ in scraped] == ["urgent", "soon", "first", "second"]
+    assert {result['status'] for result in index.values()} == {'done'}
+    assert os.path.exists(index['urgent']['output'])
+    assert os.path.exists(index['urgent']['timing_report'])
+
+
+def test_per_account_posts_and_scrolls(tmp_path, scraped):
+    accounts = [{'username': "a", 'posts': 3}, {'username': "b", 'scrolls': 1}, "c"]
+    BatchRunner(accounts, output_dir=str(tmp_path), target_posts=2, account_delay=0).run()
+    
+    assert scraped == [("a", 3), ("b", 1), ("c", 2)]
+
+
+def test_done_accounts_are_skipped_on_the_next_run(tmp_path, scraped):
+    BatchRunner(["a", "b"], output_dir=str(tmp_path), target_posts=1, account_delay=0).run()
+    scraped.clear()
+    
+    BatchRunner(["a", "b", "c"], output_dir=str(tmp_path), target_posts=1, account_delay=0).run()
+    assert [username for username, _ in scraped] == ["c"]
+    
+    scraped.clear()
+    BatchRunner(["a"], output_dir=str(tmp_path), target_posts=1, account_delay=0).run(skip_done=False)
+    assert [username for username, _ in scraped] == ["a"]
+    assert set(read_index(str(tmp_path))) == {"a", "b", "c"}
+
+
+def test_index_rewrite_is_atomic(tmp_path, scraped, monkeypatch):
+    BatchRunner(["a"], output_dir=str(tmp_path), target_posts=1, account_delay=0).run()
+    before = read_index(str(tmp_path))
+    
+    def interrupted_dump(obj, f, **kwargs):
+        f.write('{"updated_at": "')
+        raise OSError("disk full")
+    monkeypatch.setattr(InstagramBatchRunner.json, 'dump', interrupted_dump)
+    
+    BatchRunner(["b"], output_dir=str(tmp_path), target_posts=1, account_delay=0)._record("b", {'status': 'running'})
+    
+    # The half-written state stays in the temporary file; the index keeps the last complete state
+    assert read_index(str(tmp_path)) == before
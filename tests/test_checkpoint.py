@@ -0,0 +1,68 @@
+from InstagramCheckpoint import ScrapeCheckpoint
+from InstagramScraper import InstagramReelsScraper, ReelIndex
+
+URL_A = "https://www.instagram.com/acct/reel/AAA/"
+URL_B = "https://www.instagram.com/acct/reel/BBB/"
+
+
+def enriched(url, views):
+    return {
+        'url': url, 'views': views, 'caption': f"caption of {url}", 'likes': "1,234",
+        'post_date_raw': "2025-07-01T10:00:00.000Z", 'post_date': "01 July 2025",
+    }
+
+
+def save_interrupted_run(checkpoint_dir):
+    """A run that discovered two reels and enriched both before it was interrupted"""
+    checkpoint = ScrapeCheckpoint(checkpoint_dir, "acct")
+    reels = [enriched(URL_A, "900"), enriched(URL_B, "2K")]
+    checkpoint.update_discovery(reels, scroll_depth=0)
+    for reel in reels:
+        checkpoint.mark_finished(reel)
+    checkpoint.save(force=True)
+
+
+def test_checkpoint_round_trip(tmp_path):
+    save_interrupted_run(str(tmp_path))
+    
+    checkpoint = ScrapeCheckpoint(str(tmp_path), "acct")
+    assert checkpoint.load()
+    assert [reel['url'] for reel in checkpoint.reels] == [URL_A, URL_B]
+    assert checkpoint.is_finished(URL_A) and checkpoint.is_finished(URL_B)
+    
+    checkpoint.clear()
+    assert not ScrapeCheckpoint(str(tmp_path), "acct").load()
+
+
+def test_resume_keeps_details_of_reels_seen_in_first_capture(tmp_path, monkeypatch):
+    save_interrupted_run(str(tmp_path))
+    scraper = InstagramReelsScraper()
+    
+    def no_page_visits(*args, **kwargs):
+        raise AssertionError("finished reels must not be visited again")
+    monkeypatch.setattr(scraper, '_extract_reel_details_from_url', no_page_visits)
+    
+    # The first grid capture after the restart indexes reel A without its details
+    reels_data = ReelIndex([{'url': URL_A, 'views': "1K", 'caption': ""}])
+    
+    assert scraper._resume_from_checkpoint(str(tmp_path), "acct", reels_data, delay=0, max_scrolls=0) == 0
+    scraper._enrich_reels(reels_data, True, True)
+    scraper._finish_checkpoint(completed=True)
+    
+    reels = {reel['url']: reel for reel in reels_data}
+    assert reels[URL_A]['views'] == "1K"  # Fresh grid value wins
+    assert reels[URL_A]['caption'] == f"caption of {URL_A}"
+    assert reels[URL_A]['likes'] == "1,234"
+    assert reels[URL_A]['post_date'] == "01 July 2025"
+    assert reels[URL_B]['likes'] == "1,234"
+
+
+def test_reel_index_merge_only_fills_missing_fields():
+    index = ReelIndex([{'url': URL_A, 'views': "1K", 'caption': "", 'likes': "N/A"}])
+    
+    assert index.merge({'url': URL_A, 'views': "900", 'caption': "saved", 'likes': "12"})
+    assert not index.merge({'url': URL_B, 'views': "5"})
+    
+    reel = index.to_list()[0]
+    assert (reel['views'], reel['caption'], reel['likes']) == ("1K", "saved", "12")
+    assert len(index) == 1
@@ -0,0 +1,52 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from InstagramDataConverter import InstagramDataConverter
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def record(index, timestamp):
+    return {
+        'reel_index': index, 'views': "1.2K", 'likes': "1,234",
+        'url': f"https://www.instagram.com/acct/reel/R{index}/",
+        'post_date_raw': "2025-07-01T10:00:00.000Z", 'post_date': "01 July 2025",
+        'caption': "", 'timestamp': timestamp, 'selector_used': 'grid_search_main',
+        'position': {'row': 100, 'col': 200},
+    }
+
+
+def test_columnar_export_accepts_mixed_timezones(tmp_path):
+    records = [record(1, "2025-07-12T15:30:00"), record(2, "2025-07-12T15:30:00+02:00"), record(3, "")]
+    
+    path = InstagramDataConverter().save_to_columnar(records, "mixed", str(tmp_path))
+    
+    assert path is not None
+    scraped = pq.read_table(path).column('Timestamp_Scraped').to_pylist()
+    assert scraped == [datetime(2025, 7, 12, 15, 30), datetime(2025, 7, 12, 13, 30), None]
+
+
+def test_columnar_output_has_typed_columns(tmp_path):
+    batch_record = dict(record(1, "2025-07-12T15:30:00"), username="acct")
+    missing = dict(record(2, "2025-07-12T15:30:00"), views="N/A", post_date="N/A", post_date_raw="N/A")
+    
+    path = InstagramDataConverter().save_to_columnar([batch_record, missing], "typed", str(tmp_path))
+    
+    table = pq.read_table(path)
+    assert table.column('Views_Numeric').to_pylist() == [1200, None]
+    assert table.column('Post_Date').to_pylist() == [date(2025, 7, 1), None]
+    assert table.column('Posted_At').to_pylist()[0] == datetime(2025, 7, 1, 10, 0, tzinfo=timezone.utc)
+    # The second reel has no username field, so it comes from its URL
+    assert table.column('Username').to_pylist() == ["acct", "acct"]
+    assert table.column('Position_Row').to_pylist() == [100, 100]
+
+
+def test_feather_output(tmp_path):
+    feather = pytest.importorskip("pyarrow.feather")
+    records = [record(1, "2025-07-12T15:30:00"), record(2, "2025-07-12T15:30:00")]
+    
+    path = InstagramDataConverter().save_to_columnar(records, "reels", str(tmp_path), file_format='feather')
+    
+    assert path.endswith(".feather")
+    assert feather.read_table(path).column('Reel_Index').to_pylist() == [1, 2]
@@ -0,0 +1,112 @@
+import json
+import os
+import stat
+import sys
+import time
+
+import pytest
+
+from InstagramScraper import InstagramReelsScraper
+
+
+class CookieDriver:
+    """Fake driver holding the cookies of one browser"""
+    
+    def __init__(self, cookies=()):
+        self.cookies = [dict(cookie) for cookie in cookies]
+        self.visited = []
+        self.current_url = "about:blank"
+    
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+    
+    def get_cookies(self):
+        return [dict(cookie) for cookie in self.cookies]
+    
+    def get_cookie(self, name):
+        return next((cookie for cookie in self.cookies if cookie['name'] == name), None)
+    
+    def add_cookie(self, cookie):
+        self.cookies.append(dict(cookie))
+
+
+def session_cookies(expiry):
+    return [
+        {'name': "sessionid", 'value': "s3cr3t", 'domain': ".instagram.com", 'expiry': expiry},
+        {'name': "csrftoken", 'value': "token", 'domain': ".instagram.com"},
+    ]
+
+
+def scraper_with(driver, cookie_jar):
+    scraper = InstagramReelsScraper(cookie_jar=str(cookie_jar))
+    scraper.driver = driver
+    return scraper
+
+
+def no_manual_login(*args, **kwargs):
+    raise AssertionError("manual login must not be opened")
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="POSIX file modes")
+def test_saved_jar_is_private(tmp_path):
+    jar = tmp_path / "profile" / "cookies.json"
+    scraper = scraper_with(CookieDriver(session_cookies(time.time() + 3600)), jar)
+    
+    assert scraper.save_session_cookies()
+    
+    assert stat.S_IMODE(os.stat(jar).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(jar.parent).st_mode) == 0o700
+    assert not os.path.exists(f"{jar}.tmp")
+    with open(jar, encoding='utf-8') as f:
+        assert [cookie['name'] for cookie in json.load(f)['cookies']] == ["sessionid", "csrftoken"]
+
+
+def test_expired_cookies_are_dropped_on_load(tmp_path):
+    jar = tmp_path / "cookies.json"
+    scraper_with(CookieDriver(session_cookies(time.time() - 60)), jar).save_session_cookies()
+    
+    # The session cookie has expired; the one without an expiry lasts for the session
+    assert [cookie['name'] for cookie in scraper_with(CookieDriver(), jar)._load_cookie_jar()] == ["csrftoken"]
+
+
+def test_unreadable_or_missing_jar_loads_nothing(tmp_path):
+    jar = tmp_path / "cookies.json"
+    assert scraper_with(CookieDriver(), jar)._load_cookie_jar() == []
+    
+    jar.write_text('{"cookies": [', encoding='utf-8')
+    assert scraper_with(CookieDriver(), jar)._load_cookie_jar() == []
+
+
+def test_saved_session_is_restored_without_manual_login(tmp_path, monkeypatch):
+    jar = tmp_path / "cookies.json"
+    scraper_with(CookieDriver(session_cookies(time.time() + 3600)), jar).save_session_cookies()
+    driver = CookieDriver()
+    scraper = scraper_with(driver, jar)
+    monkeypatch.setattr(scraper, 'is_logged_in', lambda: driver.get_cookie('sessionid') is not None)
+    monkeypatch.setattr(scraper, 'manual_login', no_manual_login)
+    
+    assert scraper.ensure_login(allow_manual=False)
+    assert driver.visited == ["https://www.instagram.com/"]
+    assert driver.get_cookie('sessionid')['value'] == "s3cr3t"
+
+
+def test_unattended_login_fails_fast_without_a_session(tmp_path, monkeypatch):
+    driver = CookieDriver()
+    scraper = scraper_with(driver, tmp_path / "cookies.json")
+    monkeypatch.setattr(scraper, 'manual_login', no_manual_login)
+    
+    started = time.monotonic()
+    assert scraper.ensure_login(allow_manual=False) is False
+    assert time.monotonic() - started < 1
+    assert driver.visited == []
+
+
+def test_unattended_login_fails_fast_with_an_invalid_session(tmp_path, monkeypatch):
+    jar = tmp_path / "cookies.json"
+    scraper_with(CookieDriver(session_cookies(time.time() + 3600)), jar).save_session_cookies()
+    scraper = scraper_with(CookieDriver(), jar)
+    monkeypatch.setattr(scraper, 'is_logged_in', lambda: False)
+    monkeypatch.setattr(scraper, 'manual_login', no_manual_login)
+    
+    assert scraper.ensure_login(allow_manual=False) is False
@@ -0,0 +1,28 @@
+import pytest
+
+from InstagramCountParser import parse_count, parse_counts
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("987", 987),
+    ("3,400", 3400),
+    ("1.2K", 1200),
+    ("45.6k likes", 45600),
+    ("2M", 2_000_000),
+    ("1.5B", 1_500_000_000),
+    ("1 like", 1),
+    (".5K", 500),
+    ("N/A", 0),
+    ("", 0),
+    ("Follow", 0),
+    (None, 0),
+    (True, 0),
+    (float('nan'), 0),
+    (12, 12),
+])
+def test_parse_count(text, expected):
+    assert parse_count(text) == expected
+
+
+def test_parse_counts_keeps_order():
+    assert parse_counts(["1K", "N/A", "3"]) == [1000, 0, 3]
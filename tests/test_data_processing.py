@@ -0,0 +1,36 @@
+from InstagramDataConverter import InstagramDataConverter
+
+
+def reel(index, **fields):
+    record = {
+        'reel_index': index, 'views': "1.2K", 'likes': "1,234",
+        'url': f"https://www.instagram.com/acct/reel/R{index}/",
+        'caption': "", 'timestamp': "2025-07-12T15:30:00", 'selector_used': 'grid_search_main',
+        'position': {'row': 100 * index, 'col': 200},
+    }
+    record.update(fields)
+    return record
+
+
+def test_process_data_parses_counts_and_sorts_by_index():
+    df = InstagramDataConverter().process_data([reel(2, views="N/A", likes="2M"), reel(1), "not a record"])
+    
+    assert df['Reel_Index'].tolist() == [1, 2]
+    assert df['Views_Numeric'].tolist() == [1200, 0]
+    assert df['Likes_Numeric'].tolist() == [1234, 2_000_000]
+    assert df['Position_Row'].tolist() == [100, 200]
+
+
+def test_missing_keys_get_their_defaults():
+    df = InstagramDataConverter().process_data([{'reel_index': 1, 'url': "https://www.instagram.com/acct/reel/R1/"}])
+    
+    assert df.loc[0, 'Views_Raw'] == "N/A" and df.loc[0, 'Views_Numeric'] == 0
+    assert df.loc[0, 'Post_Date'] == "N/A"
+    assert df.loc[0, 'Caption'] == ""
+    assert 'Username' not in df.columns
+
+
+def test_batch_records_keep_their_username():
+    df = InstagramDataConverter().process_data([reel(1, username="acct")])
+    
+    assert list(df.columns[:2]) == ['Reel_Index', 'Username']
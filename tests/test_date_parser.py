@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from InstagramDateParser import RelativeDateParser
+
+NOW = datetime(2025, 7, 12, 15, 30)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2 hours ago", "12 July 2025"),
+    ("16 hours ago", "11 July 2025"),
+    ("3 days ago", "09 July 2025"),
+    ("1 week ago", "05 July 2025"),
+    ("5 mins ago", "12 July 2025"),
+    ("yesterday", "11 July 2025"),
+    ("Today", "12 July 2025"),
+    ("July 26", "26 July 2025"),
+    ("26 July 2024", "26 July 2024"),
+    ("Jul 4, 2023", "04 July 2023"),
+    ("N/A", "N/A"),
+    ("", "N/A"),
+    ("sometime", "sometime"),
+])
+def test_parse_relative_and_absolute_dates(text, expected):
+    assert RelativeDateParser(reference_time=NOW).parse(text) == expected
+
+
+def test_relative_dates_use_one_reference_time_per_parser():
+    parser = RelativeDateParser(reference_time=NOW)
+    
+    assert parser.parse_many(["1 day ago", "1 day ago", "2 days ago"]) == ["11 July 2025", "11 July 2025", "10 July 2025"]
+
+
+def test_iso_timestamps_are_shown_in_local_time():
+    posted_at = datetime(2024, 7, 26, 23, 45, tzinfo=timezone.utc)
+    
+    parsed = RelativeDateParser(reference_time=NOW).parse("2024-07-26T23:45:00.000Z")
+    
+    assert parsed == posted_at.astimezone().strftime('%d %B %Y')
+    assert parsed == RelativeDateParser.format_datetime(posted_at)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024-07-26T10:15:00.000Z", datetime(2024, 7, 26, 10, 15, tzinfo=timezone.utc)),
+    ("2024-07-26T12:15:00+02:00", datetime(2024, 7, 26, 10, 15, tzinfo=timezone.utc)),
+    ("2024-07-26T10:15:00", datetime(2024, 7, 26, 10, 15, tzinfo=timezone.utc)),
+    ("2024-13-40T10:15:00Z", None),
+    ("3d", None),
+    (None, None),
+])
+def test_parse_iso(value, expected):
+    parsed = RelativeDateParser.parse_iso(value)
+    
+    assert parsed == expected
+    assert parsed is None or parsed.tzinfo is not None
@@ -0,0 +1,63 @@
+import types
+
+import pytest
+
+import InstagramScraper
+from InstagramScraper import InstagramReelsScraper
+
+
+class FakeChrome:
+    def __init__(self, service=None, options=None):
+        self.service = service
+        self.options = options
+
+
+@pytest.fixture
+def chrome(monkeypatch):
+    """Replaces Chrome and every network path so setup_driver can run without a browser"""
+    started = []
+    
+    def start(service=None, options=None):
+        driver = FakeChrome(service, options)
+        started.append(driver)
+        return driver
+    
+    def no_network(*args, **kwargs):
+        raise AssertionError("offline setup went online")
+    
+    monkeypatch.setattr(InstagramScraper, 'webdriver', types.SimpleNamespace(Chrome=start))
+    monkeypatch.setattr(InstagramScraper, 'ChromeDriverManager', no_network)
+    monkeypatch.setattr(InstagramReelsScraper, 'check_internet_connectivity', no_network)
+    monkeypatch.setattr(InstagramReelsScraper, '_configure_driver', lambda self: None)
+    return started
+
+
+def test_offline_setup_uses_the_given_chromedriver(chrome, tmp_path):
+    driver_path = tmp_path / "chromedriver"
+    driver_path.write_text("")
+    scraper = InstagramReelsScraper(headless=True, chromedriver_path=str(driver_path))
+    
+    assert scraper.offline
+    assert scraper.setup_driver()
+    assert len(chrome) == 1
+    assert chrome[0].service.path == str(driver_path)
+
+
+def test_offline_setup_falls_back_to_the_path_chromedriver(chrome, monkeypatch):
+    monkeypatch.setattr(InstagramScraper.os.path, 'exists', lambda path: False)
+    scraper = InstagramReelsScraper(headless=True, offline=True)
+    
+    assert scraper.setup_driver()
+    assert chrome[-1].service is None
+
+
+def test_offline_setup_fails_without_any_chromedriver(monkeypatch):
+    def no_chrome(service=None, options=None):
+        raise RuntimeError("no chromedriver")
+    
+    monkeypatch.setattr(InstagramScraper, 'webdriver', types.SimpleNamespace(Chrome=no_chrome))
+    monkeypatch.setattr(InstagramReelsScraper, 'check_internet_connectivity',
+                        lambda self: pytest.fail("offline setup went online"))
+    monkeypatch.setattr(InstagramScraper.os.path, 'exists', lambda path: False)
+    
+    assert InstagramReelsScraper(headless=True, offline=True).setup_driver() is False
@@ -0,0 +1,153 @@
+import threading
+import time
+import types
+import urllib.request
+
+import pytest
+
+from fixture_site import FixtureSite, shortcode_for
+from InstagramScraper import TRANSFER_SIZE_SCRIPT, InstagramReelsScraper, PolitenessBudget
+
+SESSION_COOKIE = {'name': "sessionid", 'value': "abc"}
+
+
+class HttpDriver:
+    """WebDriver stand-in that loads pages over HTTP, enough for reel page visits without Chrome"""
+    
+    def __init__(self, cookies=()):
+        self.cookies = list(cookies)
+        self.visited = []
+        self.page_source = ""
+        self.current_window_handle = "main"
+        self.window_handles = ["main"]
+        self.switch_to = types.SimpleNamespace(window=self._switch)
+    
+    def _switch(self, handle):
+        self.current_window_handle = handle
+    
+    def execute_script(self, script, *args):
+        if "window.open" in script:
+            self.window_handles.append(f"tab{len(self.window_handles)}")
+            return None
+        if script == TRANSFER_SIZE_SCRIPT:
+            return {'bytes': len(self.page_source), 'requests': 1}
+        return True  # Readiness conditions: fixture pages are complete once loaded
+    
+    def execute_cdp_cmd(self, command, params):
+        return {}
+    
+    def get(self, url):
+        with urllib.request.urlopen(url) as response:
+            self.page_source = response.read().decode('utf-8')
+        self.visited.append(url)
+    
+    def find_element(self, *locator):
+        return object()
+    
+    def get_cookies(self):
+        return list(self.cookies)
+    
+    def add_cookie(self, cookie):
+        if 'name' not in cookie:
+            raise ValueError("invalid cookie")
+        self.cookies.append(cookie)
+    
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+    
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def site():
+    with FixtureSite(reels=12, user="acct", latency_ms=10) as site:
+        yield site
+
+
+@pytest.fixture
+def worker_drivers(monkeypatch):
+    """Drivers of the enrichment workers, which start an HttpDriver instead of Chrome"""
+    drivers = []
+    
+    def setup_driver(scraper):
+        scraper.driver = HttpDriver()
+        drivers.append(scraper.driver)
+        return True
+    
+    monkeypatch.setattr(InstagramReelsScraper, 'setup_driver', setup_driver)
+    return drivers
+
+
+def fixture_reels(site):
+    return [{'url': f"{site.base_url}/acct/reel/{shortcode_for(i)}/", 'views': "1K"} for i in range(site.reels)]
+
+
+def test_budget_paces_visits_across_threads():
+    budget = PolitenessBudget(0.05)
+    start = time.monotonic()
+    
+    threads = [threading.Thread(target=lambda: [budget.acquire() for _ in range(3)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    # 12 visits by 4 threads share one budget: 11 intervals between them
+    assert time.monotonic() - start >= 11 * 0.05
+
+
+def test_budget_first_visit_and_zero_interval_do_not_wait():
+    start = time.monotonic()
+    PolitenessBudget(10).acquire()
+    budget = PolitenessBudget(0)
+    for _ in range(100):
+        budget.acquire()
+    
+    assert time.monotonic() - start < 1
+
+
+def test_workers_drain_one_queue(site, worker_drivers):
+    scraper = InstagramReelsScraper(base_url=site.base_url, html_extraction=True)
+    scraper.driver = HttpDriver(cookies=[SESSION_COOKIE])
+    reels = fixture_reels(site)
+    
+    scraper._enrich_reels(reels, True, True, workers=3, politeness_interval=0.01)
+    
+    # Every reel page was visited exactly once, by the workers only
+    visits = [url for driver in worker_drivers for url in driver.visited if "/reel/" in url]
+    assert sorted(visits) == sorted(reel['url'] for reel in reels)
+    assert scraper.driver.visited == []
+    assert len(worker_drivers) == 3
+    assert sum(1 for driver in worker_drivers if driver.visited) > 1
+    
+    for index, reel in enumerate(reels):
+        assert f"#reel{index}" in reel['caption']
+        assert reel['likes'] != "N/A" and reel['post_date'] != "N/A"
+    
+    # Workers reuse the main session and report their page visits to the main scraper
+    assert all(SESSION_COOKIE in driver.cookies for driver in worker_drivers)
+    assert scraper.get_transfer_report()['pages'] == len(reels)
+
+
+def test_main_browser_finishes_when_workers_cannot_start(site, monkeypatch):
+    monkeypatch.setattr(InstagramReelsScraper, 'setup_driver', lambda scraper: False)
+    scraper = InstagramReelsScraper(base_url=site.base_url, html_extraction=True)
+    scraper.driver = HttpDriver()
+    reels = fixture_reels(site)[:4]
+    
+    scraper._enrich_reels(reels, False, True, workers=2, politeness_interval=0)
+    
+    assert scraper.driver.visited == [reel['url'] for reel in reels]
+    assert all(reel['likes'] != "N/A" for reel in reels)
+
+
+def test_restore_session_cookies_opens_the_site_first(site):
+    scraper = InstagramReelsScraper(base_url=site.base_url)
+    scraper.driver = HttpDriver()
+    
+    scraper._restore_session_cookies([SESSION_COOKIE, {'value': "no name"}], f"{site.base_url}/acct/reel/FX0000001/")
+    
+    # Cookies can only be set for the open domain; a rejected cookie does not stop the rest
+    assert scraper.driver.visited == [f"{site.base_url}/"]
+    assert scraper.driver.cookies == [SESSION_COOKIE]
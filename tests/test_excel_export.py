@@ -0,0 +1,46 @@
+from openpyxl import load_workbook
+
+from InstagramDataConverter import InstagramDataConverter
+
+
+def reel(index, **fields):
+    record = {
+        'reel_index': index, 'views': "1.2K", 'likes': "1,234",
+        'url': f"https://www.instagram.com/acct/reel/R{index}/",
+        'post_date_raw': "2025-07-01T10:00:00.000Z", 'post_date': "01 July 2025",
+        'caption': "", 'timestamp': "2025-07-12T15:30:00", 'selector_used': 'grid_search_main',
+        'position': {'row': 100 * index, 'col': 200},
+    }
+    record.update(fields)
+    return record
+
+
+def test_excel_output_values_widths_and_summary(tmp_path):
+    converter = InstagramDataConverter()
+    df = converter.process_data([reel(1, caption="x" * 80), reel(2, views="3M")])
+    
+    path = converter.save_to_excel(df, "reels", str(tmp_path))
+    
+    workbook = load_workbook(path)
+    sheet = workbook['Instagram_Reels_Data']
+    rows = list(sheet.values)
+    header = list(rows[0])
+    assert header == list(df.columns)
+    assert [row[header.index('Views_Numeric')] for row in rows[1:]] == [1200, 3_000_000]
+    
+    # Auto-fit widths, capped at 50 characters
+    widths = dict(zip(header, converter.excel_column_widths(df)))
+    assert widths['Caption'] == 50
+    assert widths['Views_Raw'] == len('Views_Raw') + 2
+    assert sheet.column_dimensions['A'].width == widths['Reel_Index']
+    
+    summary = dict(list(workbook['Summary'].values)[1:])
+    assert summary['Total Reels'] == 2
+    assert summary['Total Views'] == 3_001_200
+
+
+def test_excel_output_refuses_more_rows_than_a_sheet_holds(tmp_path, monkeypatch):
+    monkeypatch.setattr('InstagramDataConverter.EXCEL_MAX_ROWS', 2)
+    converter = InstagramDataConverter()
+    
+    assert converter.save_to_excel(converter.process_data([reel(1), reel(2)]), "reels", str(tmp_path)) is None
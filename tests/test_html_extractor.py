@@ -0,0 +1,131 @@
+from datetime import datetime, timezone
+
+from fixture_site import shortcode_for, synthetic_reel_page, synthetic_views
+import pytest
+
+from InstagramHtmlExtractor import (GRID_OVERLAY_SELECTORS, PAGE_SNAPSHOT_QUERIES, ReelExtractor,
+                                    extract_reel_details_from_html, extract_reels_from_grid_html, parse_html,
+                                    snapshot_from_html)
+
+NOW = datetime(2025, 7, 12, 15, 30, tzinfo=timezone.utc)
+REEL_URL = "https://www.instagram.com/acct/reel/FX0000004/"
+
+
+def grid_html(count):
+    """The fixture grid after its JavaScript appended count tiles"""
+    views = synthetic_views()
+    tiles = "".join(
+        f'<div class="tile"><a href="/acct/reel/{shortcode_for(i)}/"><div>'
+        f'<div style="position: absolute; bottom: 8px; left: 8px"><span>{views[i]}</span></div>'
+        f'</div></a></div>'
+        for i in range(count)
+    )
+    return f'<html><body><main role="main"><article><div id="grid">{tiles}</div></article></main></body></html>'
+
+
+def test_reel_page_details():
+    html = synthetic_reel_page("acct", "FX0000004", now=NOW)
+    
+    details = extract_reel_details_from_html(html, REEL_URL, reference_time=NOW.replace(tzinfo=None))
+    
+    assert "#reel4" in details['caption']
+    assert details['likes'] == "63,928"
+    assert details['post_date_raw'] == "2025-07-11T14:30:00.000Z"
+    assert details['post_date'] == datetime(2025, 7, 11, 14, 30, tzinfo=timezone.utc).astimezone().strftime('%d %B %Y')
+
+
+def test_reel_page_only_requested_fields():
+    html = synthetic_reel_page("acct", "FX0000004", now=NOW)
+    
+    details = extract_reel_details_from_html(html, REEL_URL, extract_caption=False)
+    
+    assert details['caption'] == ""
+    assert details['likes'] == "63,928"
+
+
+def test_post_datetime_is_a_timezone_aware_datetime():
+    extractor = ReelExtractor.from_snapshot(snapshot_from_html(synthetic_reel_page("acct", "FX0000004", now=NOW)))
+    
+    raw, posted_at = extractor.find_post_datetime()
+    
+    assert raw == "2025-07-11T14:30:00.000Z"
+    assert posted_at.tzinfo is not None
+    assert posted_at == datetime(2025, 7, 11, 14, 30, tzinfo=timezone.utc)
+
+
+def test_post_datetime_missing_or_not_iso():
+    for html in ("<main><time>1d</time></main>", "<main><time datetime='soon'>1d</time></main>"):
+        extractor = ReelExtractor.from_snapshot(snapshot_from_html(html))
+        assert extractor.find_post_datetime() == (None, None)
+
+
+def test_grid_urls_and_views_in_order():
+    reels = extract_reels_from_grid_html(grid_html(6))
+    
+    assert [reel['url'] for reel in reels] == [f"https://www.instagram.com/acct/reel/{shortcode_for(i)}/" for i in range(6)]
+    assert [reel['views'] for reel in reels] == synthetic_views()[:6]
+    assert [reel['reel_index'] for reel in reels] == [1, 2, 3, 4, 5, 6]
+    assert {reel['selector_used'] for reel in reels} == {'html_grid'}
+
+
+def test_grid_links_resolve_against_the_page_url():
+    reels = extract_reels_from_grid_html(grid_html(1), base_url="http://127.0.0.1:8800/acct/reels/")
+    
+    assert reels[0]['url'] == "http://127.0.0.1:8800/acct/reel/FX0000000/"
+
+
+def test_snapshot_matches_the_browser_on_the_fixture_reel_page():
+    html = synthetic_reel_page("acct", "FX0000004", now=NOW)
+    time_record = {'text': "1d", 'title': "Jul 11, 2025", 'datetime': "2025-07-11T14:30:00.000Z", 'content': None}
+    
+    snapshot = snapshot_from_html(html)
+    
+    # What PAGE_SNAPSHOT_SCRIPT returns for the same page in Chrome
+    expected = {
+        "h1": [{'text': snapshot["h1"][0]['text'], 'title': None, 'datetime': None, 'content': None}],
+        "meta[property='og:description']": [{'text': "", 'title': None, 'datetime': None,
+                                             'content': snapshot["meta[property='og:description']"][0]['content']}],
+        "a[href*='/liked_by/'] span": [{'text': "63,928", 'title': None, 'datetime': None, 'content': None,
+                                        'parent_text': "63,928 likes"}],
+        "time": [time_record],
+        "time[datetime]": [time_record],
+        "article time": [time_record],
+        "div time": [time_record],
+        "*[title]": [time_record],
+        "span": [{'text': "63,928", 'title': None, 'datetime': None, 'content': None}],
+    }
+    assert set(snapshot) == {query['key'] for query in PAGE_SNAPSHOT_QUERIES}
+    assert {key: records for key, records in snapshot.items() if records} == expected
+    assert snapshot["h1"][0]['text'].endswith("#reel4")
+    assert snapshot["meta[property='og:description']"][0]['content'].startswith("63,928 likes, ")
+
+
+def test_every_extractor_selector_is_supported():
+    document = parse_html(synthetic_reel_page("acct", "FX0000004", now=NOW))
+    
+    for selector in [query['css'] for query in PAGE_SNAPSHOT_QUERIES if 'css' in query] + GRID_OVERLAY_SELECTORS:
+        document.select(selector)
+
+
+@pytest.mark.parametrize("selector", [
+    "#caption", "span:first-child", "a:not(.x)", "h1, h2", "> span", "div >", "[title]span",
+    "a[href|='x']", "span[dir='auto' i]", "svg|a", "",
+])
+def test_unsupported_selectors_raise(selector):
+    with pytest.raises(ValueError):
+        parse_html("<main><span>1</span></main>").select(selector)
+
+
+def test_hidden_elements_have_no_text():
+    html = (
+        '<main><section><a href="/x/liked_by/"><span>12</span> likes'
+        '<span style="display: none">hidden</span><span hidden>also hidden</span></a></section>'
+        '<div style="DISPLAY:NONE"><time datetime="2025-07-11T14:30:00.000Z">1d</time></div></main>'
+    )
+    
+    snapshot = snapshot_from_html(html)
+    
+    assert snapshot["a[href*='/liked_by/'] span"][0]['parent_text'] == "12 likes"
+    assert [record['text'] for record in snapshot["span"]] == ["12", "", ""]
+    # Hidden elements keep their attributes, like in the browser
+    assert snapshot["time"] == [{'text': "", 'title': None, 'datetime': "2025-07-11T14:30:00.000Z", 'content': None}]
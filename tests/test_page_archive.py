@@ -0,0 +1,102 @@
+import json
+import os
+from datetime import datetime, timezone
+
+from fixture_site import shortcode_for, synthetic_reel_page, synthetic_views
+from InstagramPageArchive import PageArchive, reextract_archive
+
+NOW = datetime(2025, 7, 12, 15, 30, tzinfo=timezone.utc)
+GRID_URL = "https://www.instagram.com/acct/reels/"
+
+
+def grid_html(views):
+    """A loaded reels grid with one tile per view count label"""
+    tiles = "".join(
+        f'<div class="tile"><a href="/acct/reel/{shortcode_for(i)}/"><div>'
+        f'<div style="position: absolute; bottom: 8px; left: 8px"><span>{label}</span></div>'
+        f'</div></a></div>'
+        for i, label in enumerate(views)
+    )
+    return f'<html><body><main role="main"><article><div id="grid">{tiles}</div></article></main></body></html>'
+
+
+def set_captured_at(archive_dir, captured_at):
+    """Rewrite every index entry as if it had been captured at the given time"""
+    index_path = os.path.join(archive_dir, "index.jsonl")
+    with open(index_path, encoding='utf-8') as f:
+        entries = [json.loads(line) for line in f]
+    with open(index_path, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            entry['captured_at'] = captured_at.isoformat()
+            f.write(json.dumps(entry) + "\n")
+
+
+def test_duplicate_sources_are_stored_once(tmp_path):
+    page = synthetic_reel_page("acct", "FX0000001", now=NOW)
+    
+    with PageArchive(str(tmp_path)) as archive:
+        first = archive.store('reel', "https://www.instagram.com/reel/FX0000001/", page)
+        second = archive.store('reel', "https://www.instagram.com/reel/FX0000001/", page)
+    
+    assert first == second
+    assert archive.pages_stored == 2
+    assert archive.load(first) == page
+    objects = [name for _, _, files in os.walk(archive.objects_dir) for name in files]
+    assert objects == [f"{first}.html.gz"]
+    assert len(list(archive.iter_entries('reel'))) == 2
+    assert len(archive.latest_entries('reel')) == 1
+
+
+def test_index_reader_skips_a_partly_written_line(tmp_path):
+    with PageArchive(str(tmp_path)) as archive:
+        archive.store('grid', GRID_URL, grid_html(synthetic_views()[:2]))
+    with open(archive.index_path, 'a', encoding='utf-8') as f:
+        f.write('{"kind": "reel", "url": "https://www.instag')
+    
+    assert [entry['kind'] for entry in PageArchive(str(tmp_path)).iter_entries()] == ['grid']
+
+
+def test_reextract_joins_grid_views_with_reel_details(tmp_path):
+    views = synthetic_views()[:3]
+    with PageArchive(str(tmp_path)) as archive:
+        archive.store('grid', GRID_URL, grid_html(views))
+        # Reel pages are visited at /reel/<shortcode>/, the grid links to /acct/reel/<shortcode>/
+        archive.store('reel', "https://www.instagram.com/reel/FX0000001/",
+                      synthetic_reel_page("acct", "FX0000001", now=NOW))
+    
+    reels = reextract_archive(str(tmp_path), workers=1)
+    
+    assert [reel['url'] for reel in reels] == [f"https://www.instagram.com/acct/reel/{shortcode_for(i)}/" for i in range(3)]
+    assert [reel['views'] for reel in reels] == views
+    assert [reel['reel_index'] for reel in reels] == [1, 2, 3]
+    
+    enriched = reels[1]
+    assert "#reel1" in enriched['caption']
+    assert enriched['likes'] != "N/A"
+    assert enriched['post_date_raw'] == "2025-07-12T08:30:00.000Z"
+    assert enriched['post_date'] == datetime(2025, 7, 12, 8, 30, tzinfo=timezone.utc).astimezone().strftime('%d %B %Y')
+    assert 'archived_at' in enriched
+    assert reels[0]['likes'] == reels[0]['post_date'] == "N/A"
+
+
+def test_later_grid_captures_update_the_views(tmp_path):
+    with PageArchive(str(tmp_path)) as archive:
+        archive.store('grid', GRID_URL, grid_html(["1,200", "3,400"]))
+        archive.store('grid', GRID_URL, grid_html(["1,500"]))
+    
+    reels = reextract_archive(str(tmp_path), workers=1)
+    
+    assert [reel['views'] for reel in reels] == ["1,500", "3,400"]
+
+
+def test_relative_dates_resolve_against_the_capture_time(tmp_path):
+    page = "<html><body><main><article><time>3 days ago</time></article></main></body></html>"
+    with PageArchive(str(tmp_path)) as archive:
+        archive.store('reel', "https://www.instagram.com/reel/FX0000002/", page)
+    set_captured_at(str(tmp_path), datetime(2025, 7, 12, 15, 30))
+    
+    reel, = reextract_archive(str(tmp_path), workers=1)
+    
+    assert reel['views'] == "N/A"
+    assert reel['post_date_raw'] == "3 days ago"
+    assert reel['post_date'] == "09 July 2025"
@@ -0,0 +1,118 @@
+import types
+
+import InstagramReelCache
+from InstagramReelCache import ReelDetailCache
+from InstagramScraper import InstagramReelsScraper
+
+REEL_URL = "https://www.instagram.com/acct/reel/AAA/"
+CACHED = {'caption': "Sunset 🌅", 'likes': "1,234", 'post_date_raw': "2025-07-01T10:00:00.000Z", 'post_date': "01 July 2025"}
+
+
+def open_cache(tmp_path, monkeypatch, **kwargs):
+    """A cache whose clock starts at 1000 and is moved with clock[0]"""
+    clock = [1000.0]
+    monkeypatch.setattr(InstagramReelCache.time, 'time', lambda: clock[0])
+    return ReelDetailCache(str(tmp_path / "reels.sqlite3"), **kwargs), clock
+
+
+def test_fields_expire_after_their_own_ttl(tmp_path, monkeypatch):
+    cache, clock = open_cache(tmp_path, monkeypatch, field_ttls={'likes': 60})
+    cache.put(REEL_URL, CACHED)
+    
+    clock[0] += 59
+    assert cache.get(REEL_URL, CACHED) == CACHED
+    
+    # Likes are stale now; captions and dates never expire
+    clock[0] += 1
+    assert cache.get(REEL_URL, CACHED) == {field: value for field, value in CACHED.items() if field != 'likes'}
+    assert (cache.hits, cache.misses) == (1, 1)
+    
+    # Storing a new value makes it fresh again
+    cache.put(REEL_URL, {'likes': "2,000"})
+    assert cache.get(REEL_URL, ['likes']) == {'likes': "2,000"}
+    cache.close()
+
+
+def test_missing_values_are_not_cached(tmp_path, monkeypatch):
+    cache, _ = open_cache(tmp_path, monkeypatch)
+    cache.put(REEL_URL, {'likes': "N/A", 'post_date_raw': "", 'post_date': None, 'unknown_field': "x"})
+    
+    assert cache.get(REEL_URL, ['likes', 'post_date_raw', 'post_date', 'unknown_field']) == {}
+    cache.close()
+
+
+def test_empty_caption_is_cached(tmp_path, monkeypatch):
+    cache, _ = open_cache(tmp_path, monkeypatch)
+    cache.put(REEL_URL, {'caption': ""})
+    
+    assert cache.get(REEL_URL, ['caption']) == {'caption': ""}
+    cache.close()
+
+
+def test_reels_are_keyed_by_shortcode(tmp_path, monkeypatch):
+    cache, _ = open_cache(tmp_path, monkeypatch)
+    cache.put(REEL_URL, {'caption': CACHED['caption']})
+    
+    # Grid links include the profile, reel page URLs may not
+    assert cache.get("https://www.instagram.com/reel/AAA/?igsh=x", ['caption']) == {'caption': CACHED['caption']}
+    assert cache.get("https://www.instagram.com/acct/", ['caption']) == {}
+    cache.close()
+
+
+class FakeDriver:
+    """Just enough of a WebDriver to open a reel page that is always ready"""
+    
+    current_window_handle = "main"
+    window_handles = ["main", "reel"]
+    
+    def __init__(self):
+        self.visited = []
+        self.switch_to = types.SimpleNamespace(window=lambda handle: None)
+    
+    def execute_script(self, script, *args):
+        return None
+    
+    def get(self, url):
+        self.visited.append(url)
+    
+    def find_element(self, *locator):
+        return object()
+
+
+def test_only_expired_fields_are_extracted_again(tmp_path, monkeypatch):
+    cache = ReelDetailCache(str(tmp_path / "reels.sqlite3"), field_ttls={'likes': 0})
+    cache.put(REEL_URL, CACHED)
+    
+    scraper = InstagramReelsScraper()
+    scraper.driver = FakeDriver()
+    scraper.detail_cache = cache
+    extracted = []
+    monkeypatch.setattr(scraper, '_wait_for_conditions', lambda conditions, replaced_sleep: extracted.extend(conditions))
+    monkeypatch.setattr(scraper, '_find_caption', lambda url: extracted.append('caption'))
+    monkeypatch.setattr(scraper, '_find_post_date', lambda: extracted.append('post_date'))
+    monkeypatch.setattr(scraper, '_find_likes_count', lambda: "2,000")
+    
+    details = scraper._extract_reel_details_from_url(REEL_URL)
+    
+    # Only the expired likes count sent the browser to the page
+    assert scraper.driver.visited == [REEL_URL]
+    assert extracted == ['likes_anchor']
+    assert details['likes'] == "2,000"
+    assert details['caption'] == CACHED['caption'] and details['post_date'] == CACHED['post_date']
+    cache.close()
+
+
+def test_reel_without_caption_is_not_visited_again(tmp_path, monkeypatch):
+    cache = ReelDetailCache(str(tmp_path / "reels.sqlite3"))
+    scraper = InstagramReelsScraper()
+    scraper.driver = FakeDriver()
+    scraper.detail_cache = cache
+    monkeypatch.setattr(scraper, '_wait_for_conditions', lambda conditions, replaced_sleep: None)
+    monkeypatch.setattr(scraper, '_find_caption', lambda url: "")
+    
+    assert scraper._extract_reel_details_from_url(REEL_URL, extract_likes_dates=False)['caption'] == ""
+    details = scraper._extract_reel_details_from_url(REEL_URL, extract_likes_dates=False)
+    
+    assert scraper.driver.visited == [REEL_URL]
+    assert details['caption'] == "" and details['visited']
+    cache.close()
@@ -0,0 +1,45 @@
+from InstagramScraper import ReelIndex
+
+
+def reel(url, views):
+    return {'url': url, 'views': views}
+
+
+def test_reels_are_deduplicated_by_url_in_insertion_order():
+    index = ReelIndex()
+    
+    assert index.add(reel("https://www.instagram.com/acct/reel/B/", "2K"))
+    assert index.add(reel("https://www.instagram.com/acct/reel/A/", "900"))
+    assert not index.add(reel("https://www.instagram.com/acct/reel/B/", "2.1K"))
+    
+    assert [r['url'] for r in index] == ["https://www.instagram.com/acct/reel/B/", "https://www.instagram.com/acct/reel/A/"]
+    assert index.has_url("https://www.instagram.com/acct/reel/A/")
+    assert reel("https://www.instagram.com/acct/reel/B/", "") in index
+
+
+def test_reels_without_url_are_deduplicated_by_views():
+    index = ReelIndex([reel("https://www.instagram.com/acct/reel/A/", "900")])
+    
+    # Same views as an indexed reel: most likely the same tile without its link
+    assert not index.add(reel("", "900"))
+    assert index.add(reel("", "1.5M"))
+    assert not index.add(reel("", "1.5M"))
+    assert not index.add(reel("", ""))
+    assert len(index) == 2
+
+
+def test_trim_keeps_the_first_reels_and_forgets_trimmed_views():
+    index = ReelIndex(reel(f"https://www.instagram.com/acct/reel/R{i}/", f"{i}K") for i in range(5))
+    
+    index.trim(2)
+    
+    assert [r['views'] for r in index.to_list()] == ["0K", "1K"]
+    assert index.add(reel("", "4K"))
+    assert not index.add(reel("", "1K"))
+
+
+def test_extend_counts_new_reels():
+    index = ReelIndex()
+    reels = [reel("https://www.instagram.com/acct/reel/A/", "1K"), reel("https://www.instagram.com/acct/reel/A/", "1K")]
+    
+    assert index.extend(reels) == 1
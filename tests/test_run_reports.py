@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from InstagramScraper import InstagramReelsScraper
+
+
+@pytest.mark.parametrize("scrape", ["scrape_reels_views", "scrape_reels_by_count"])
+def test_each_scrape_starts_with_empty_reports(scrape):
+    scraper = InstagramReelsScraper()
+    scraper._record_wait('reel_page', 0.5, 3, True)
+    scraper._merge_transfer_report({"https://www.instagram.com/acct/reel/AAA/": {'bytes': 2048, 'requests': 3}})
+    
+    # Without a browser the scrape fails right after its setup and returns nothing
+    assert getattr(scraper, scrape)("acct", delay=0) == []
+    assert scraper.get_wait_report() == {}
+    assert scraper.get_transfer_report()['pages'] == 0
+
+
+def test_timing_report_covers_startup_scraping_and_saving(tmp_path):
+    scraper = InstagramReelsScraper()
+    with scraper.profiler.span('phase.setup_driver'):
+        pass
+    with scraper.profiler.span('phase.login'):
+        pass
+    
+    scraper.scrape_reels_views("acct", delay=0)
+    scraper.save_results([{'url': "https://www.instagram.com/acct/reel/AAA/"}], "reels.json", str(tmp_path))
+    path = scraper.profiler.save_report(str(tmp_path / "timing.json"))
+    
+    with open(path, encoding='utf-8') as f:
+        spans = json.load(f)['spans']
+    assert {'phase.setup_driver', 'phase.login', 'run.scrape_reels_views', 'phase.save'} <= set(spans)
+
+
+def test_transfer_report_aggregates_merged_worker_reports():
+    scraper = InstagramReelsScraper(data_only=True)
+    scraper._merge_transfer_report({
+        "https://www.instagram.com/acct/reel/AAA/": {'bytes': 1000, 'requests': 4},
+        "https://www.instagram.com/acct/reel/BBB/": {'bytes': 3000, 'requests': 6},
+    })
+    scraper._merge_transfer_report({
+        "https://www.instagram.com/acct/reel/CCC/": {'bytes': 5000, 'requests': 2},
+    })
+    
+    report = scraper.get_transfer_report()
+    
+    assert report['pages'] == 3
+    assert report['total_bytes'] == 9000
+    assert report['average_bytes'] == 3000
+    assert report['max_bytes'] == 5000
+    assert report['requests'] == 12
+    assert report['data_only'] is True
+    
+    # The report is a copy; changing it leaves the scraper's numbers alone
+    report['reels']["https://www.instagram.com/acct/reel/AAA/"]['bytes'] = 0
+    assert scraper.get_transfer_report()['total_bytes'] == 9000
+
+
+def test_empty_transfer_report():
+    report = InstagramReelsScraper().get_transfer_report()
+    
+    assert (report['pages'], report['total_bytes'], report['average_bytes'], report['max_bytes']) == (0, 0, 0.0, 0)
+
+
+@pytest.mark.parametrize("adaptive_wait, incremental, expected", [
+    (True, False, [('wait', 'grid_settle')]),
+    (True, True, []),
+    (False, False, [('sleep', 'grid_settle')]),
+    (False, True, [('sleep', 'grid_settle')]),
+])
+def test_grid_capture_settle_wait(monkeypatch, adaptive_wait, incremental, expected):
+    scraper = InstagramReelsScraper(adaptive_wait=adaptive_wait)
+    waits = []
+    monkeypatch.setattr(scraper, '_wait_for_conditions',
+                        lambda conditions, replaced_sleep: waits.extend(('wait', name) for name in conditions))
+    monkeypatch.setattr(scraper.profiler, 'sleep', lambda seconds, name: waits.append(('sleep', name)))
+    monkeypatch.setattr(scraper, '_extract_grid_snapshot',
+                        lambda incremental: [{'url': "https://www.instagram.com/acct/reel/AAA/", 'views': "1K"}])
+    
+    # The first capture has no scroll wait before it, so it waits for reel tiles itself
+    assert scraper._extract_view_counts_with_urls(incremental=incremental)
+    assert waits == expected
@@ -0,0 +1,58 @@
+import json
+
+from InstagramDataConverter import InstagramDataConverter
+from InstagramScraper import ReelStreamWriter
+
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_each_record_is_one_json_line(tmp_path):
+    path = str(tmp_path / "out" / "reels.jsonl")
+    
+    with ReelStreamWriter(path, flush_every=1, fsync_every=2) as writer:
+        writer.write({'url': "https://www.instagram.com/acct/reel/A/", 'caption': "Sunset 🌅"})
+        writer.write({'url': "https://www.instagram.com/acct/reel/B/", 'caption': ""})
+        
+        # Flushed records are readable while the run is still going
+        assert len(read_lines(path)) == 2
+    
+    assert writer.records_written == 2
+    assert read_lines(path)[0]['caption'] == "Sunset 🌅"
+
+
+def test_close_is_idempotent_and_later_writes_are_dropped(tmp_path):
+    path = str(tmp_path / "reels.jsonl")
+    writer = ReelStreamWriter(path)
+    writer.write({'url': "https://www.instagram.com/acct/reel/A/"})
+    
+    writer.close()
+    writer.close()
+    writer.write({'url': "https://www.instagram.com/acct/reel/B/"})
+    
+    assert writer.records_written == 1
+    assert [record['url'] for record in read_lines(path)] == ["https://www.instagram.com/acct/reel/A/"]
+
+
+def test_reopening_appends(tmp_path):
+    path = str(tmp_path / "reels.jsonl")
+    for url in ("https://www.instagram.com/acct/reel/A/", "https://www.instagram.com/acct/reel/B/"):
+        with ReelStreamWriter(path) as writer:
+            writer.write({'url': url})
+    
+    assert len(read_lines(path)) == 2
+
+
+def test_converter_reads_the_stream_lazily(tmp_path):
+    path = str(tmp_path / "instagram_reels_data_acct.jsonl")
+    with ReelStreamWriter(path) as writer:
+        for index in (1, 2):
+            writer.write({'reel_index': index, 'url': f"https://www.instagram.com/acct/reel/R{index}/", 'views': "1K"})
+    converter = InstagramDataConverter()
+    
+    data = converter.load_json_data(path, lazy=True)
+    
+    assert not isinstance(data, list)
+    assert converter.process_data(data)['Views_Numeric'].tolist() == [1000, 1000]